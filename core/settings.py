@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 from pathlib import Path
 import logging
+import os
 import datetime
 from decouple import config
 
@@ -31,16 +32,26 @@ DEBUG = True
 ALLOWED_HOSTS = ["*"]
 
 # Logger settings
+# ? Handlers are built by Django's setup from LOGGING, not at import; the log
+# ? file is only opened on its first record (delay)
 logger = logging.getLogger(__name__)
-syslog = logging.StreamHandler()
-formatter = logging.Formatter(
-    "INFO => AT: %(asctime)s API/FUNC: %(app_name)s MSG: %(message)s"
-)
-syslog.setFormatter(formatter)
-logger.addHandler(syslog)
-
-logging.basicConfig(filename="app.log")
-logger.setLevel(logging.DEBUG)
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "app": {
+            "format": "INFO => AT: %(asctime)s API/FUNC: %(app_name)s MSG: %(message)s"
+        },
+    },
+    "handlers": {
+        "console": {"class": "logging.StreamHandler", "formatter": "app"},
+        "file": {"class": "logging.FileHandler", "filename": "app.log", "delay": True},
+    },
+    "root": {"handlers": ["file"]},
+    "loggers": {
+        __name__: {"handlers": ["console"], "level": "DEBUG"},
+    },
+}
 
 # Application definition
 CUSTOM_APPS = [
@@ -61,7 +72,8 @@ THIRD_PARTY_APPS = [
     "drf_yasg",
 ]
 INSTALLED_APPS = [
-    "django.contrib.admin",
+    # ? django.contrib.admin, registering the custom app models on first use
+    "coreutils.utils.admin.admin_config.AutoRegisterAdminConfig",
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
@@ -143,6 +155,42 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# ? Password hashing
+# ? Stored hashes with a different iteration count are re-hashed on the next login
+PASSWORD_HASH_ITERATIONS = config("PASSWORD_HASH_ITERATIONS", default=1000000, cast=int)
+PASSWORD_HASHERS = [
+    "coreutils.utils.password_hashing.TunablePBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+# ? Concurrent hashes allowed and seconds a login/registration waits for a slot
+PASSWORD_HASH_MAX_CONCURRENCY = config(
+    "PASSWORD_HASH_MAX_CONCURRENCY", default=os.cpu_count() or 1, cast=int
+)
+PASSWORD_HASH_QUEUE_TIMEOUT = config(
+    "PASSWORD_HASH_QUEUE_TIMEOUT", default=5.0, cast=float
+)
+
+# ? Outgoing mail, EMAIL_CONNECTION is one of TLS (STARTTLS), SSL or PLAIN
+EMAIL_CONNECTION = config("EMAIL_CONNECTION", default="TLS")
+SMTP_SERVER = config("SMTP_SERVER", default="localhost")
+SMTP_PORT = config("SMTP_PORT", default=587, cast=int)
+SMTP_SENDER_EMAIL = config("SMTP_SENDER_EMAIL", default="")
+SMTP_PASSWORD = config("SMTP_PASSWORD", default="")
+SMTP_TIMEOUT = config("SMTP_TIMEOUT", default=30.0, cast=float)
+# ? Authenticated connections kept open per sender, and seconds an idle one is reused
+SMTP_POOL_SIZE = config("SMTP_POOL_SIZE", default=4, cast=int)
+SMTP_POOL_IDLE_TIMEOUT = config("SMTP_POOL_IDLE_TIMEOUT", default=60.0, cast=float)
+
+# ? Precomputed OpenAPI schema, regenerated on deploy with `generate_openapi_schema`
+OPENAPI_SCHEMA_DIRECTORY = config(
+    "OPENAPI_SCHEMA_DIRECTORY", default=str(BASE_DIR / "openapi")
+)
+SWAGGER_SETTINGS = {"SPEC_URL": ("schema-json", {"format": ".json"})}
+REDOC_SETTINGS = {"SPEC_URL": ("schema-json", {"format": ".json"})}
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
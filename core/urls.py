@@ -19,28 +19,25 @@ from django.contrib import admin
 from django.urls import path, include, re_path
 from rest_framework import permissions
 from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
+from coreutils.api.v1.openapi_schema.views import PrecomputedOpenAPISchemaView
+from coreutils.utils.openapi_schema import OPENAPI_INFO
 
+# ? The UIs only render the page; they load the spec from `schema-json`
+# ? (SPEC_URL in SWAGGER_SETTINGS / REDOC_SETTINGS), which is precomputed
 schema_view = get_schema_view(
-    openapi.Info(
-        title="Your Project API",
-        default_version="v1",
-        description="API documentation for Your Project",
-        terms_of_service="https://www.example.com/terms/",
-        contact=openapi.Contact(email="contact@example.com"),
-        license=openapi.License(name="BSD License"),
-    ),
+    OPENAPI_INFO,
     public=True,
     permission_classes=(permissions.AllowAny,),
 )
 
 swagger_urlpatterns = [
-    # Swagger UI
+    # Precomputed schema, written by `manage.py generate_openapi_schema`
     re_path(
         r"^swagger(?P<format>\.json|\.yaml)$",
-        schema_view.without_ui(cache_timeout=0),
+        PrecomputedOpenAPISchemaView.as_view(),
         name="schema-json",
     ),
+    # Swagger UI
     path(
         "swagger/",
         schema_view.with_ui("swagger", cache_timeout=0),
@@ -54,5 +51,6 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("userauth/", include("userauth.urls")),
     path("store/", include("store.urls")),
+    path("coreutils/", include("coreutils.urls")),
     *swagger_urlpatterns,
 ]
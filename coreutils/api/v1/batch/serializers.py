@@ -0,0 +1,18 @@
+from rest_framework import serializers
+from coreutils.utils.generics.serializers.mixins import CoreGenericSerializerMixin
+from coreutils.api.v1.utils.constants import BATCH_REQUEST_ALLOWED_METHODS
+from coreutils.api.v1.utils.handlers.batch_handler import BatchRequestHandler
+
+
+class BatchSubRequestSerializer(serializers.Serializer):
+    method = serializers.ChoiceField(choices=BATCH_REQUEST_ALLOWED_METHODS)
+    path = serializers.CharField()
+    params = serializers.DictField(required=False, default=dict)
+    body = serializers.JSONField(required=False, default=dict)
+
+
+class BatchRequestSerializer(CoreGenericSerializerMixin, serializers.Serializer):
+    handler_class = BatchRequestHandler
+    queryset = None
+    requests = BatchSubRequestSerializer(many=True, allow_empty=False)
+    atomic = serializers.BooleanField(default=False)
@@ -0,0 +1,38 @@
+from .serializers import BatchRequestSerializer
+from coreutils.utils.generics.views.generic_views import CoreGenericPostAPIView
+from rest_framework import generics, status
+from rest_framework.response import Response
+from coreutils.api.v1.utils.constants import (
+    BATCH_REQUEST_ROLLED_BACK_MESSAGE,
+    BATCH_REQUEST_SUCCESS_MESSAGE,
+)
+from typing import Dict, List, Union
+
+
+class BatchRequestAPIView(
+    CoreGenericPostAPIView,
+    generics.GenericAPIView,
+):
+    # authentication_classes = [CustomAuthentication]
+    # permission_classes = [permissions.IsAuthenticated]
+    success_message = BATCH_REQUEST_SUCCESS_MESSAGE
+
+    def get_serializer_class(self):
+        serializer_class = {"POST": BatchRequestSerializer}
+        return serializer_class.get(self.request.method)
+
+    def success_response(self, validated_data: Union[List, Dict]) -> Response:
+        """
+        Answers a rolled back atomic batch with 424 (Failed Dependency), so
+        clients that only read the status code do not take it for a success.
+        The sub-responses are returned as usual.
+        """
+        if isinstance(validated_data, dict) and validated_data.get("rolled_back"):
+            return Response(
+                {
+                    "message": BATCH_REQUEST_ROLLED_BACK_MESSAGE,
+                    "results": validated_data,
+                },
+                status=status.HTTP_424_FAILED_DEPENDENCY,
+            )
+        return super().success_response(validated_data=validated_data)
@@ -0,0 +1,32 @@
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.http import condition
+
+from coreutils.utils.openapi_schema import PrecomputedOpenAPISchema
+
+
+def get_schema_etag(request: HttpRequest, format: str) -> str:
+    return PrecomputedOpenAPISchema.get(schema_format=format)[1]
+
+
+class PrecomputedOpenAPISchemaView(View):
+    """
+    Serves the precomputed OpenAPI document as JSON or YAML.
+
+    Nothing is introspected per request; the response carries the schema's
+    ETag and a matching If-None-Match gets an empty 304.
+    """
+
+    http_method_names = ["get", "head", "options"]
+
+    @method_decorator(condition(etag_func=get_schema_etag))
+    def get(self, request: HttpRequest, format: str) -> HttpResponse:
+        content, _ = PrecomputedOpenAPISchema.get(schema_format=format)
+        response: HttpResponse = HttpResponse(
+            content, content_type=PrecomputedOpenAPISchema.FORMATS[format][1]
+        )
+        # ? Clients must revalidate, so a deploy is picked up on the next poll
+        patch_cache_control(response, public=True, no_cache=True)
+        return response
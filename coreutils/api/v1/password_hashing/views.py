@@ -0,0 +1,23 @@
+from rest_framework import generics, permissions
+from rest_framework.request import Request
+from rest_framework.response import Response
+from coreutils.api.v1.utils.constants import PASSWORD_HASHING_METRICS_SUCCESS_MESSAGE
+from coreutils.utils.generics.views.core_generic_utils import CoreGenericUtils
+from coreutils.utils.password_hashing import PasswordHashingExecutor
+from userauth.api.v1.utils.custom_authentication.custom_authentication import (
+    CustomAuthentication,
+)
+
+
+class PasswordHashingMetricsAPIView(CoreGenericUtils, generics.GenericAPIView):
+    """
+    Admin-only snapshot of the password hashing executor: queue depth,
+    rejections and wait/hash latencies of this process.
+    """
+
+    authentication_classes = [CustomAuthentication]
+    permission_classes = [permissions.IsAdminUser]
+    success_message = PASSWORD_HASHING_METRICS_SUCCESS_MESSAGE
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        return self.success_response(PasswordHashingExecutor.get_metrics())
@@ -0,0 +1,16 @@
+from django.urls import path
+from coreutils.api.v1.batch import views
+from coreutils.api.v1.password_hashing import views as password_hashing_views
+from coreutils.api.v1.utils.constants import (
+    BATCH_REQUEST_URL_NAME,
+    PASSWORD_HASHING_METRICS_URL_NAME,
+)
+
+urlpatterns = [
+    path("batch/", views.BatchRequestAPIView.as_view(), name=BATCH_REQUEST_URL_NAME),
+    path(
+        "password-hashing/metrics/",
+        password_hashing_views.PasswordHashingMetricsAPIView.as_view(),
+        name=PASSWORD_HASHING_METRICS_URL_NAME,
+    ),
+]
@@ -0,0 +1,23 @@
+BATCH_REQUEST_URL_NAME = "BatchRequestAPIView"
+BATCH_REQUEST_ALLOWED_METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE"]
+
+BATCH_REQUEST_SUCCESS_MESSAGE = {
+    "POST": {
+        "title": "Batch Executed",
+        "description": "Batch requests executed successfully",
+    }
+}
+
+BATCH_REQUEST_ROLLED_BACK_MESSAGE = {
+    "title": "Batch Rolled Back",
+    "description": "A sub-request failed, so the atomic batch was rolled back",
+}
+
+PASSWORD_HASHING_METRICS_URL_NAME = "PasswordHashingMetricsAPIView"
+
+PASSWORD_HASHING_METRICS_SUCCESS_MESSAGE = {
+    "GET": {
+        "title": "Password Hashing Metrics",
+        "description": "Password hashing metrics fetched successfully",
+    }
+}
@@ -0,0 +1,81 @@
+from typing import Dict, List
+
+from django.conf import settings
+from django.urls import Resolver404, resolve
+
+from coreutils.api.v1.utils.constants import BATCH_REQUEST_URL_NAME
+from coreutils.utils.batch_request_utils import BatchRequestExecutor
+from coreutils.utils.generics.serializers.mixins import CoreGenericBaseHandler
+
+
+class BatchRequestHandler(CoreGenericBaseHandler):
+    """
+    Handler for executing several API calls in one round trip.
+
+    Expects the following keys in `self.data`:
+    - requests: List of sub-requests (method, path, params, body)
+    - atomic: Run every sub-request inside one transaction
+    """
+
+    max_batch_size: int = getattr(settings, "BATCH_REQUEST_MAX_SIZE", 20)
+
+    def validate_batch_size(self) -> Dict:
+        """
+        Ensures the number of sub-requests does not exceed `max_batch_size`.
+
+        Returns:
+            Dict: Error message dict if validation fails, otherwise an empty dict.
+        """
+        if len(self.data["requests"]) > self.max_batch_size:
+            return {
+                "title": "Batch too large",
+                "description": f"A batch can contain at most {self.max_batch_size} requests",
+            }
+        return {}
+
+    def validate_nested_batch(self) -> Dict:
+        """
+        Prevents sub-requests from calling the batch endpoint itself.
+
+        Returns:
+            Dict: Error message dict if validation fails, otherwise an empty dict.
+        """
+        for sub_request in self.data["requests"]:
+            try:
+                url_name: str = resolve(sub_request["path"].split("?")[0]).url_name
+            except Resolver404:
+                continue
+            if url_name == BATCH_REQUEST_URL_NAME:
+                return {
+                    "title": "Nested batch",
+                    "description": "A batch request cannot contain another batch request",
+                }
+        return {}
+
+    def validate(self):
+        """
+        Executes all batch validations and sets the first error found.
+        """
+        batch_size_error_message: Dict = self.validate_batch_size()
+        if batch_size_error_message:
+            return self.set_error_message(
+                error_message=batch_size_error_message, key="requests"
+            )
+        nested_batch_error_message: Dict = self.validate_nested_batch()
+        if nested_batch_error_message:
+            return self.set_error_message(
+                error_message=nested_batch_error_message, key="requests"
+            )
+
+    def create(self):
+        """
+        Executes the sub-requests and replaces them with their responses.
+        """
+        executor: BatchRequestExecutor = BatchRequestExecutor(
+            request=self.request,
+            sub_requests=self.data.pop("requests"),
+            atomic=self.data["atomic"],
+        )
+        responses: List[Dict] = executor.execute()
+        self.data["rolled_back"] = executor.rolled_back
+        self.data["responses"] = responses
@@ -0,0 +1,84 @@
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.template.loader import render_to_string
+
+from coreutils.utils.email_templates import (
+    EMAIL_TEMPLATE_DIRECTORY,
+    EmailTemplateRegistry,
+)
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Renders an email template for many recipients, once per message with "
+        "render_to_string and as a batch through EmailTemplateRegistry."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument("--renders", type=int, default=10000)
+        parser.add_argument("--template", default="class_reminder")
+
+    def build_contexts(self, count: int) -> List[Dict]:
+        return [
+            {"client_name": f"Client {index}", "date_of_booking": "2025-06-01"}
+            for index in range(count)
+        ]
+
+    def run_case(self, label: str, render: Callable, count: int):
+        started_at: float = time.perf_counter()
+        render()
+        duration: float = time.perf_counter() - started_at
+
+        # ? Traced separately, tracing slows rendering down
+        tracemalloc.start()
+        render()
+        peak_bytes: int = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        self.stdout.write(
+            f"{label:<22} {duration * 1000:>9.1f} ms "
+            f"{count / duration:>10.0f} renders/s "
+            f"peak {peak_bytes / (1024 * 1024):.1f} MB"
+        )
+
+    def handle(self, *args, **options):
+        name: str = options["template"]
+        count: int = options["renders"]
+        shared_context: Dict = {
+            "class_title": "Morning Yoga",
+            "instructor_name": "Instructor",
+            "start_time": "07:00",
+        }
+        contexts: List[Dict] = self.build_contexts(count=count)
+
+        def render_each():
+            # ? What callers did before: look the templates up and build a context per message
+            return [
+                (
+                    render_to_string(
+                        f"{EMAIL_TEMPLATE_DIRECTORY}/{name}_subject.txt",
+                        {**shared_context, **context},
+                    ).strip(),
+                    render_to_string(
+                        f"{EMAIL_TEMPLATE_DIRECTORY}/{name}.html",
+                        {**shared_context, **context},
+                    ),
+                )
+                for context in contexts
+            ]
+
+        def render_batch():
+            return EmailTemplateRegistry.render_many(
+                name=name, contexts=contexts, shared_context=shared_context
+            )
+
+        # ? Compile once up front so both cases measure rendering only
+        EmailTemplateRegistry.get(name=name)
+        render_each()
+        if render_each() != render_batch():
+            self.stderr.write("Rendered output differs between the two paths")
+
+        self.run_case("render_to_string", render_each, count)
+        self.run_case("registry render_many", render_batch, count)
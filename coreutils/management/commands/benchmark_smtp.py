@@ -0,0 +1,144 @@
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from coreutils.utils.send_emails import build_email_message
+from coreutils.utils.smtp_stand_in import LocalSMTPStandInServer
+from coreutils.utils.smtp_transport import SMTPTransport
+
+BENCHMARK_SENDER_EMAIL: str = "benchmark@localhost"
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Compares one SMTP session per message with pooled sessions and "
+        "send_many, against an in-process SMTP stand-in."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument("--messages", type=int, default=30)
+        parser.add_argument(
+            "--handshake-ms",
+            type=float,
+            default=50.0,
+            help="Delay per new session, standing in for TLS and AUTH.",
+        )
+        parser.add_argument(
+            "--latency-ms",
+            type=float,
+            default=1.0,
+            help="Delay per SMTP reply, standing in for the network round trip.",
+        )
+        parser.add_argument(
+            "--attachment-mb",
+            type=float,
+            default=0,
+            help="Also send one message with an attachment of this size and "
+            "report the peak memory allocated while sending it.",
+        )
+
+    def build_messages(self, count: int) -> List[Dict]:
+        return [
+            {
+                "to_addrs": [f"client{index}@localhost"],
+                "message": build_email_message(
+                    sender_email=BENCHMARK_SENDER_EMAIL,
+                    receiver_email=[f"client{index}@localhost"],
+                    subject="Class reminder",
+                    body=f"<p>Your class starts soon, client {index}.</p>",
+                ).as_string(),
+            }
+            for index in range(count)
+        ]
+
+    def run_case(
+        self, server: LocalSMTPStandInServer, label: str, send, messages: List[Dict]
+    ):
+        connections_before: int = server.stats["connections"]
+        started_at: float = time.perf_counter()
+        send(messages)
+        duration: float = time.perf_counter() - started_at
+        self.stdout.write(
+            f"{label:<28} {duration * 1000:>9.1f} ms "
+            f"{len(messages) / duration:>9.1f} msg/s "
+            f"{server.stats['connections'] - connections_before:>5} sessions"
+        )
+
+    def run_attachment_case(self, transport: SMTPTransport, size_mb: float):
+        with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as attachment:
+            attachment.write(os.urandom(int(size_mb * 1024 * 1024)))
+        try:
+            tracemalloc.start()
+            started_at: float = time.perf_counter()
+            transport.send_many(
+                messages=[
+                    {
+                        "to_addrs": ["client@localhost"],
+                        "message": build_email_message(
+                            sender_email=BENCHMARK_SENDER_EMAIL,
+                            receiver_email=["client@localhost"],
+                            subject="Roster export",
+                            body="<p>Roster attached.</p>",
+                            file_name="roster.bin",
+                            file_path=attachment.name,
+                        ),
+                    }
+                ]
+            )
+            duration: float = time.perf_counter() - started_at
+            peak_bytes: int = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        finally:
+            os.unlink(attachment.name)
+        self.stdout.write(
+            f"{f'{size_mb:g} MB attachment':<28} {duration * 1000:>9.1f} ms "
+            f"peak {peak_bytes / (1024 * 1024):.1f} MB allocated"
+        )
+
+    def handle(self, *args, **options):
+        server: LocalSMTPStandInServer = LocalSMTPStandInServer(
+            handshake_latency=options["handshake_ms"] / 1000,
+            command_latency=options["latency_ms"] / 1000,
+        ).start()
+        transport: SMTPTransport = SMTPTransport(
+            server="127.0.0.1",
+            port=server.port,
+            connection_type="PLAIN",
+            username=BENCHMARK_SENDER_EMAIL,
+            password="benchmark",
+        )
+        messages: List[Dict] = self.build_messages(count=options["messages"])
+
+        def send_unpooled(batch: List[Dict]):
+            # ? What send_an_email used to do: connect, log in, send, quit
+            for message in batch:
+                connection = transport.connect()
+                transport.send_message(connection=connection, message=message)
+                connection.quit()
+
+        def send_pooled(batch: List[Dict]):
+            for message in batch:
+                transport.send(to_addrs=message["to_addrs"], message=message["message"])
+
+        try:
+            self.run_case(server, "session per message", send_unpooled, messages)
+            transport.close()
+            self.run_case(server, "pooled send (cold pool)", send_pooled, messages)
+            self.run_case(
+                server,
+                "send_many (warm pool)",
+                lambda batch: transport.send_many(messages=batch),
+                messages,
+            )
+            if options["attachment_mb"]:
+                self.run_attachment_case(
+                    transport=transport, size_mb=options["attachment_mb"]
+                )
+        finally:
+            transport.close()
+            server.stop()
+        self.stdout.write(f"messages received:           {server.stats['messages']}")
@@ -0,0 +1,36 @@
+import time
+from typing import List
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from coreutils.utils.openapi_schema import (
+    OPENAPI_SCHEMA_DIRECTORY,
+    PrecomputedOpenAPISchema,
+)
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Generates the OpenAPI schema and writes it to disk, where the "
+        "schema views serve it from. Run on every deploy."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--output-dir",
+            default=OPENAPI_SCHEMA_DIRECTORY,
+            help="Directory for schema.json and schema.yaml.",
+        )
+
+    def handle(self, *args, **options):
+        started_at: float = time.perf_counter()
+        file_paths: List[str] = PrecomputedOpenAPISchema.write(
+            directory=options["output_dir"]
+        )
+        for file_path in file_paths:
+            self.stdout.write(f"Wrote {file_path}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"OpenAPI schema generated in {time.perf_counter() - started_at:.2f}s"
+            )
+        )
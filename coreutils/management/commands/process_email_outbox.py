@@ -0,0 +1,50 @@
+import time
+from typing import Dict
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import close_old_connections
+
+from coreutils.utils.email_outbox import EmailOutbox
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Delivers queued outbox emails in batches, retrying failures with "
+        "exponential backoff. Several workers can run side by side."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for new emails instead of exiting when the outbox is empty.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=2.0,
+            help="Seconds to wait between polls when the outbox is empty.",
+        )
+
+    def handle(self, *args, **options):
+        totals: Dict[str, int] = {"claimed": 0, "sent": 0, "retrying": 0, "failed": 0}
+        while True:
+            counts: Dict[str, int] = EmailOutbox.process_batch(
+                batch_size=options["batch_size"]
+            )
+            for key, count in counts.items():
+                totals[key] += count
+            if counts["claimed"]:
+                continue
+            if not options["loop"]:
+                break
+            close_old_connections()
+            time.sleep(options["interval"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Sent: {totals['sent']}, retrying: {totals['retrying']}, "
+                f"failed: {totals['failed']}"
+            )
+        )
@@ -0,0 +1,80 @@
+import os
+from typing import Dict, List
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from coreutils.utils.startup_profiler import StartupProfiler
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Starts the project in a fresh interpreter and reports the startup "
+        "phases, each app's ready() cost and the slowest module imports."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--limit", type=int, default=25, help="Number of modules to list."
+        )
+        parser.add_argument(
+            "--sort",
+            choices=["cumulative", "self"],
+            default="cumulative",
+            help="Rank modules by time including (cumulative) or excluding (self) their imports.",
+        )
+        parser.add_argument(
+            "--project-only",
+            action="store_true",
+            help="Only list modules of this project's apps.",
+        )
+        parser.add_argument(
+            "--skip-urls",
+            action="store_true",
+            help="Do not load the URLconf, which workers otherwise do on their first request.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            result: Dict = StartupProfiler.profile(
+                settings_module=os.environ["DJANGO_SETTINGS_MODULE"],
+                base_dir=str(settings.BASE_DIR),
+                include_urls=not options["skip_urls"],
+            )
+        except RuntimeError as error:
+            raise CommandError(f"Startup failed: {error}")
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Startup phases"))
+        for phase, duration in result["phases"].items():
+            self.stdout.write(f"  {phase:<40} {duration * 1000:>9.1f} ms")
+
+        self.stdout.write(self.style.MIGRATE_HEADING("AppConfig.ready()"))
+        for label, duration in sorted(
+            result["ready"].items(), key=lambda item: item[1], reverse=True
+        ):
+            self.stdout.write(f"  {label:<40} {duration * 1000:>9.1f} ms")
+
+        imports: List[Dict] = result["imports"]
+        if options["project_only"]:
+            project_packages: set = {
+                app.split(".")[0] for app in [*settings.CUSTOM_APPS, "core"]
+            }
+            imports: List[Dict] = [
+                entry
+                for entry in imports
+                if entry["module"].split(".")[0] in project_packages
+            ]
+        sort_key: str = f"{options['sort']}_us"
+        imports.sort(key=lambda entry: entry[sort_key], reverse=True)
+
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(
+                f"Slowest imports ({options['sort']}, {len(result['imports'])} modules)"
+            )
+        )
+        self.stdout.write(f"  {'module':<60} {'self':>9} {'cumulative':>12}")
+        for entry in imports[: options["limit"]]:
+            self.stdout.write(
+                f"  {entry['module']:<60} {entry['self_us'] / 1000:>7.1f}ms "
+                f"{entry['cumulative_us'] / 1000:>10.1f}ms"
+            )
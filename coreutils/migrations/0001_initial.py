@@ -0,0 +1,183 @@
+# Generated by Django 5.2.3 on 2026-10-19 00:31
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="WeekDayOffModel",
+            fields=[
+                (
+                    "core_generic_created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        db_column="CORE_GENERIC_CREATED_AT",
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        db_column="CORE_GENERIC_LAST_UPDATED_AT",
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_created_by",
+                    models.CharField(
+                        blank=True,
+                        db_column="CORE_GENERIC_CREATED_BY",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_updated_by",
+                    models.CharField(
+                        blank=True,
+                        db_column="CORE_GENERIC_UPDATED_BY",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "id",
+                    models.UUIDField(
+                        db_column="ID",
+                        default=uuid.uuid1,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "IS_MONDAY_HOLIDAY",
+                    models.BooleanField(db_column="IS_MONDAY_HOLIDAY", default=False),
+                ),
+                (
+                    "IS_TUESDAY_HOLIDAY",
+                    models.BooleanField(db_column="IS_TUESDAY_HOLIDAY", default=False),
+                ),
+                (
+                    "IS_WEDNSDAY_HOLIDAY",
+                    models.BooleanField(db_column="IS_WEDNSDAY_HOLIDAY", default=False),
+                ),
+                (
+                    "IS_THURSDAY_HOLIDAY",
+                    models.BooleanField(db_column="IS_THURSDAY_HOLIDAY", default=False),
+                ),
+                (
+                    "IS_FRIDAY_HOLIDAY",
+                    models.BooleanField(db_column="IS_FRIDAY_HOLIDAY", default=False),
+                ),
+                (
+                    "IS_SATURDAY_HOLIDAY",
+                    models.BooleanField(db_column="IS_SATURDAY_HOLIDAY", default=False),
+                ),
+                (
+                    "IS_SUNDAY_HOLIDAY",
+                    models.BooleanField(db_column="IS_SUNDAY_HOLIDAY", default=False),
+                ),
+            ],
+            options={
+                "db_table": "WEEK_OF_DAYS",
+                "ordering": ("core_generic_created_at",),
+            },
+        ),
+        migrations.CreateModel(
+            name="EmailOutboxModel",
+            fields=[
+                (
+                    "core_generic_created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        db_column="CORE_GENERIC_CREATED_AT",
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        db_column="CORE_GENERIC_LAST_UPDATED_AT",
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_created_by",
+                    models.CharField(
+                        blank=True,
+                        db_column="CORE_GENERIC_CREATED_BY",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_updated_by",
+                    models.CharField(
+                        blank=True,
+                        db_column="CORE_GENERIC_UPDATED_BY",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "id",
+                    models.UUIDField(
+                        db_column="ID",
+                        default=uuid.uuid1,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                ("receiver_email", models.JSONField(db_column="RECEIVER_EMAIL")),
+                ("subject", models.CharField(db_column="SUBJECT", max_length=255)),
+                ("body", models.TextField(db_column="BODY")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("PENDING", "Pending"),
+                            ("SENDING", "Sending"),
+                            ("SENT", "Sent"),
+                            ("FAILED", "Failed"),
+                        ],
+                        db_column="STATUS",
+                        default="PENDING",
+                        max_length=10,
+                    ),
+                ),
+                ("attempts", models.IntegerField(db_column="ATTEMPTS", default=0)),
+                ("next_attempt_at", models.DateTimeField(db_column="NEXT_ATTEMPT_AT")),
+                (
+                    "last_error",
+                    models.TextField(blank=True, db_column="LAST_ERROR", null=True),
+                ),
+                (
+                    "sent_at",
+                    models.DateTimeField(blank=True, db_column="SENT_AT", null=True),
+                ),
+            ],
+            options={
+                "db_table": "EMAIL_OUTBOX",
+                "ordering": ("core_generic_created_at",),
+                "indexes": [
+                    models.Index(
+                        fields=["status", "next_attempt_at"],
+                        name="EMAIL_OUTBOX_CLAIM_IDX",
+                    )
+                ],
+            },
+        ),
+    ]
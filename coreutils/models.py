@@ -40,3 +40,55 @@ class WeekDayOffModel(CoreGenericModel):
     class Meta:
         db_table = "WEEK_OF_DAYS"
         ordering = ("core_generic_created_at",)
+
+
+class EmailOutboxModel(CoreGenericModel):
+    """
+    Emails waiting to be delivered by the `process_email_outbox` worker.
+
+    Rows are written in the same transaction as the business event that
+    triggers them, so an email is queued if and only if the event commits.
+    """
+
+    STATUS_PENDING: str = "PENDING"
+    STATUS_SENDING: str = "SENDING"
+    STATUS_SENT: str = "SENT"
+    STATUS_FAILED: str = "FAILED"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_SENDING, "Sending"),
+        (STATUS_SENT, "Sent"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    id = models.UUIDField(
+        unique=True,
+        primary_key=True,
+        default=uuid.uuid1,
+        db_column="ID",
+        editable=False,
+    )
+    receiver_email = models.JSONField(db_column="RECEIVER_EMAIL")
+    subject = models.CharField(max_length=255, db_column="SUBJECT")
+    body = models.TextField(db_column="BODY")
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        db_column="STATUS",
+    )
+    attempts = models.IntegerField(default=0, db_column="ATTEMPTS")
+    # ? When the row may next be claimed: the retry time, or the end of a worker's lease
+    next_attempt_at = models.DateTimeField(db_column="NEXT_ATTEMPT_AT")
+    last_error = models.TextField(null=True, blank=True, db_column="LAST_ERROR")
+    sent_at = models.DateTimeField(null=True, blank=True, db_column="SENT_AT")
+
+    class Meta:
+        db_table = "EMAIL_OUTBOX"
+        ordering = ("core_generic_created_at",)
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"],
+                name="EMAIL_OUTBOX_CLAIM_IDX",
+            ),
+        ]
@@ -0,0 +1,3 @@
+from django.urls import path, include
+
+urlpatterns = [path("api/v1/", include("coreutils.api.v1.urls"))]
@@ -0,0 +1,11 @@
+from django.contrib.admin.apps import AdminConfig
+
+
+class AutoRegisterAdminConfig(AdminConfig):
+    """
+    `django.contrib.admin` with the lazily auto-registering default site.
+    """
+
+    default_site: str = (
+        "coreutils.utils.admin.auto_register_admin_site.AutoRegisterAdminSite"
+    )
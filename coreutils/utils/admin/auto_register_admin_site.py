@@ -0,0 +1,69 @@
+import threading
+from typing import List, Tuple
+
+from django.conf import settings
+from django.contrib import admin
+from django.core.checks import CheckMessage
+from django.urls import URLPattern
+from django.utils.functional import cached_property
+
+AUTO_REGISTER_MODELS: bool = getattr(settings, "AUTO_REGISTER_MODELS", False)
+
+
+class LazyAdminURLConf:
+    """
+    Stands in for a URLconf module whose `urlpatterns` are the admin site's
+    URLs, built the first time the URL resolver reads them.
+    """
+
+    def __init__(self, admin_site: admin.AdminSite):
+        self.admin_site: admin.AdminSite = admin_site
+
+    @cached_property
+    def urlpatterns(self) -> List[URLPattern]:
+        return self.admin_site.get_urls()
+
+
+class AutoRegisterAdminSite(admin.AdminSite):
+    """
+    Admin site that auto-registers the custom app models on first use.
+
+    Registration builds a ModelAdmin per model and inspects its relations,
+    which API workers never need. It is deferred from app loading to the
+    first time the admin URLs are built (or admin checks run), and happens
+    once per process.
+
+    `urls` hands `path()` a lazy URLconf instead of the built patterns, so
+    importing the root URLconf does not build them. They are built when a
+    request path starts with the admin prefix, or when `reverse()` first
+    populates the resolver.
+    """
+
+    auto_registered: bool = False
+    lock: threading.Lock = threading.Lock()
+
+    def auto_register_models(self):
+        if self.auto_registered:
+            return
+        with self.lock:
+            if self.auto_registered:
+                return
+            self.auto_registered: bool = True
+            if AUTO_REGISTER_MODELS:
+                from coreutils.utils.admin.auto_register_models import (
+                    AutoRegisterModel,
+                )
+
+                AutoRegisterModel().register_models()
+
+    @property
+    def urls(self) -> Tuple[LazyAdminURLConf, str, str]:
+        return LazyAdminURLConf(admin_site=self), "admin", self.name
+
+    def get_urls(self) -> List[URLPattern]:
+        self.auto_register_models()
+        return super().get_urls()
+
+    def check(self, app_configs) -> List[CheckMessage]:
+        self.auto_register_models()
+        return super().check(app_configs)
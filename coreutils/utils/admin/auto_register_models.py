@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Set, Type
 
 from django.conf import settings
 from django.contrib import admin
@@ -6,6 +6,7 @@ from django.db import models
 from django.db.models import Model
 
 
+from coreutils.utils.admin.estimated_count_paginator import EstimatedCountPaginator
 from coreutils.utils.generics.generic_models import CoreGenericModel
 from coreutils.utils.db_utils.model_fetcher import GetModels
 
@@ -13,6 +14,8 @@ from coreutils.utils.db_utils.model_fetcher import GetModels
 AUTO_REGISTER_MODEL_APPS: List = getattr(settings, "AUTO_REGISTER_MODEL_APPS", [])
 AUTO_REGISTER_MODELS: bool = getattr(settings, "AUTO_REGISTER_MODELS", False)
 CUSTOM_APPS: List = getattr(settings, "CUSTOM_APPS", [])
+# ? How many foreign keys deep changelists join, so related __str__ calls do not query
+ADMIN_SELECT_RELATED_DEPTH: int = getattr(settings, "ADMIN_SELECT_RELATED_DEPTH", 3)
 
 
 class AutoRegisterModel:
@@ -65,6 +68,69 @@ class AutoRegisterModel:
         """
         return [field.name for field in CoreGenericModel._meta.get_fields()]
 
+    def get_search_fields(self, model: Model) -> List[str]:
+        """
+        CharField & UUIDField names of the model, excluding inherited fields
+        """
+        return [
+            field.name
+            for field in model._meta.fields
+            if isinstance(field, (models.CharField, models.UUIDField))
+            and field.name not in self.get_core_generic_field_names()
+        ]
+
+    def get_select_related(
+        self, model: Model, depth: int, prefix: str = ""
+    ) -> List[str]:
+        """
+        Foreign key paths reachable from the model, up to `depth` relations deep.
+        Used for `list_select_related`, so the related objects shown in a
+        changelist (and the objects their __str__ uses) come from one query.
+        """
+        if depth <= 0:
+            return []
+        select_related: List[str] = []
+        for field in model._meta.fields:
+            if isinstance(field, (models.ForeignKey, models.OneToOneField)):
+                path: str = f"{prefix}{field.name}"
+                select_related.append(path)
+                select_related.extend(
+                    self.get_select_related(
+                        model=field.related_model,
+                        depth=depth - 1,
+                        prefix=f"{path}__",
+                    )
+                )
+        return select_related
+
+    def get_related_widget_fields(
+        self, model: Model, searchable_models: Set[Model]
+    ) -> tuple[List[str], List[str]]:
+        """
+        Splits the model's editable relations into autocomplete and raw id fields.
+
+        Relations to models with a searchable admin use an autocomplete widget;
+        the rest use a raw id input. Either way the change form no longer
+        renders a <select> holding every row of the related table.
+
+        Returns:
+            tuple[List[str], List[str]]: (autocomplete_fields, raw_id_fields)
+        """
+        autocomplete_fields: List[str] = []
+        raw_id_fields: List[str] = []
+        for field in [*model._meta.fields, *model._meta.many_to_many]:
+            if not field.is_relation or not field.editable:
+                continue
+            related_model: Model = field.related_model
+            related_admin: admin.ModelAdmin = admin.site._registry.get(related_model)
+            if related_model in searchable_models or (
+                related_admin is not None and related_admin.search_fields
+            ):
+                autocomplete_fields.append(field.name)
+            else:
+                raw_id_fields.append(field.name)
+        return autocomplete_fields, raw_id_fields
+
     def register_models(self):
         """
         Register models dynamically in the Django admin site.
@@ -72,8 +138,17 @@ class AutoRegisterModel:
         based on model attributes.
         """
         models_list: List[Model] = self.get_registered_app_models()
+        # ? Auto-registered admins with search fields can serve autocomplete
+        searchable_models: Set[Model] = {
+            model for model in models_list if self.get_search_fields(model=model)
+        }
 
         for model in models_list:
+            related_widget_fields: tuple[List[str], List[str]] = (
+                self.get_related_widget_fields(
+                    model=model, searchable_models=searchable_models
+                )
+            )
 
             class DynamicAdmin(admin.ModelAdmin):
                 """
@@ -98,12 +173,20 @@ class AutoRegisterModel:
                 ]
 
                 # ? Define search fields (Only CharField & UUIDField, excluding inherited fields)
-                search_fields: List = [
-                    field.name
-                    for field in model._meta.fields
-                    if isinstance(field, (models.CharField, models.UUIDField))
-                    and field.name not in self.get_core_generic_field_names()
-                ]
+                search_fields: List = self.get_search_fields(model=model)
+
+                # ? Join the related rows shown in the list instead of loading them per row
+                list_select_related: List = self.get_select_related(
+                    model=model, depth=ADMIN_SELECT_RELATED_DEPTH
+                )
+
+                # ? Related pickers that do not load the whole related table
+                autocomplete_fields: List = related_widget_fields[0]
+                raw_id_fields: List = related_widget_fields[1]
+
+                # ? Skip the unfiltered COUNT(*) and estimate the count of large tables
+                show_full_result_count: bool = False
+                paginator: Type[EstimatedCountPaginator] = EstimatedCountPaginator
 
             # ? Register model with dynamically generated ModelAdmin class
             admin.site.register(model, DynamicAdmin)
@@ -0,0 +1,55 @@
+from typing import List
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import Model
+from django.db.models.query import QuerySet
+from django.utils.functional import cached_property
+
+# ? Above this many rows an unfiltered changelist shows the planner's estimate
+ADMIN_ESTIMATED_COUNT_THRESHOLD: int = getattr(
+    settings, "ADMIN_ESTIMATED_COUNT_THRESHOLD", 10000
+)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Admin paginator that avoids `COUNT(*)` over large tables.
+
+    For an unfiltered queryset on PostgreSQL the row count comes from the
+    planner statistics (`pg_class.reltuples`), which is read in constant
+    time. The estimate is only used above ADMIN_ESTIMATED_COUNT_THRESHOLD;
+    smaller tables, filtered or searched querysets and other databases get
+    the exact count.
+    """
+
+    def get_estimated_count(self, queryset: QuerySet[Model]) -> int | None:
+        """
+        Returns the planner's row estimate for the queryset's table, or None.
+        """
+        connection: BaseDatabaseWrapper = connections[queryset.db]
+        if connection.vendor != "postgresql" or queryset.query.where:
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row: List = cursor.fetchone()
+        # ? -1 or 0 means the table was never analyzed
+        if not row or row[0] is None or row[0] < ADMIN_ESTIMATED_COUNT_THRESHOLD:
+            return None
+        return int(row[0])
+
+    @cached_property
+    def count(self) -> int:
+        if isinstance(self.object_list, QuerySet):
+            estimated_count: int | None = self.get_estimated_count(
+                queryset=self.object_list
+            )
+            if estimated_count is not None:
+                return estimated_count
+        return super().count
@@ -0,0 +1,311 @@
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Callable, Dict, List
+from urllib.parse import urlencode, urlsplit
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, transaction
+from django.http import HttpResponse
+from django.urls import Resolver404, ResolverMatch, resolve
+from rest_framework.request import Request
+
+from core.settings import logger
+
+logger = logging.LoggerAdapter(logger, {"app_name": "BatchRequestExecutor"})
+
+# ? Maximum number of threads used to run independent GET sub-requests
+BATCH_REQUEST_MAX_WORKERS: int = getattr(settings, "BATCH_REQUEST_MAX_WORKERS", 4)
+
+# ? Status of the sub-requests skipped after a failure in an atomic batch (Failed Dependency)
+BATCH_REQUEST_NOT_EXECUTED_STATUS: int = 424
+
+# ? META keys that describe the outer request body and must not leak into sub-requests
+BATCH_REQUEST_EXCLUDED_META_KEYS: tuple = (
+    "CONTENT_TYPE",
+    "CONTENT_LENGTH",
+    "QUERY_STRING",
+    "PATH_INFO",
+    "REQUEST_METHOD",
+    "wsgi.input",
+)
+
+
+class BatchRequestExecutor:
+    """
+    Executes a list of sub-requests in-process.
+
+    Every sub-request is resolved through the URL router and the resolved view
+    is called directly, so the batch pays the HTTP, middleware and (when the
+    authentication classes match) authentication overhead only once.
+
+    Attributes:
+        request (Request): The outer batch request.
+        sub_requests (List[Dict]): Validated sub-requests with method, path, params and body.
+        atomic (bool): Runs every sub-request inside one transaction when True.
+        max_workers (int): Number of threads used for consecutive GET sub-requests.
+        rolled_back (bool): Set when an atomic batch was rolled back because a sub-request failed.
+    """
+
+    request: Request
+    sub_requests: List[Dict]
+    atomic: bool
+    max_workers: int
+    rolled_back: bool
+
+    def __init__(
+        self,
+        request: Request,
+        sub_requests: List[Dict],
+        atomic: bool = False,
+        max_workers: int = BATCH_REQUEST_MAX_WORKERS,
+    ):
+        """
+        Initializes the executor with the outer request and the sub-requests to run.
+
+        Args:
+            request (Request): The outer batch request.
+            sub_requests (List[Dict]): Sub-requests to execute, in order.
+            atomic (bool, optional): Wrap the whole batch in one transaction. Defaults to False.
+            max_workers (int, optional): Thread count for concurrent GETs.
+        """
+        self.request: Request = request
+        self.sub_requests: List[Dict] = sub_requests
+        self.atomic: bool = atomic
+        self.max_workers: int = max_workers
+        self.rolled_back: bool = False
+
+    def build_environ(self, sub_request: Dict) -> Dict:
+        """
+        Builds a WSGI environ for a sub-request from the outer request's META.
+
+        Args:
+            sub_request (Dict): Sub-request containing method, path, params and body.
+
+        Returns:
+            Dict: WSGI environ for the sub-request.
+        """
+        url = urlsplit(sub_request["path"])
+        query_string: str = url.query
+        if sub_request.get("params"):
+            encoded_params: str = urlencode(sub_request["params"], doseq=True)
+            query_string: str = "&".join(filter(None, [query_string, encoded_params]))
+
+        body: bytes = b""
+        if sub_request.get("body"):
+            body: bytes = json.dumps(
+                sub_request["body"], cls=DjangoJSONEncoder
+            ).encode()
+
+        environ: Dict = {
+            key: meta_value
+            for key, meta_value in self.request._request.META.items()
+            if key not in BATCH_REQUEST_EXCLUDED_META_KEYS
+        }
+        environ.update(
+            {
+                "REQUEST_METHOD": sub_request["method"],
+                "PATH_INFO": url.path,
+                "QUERY_STRING": query_string,
+                "CONTENT_TYPE": "application/json",
+                "CONTENT_LENGTH": str(len(body)),
+                "wsgi.input": BytesIO(body),
+            }
+        )
+        return environ
+
+    def share_authentication(
+        self, http_request: WSGIRequest, resolver_match: ResolverMatch
+    ) -> None:
+        """
+        Reuses the outer request's authenticated user for the sub-request.
+
+        Authentication is only shared when the target view authenticates with
+        the same classes as the batch view, so views with stricter
+        authentication still run their own checks against the forwarded header.
+
+        Args:
+            http_request (WSGIRequest): The sub-request.
+            resolver_match (ResolverMatch): Resolved view for the sub-request.
+        """
+        if not self.request.user or not self.request.user.is_authenticated:
+            return
+
+        view_class = getattr(resolver_match.func, "cls", None)
+        if view_class is None:
+            return
+
+        outer_authentication_classes: List = [
+            type(authenticator) for authenticator in self.request.authenticators
+        ]
+        if list(view_class.authentication_classes) != outer_authentication_classes:
+            return
+
+        # ? DRF picks these up and skips its authenticators for the sub-request
+        http_request._force_auth_user = self.request.user
+        http_request._force_auth_token = self.request.auth
+
+    def get_response_body(self, response: HttpResponse):
+        """
+        Extracts the rendered body from a sub-response.
+
+        Args:
+            response (HttpResponse): Response returned by the resolved view.
+
+        Returns:
+            Any: Decoded JSON body, raw text, or None for empty responses.
+        """
+        if hasattr(response, "render") and not getattr(response, "is_rendered", True):
+            response.render()
+
+        if getattr(response, "streaming", False):
+            content: bytes = b"".join(response.streaming_content)
+        else:
+            content: bytes = response.content
+
+        if not content:
+            return None
+        if "json" in response.get("Content-Type", ""):
+            return json.loads(content)
+        return content.decode(response.charset or "utf-8")
+
+    def execute_sub_request(self, sub_request: Dict) -> Dict:
+        """
+        Resolves and executes a single sub-request.
+
+        Args:
+            sub_request (Dict): Sub-request containing method, path, params and body.
+
+        Returns:
+            Dict: Status code and body of the sub-response.
+        """
+        try:
+            resolver_match: ResolverMatch = resolve(urlsplit(sub_request["path"]).path)
+        except Resolver404:
+            return {"status": 404, "body": {"error": "Path not found"}}
+
+        try:
+            http_request: WSGIRequest = WSGIRequest(self.build_environ(sub_request))
+            http_request.resolver_match = resolver_match
+            self.share_authentication(
+                http_request=http_request, resolver_match=resolver_match
+            )
+
+            view: Callable = resolver_match.func
+            response: HttpResponse = view(
+                http_request, *resolver_match.args, **resolver_match.kwargs
+            )
+            return {
+                "status": response.status_code,
+                "body": self.get_response_body(response=response),
+            }
+        except Exception as e:
+            logger.error(
+                "Batch sub-request %s %s failed: %s",
+                sub_request["method"],
+                sub_request["path"],
+                str(e),
+            )
+            return {"status": 500, "body": {"error": str(e)}}
+
+    def execute_in_thread(self, sub_request: Dict) -> Dict:
+        """
+        Executes a sub-request on a worker thread and releases its DB connection.
+
+        Args:
+            sub_request (Dict): Sub-request to execute.
+
+        Returns:
+            Dict: Status code and body of the sub-response.
+        """
+        try:
+            return self.execute_sub_request(sub_request=sub_request)
+        finally:
+            connections.close_all()
+
+    def get_execution_groups(self) -> List[List[Dict]]:
+        """
+        Splits the sub-requests into groups that can run together.
+
+        Consecutive GET sub-requests form one group and run concurrently;
+        every other method runs in a group of its own so writes keep their order.
+
+        Returns:
+            List[List[Dict]]: Ordered groups of sub-requests.
+        """
+        groups: List[List[Dict]] = []
+        for sub_request in self.sub_requests:
+            is_get: bool = sub_request["method"] == "GET"
+            if is_get and groups and groups[-1][0]["method"] == "GET":
+                groups[-1].append(sub_request)
+            else:
+                groups.append([sub_request])
+        return groups
+
+    def execute_group(self, group: List[Dict]) -> List[Dict]:
+        """
+        Executes a group of sub-requests, concurrently when it holds several GETs.
+
+        Args:
+            group (List[Dict]): Sub-requests of a single execution group.
+
+        Returns:
+            List[Dict]: Sub-responses in the same order as the group.
+        """
+        if len(group) == 1 or self.max_workers <= 1:
+            return [self.execute_sub_request(sub_request) for sub_request in group]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(group))
+        ) as executor:
+            return list(executor.map(self.execute_in_thread, group))
+
+    def execute_atomic(self) -> List[Dict]:
+        """
+        Executes every sub-request sequentially inside one transaction.
+
+        Execution stops at the first failing sub-request: the transaction is
+        rolled back, so later sub-requests could not take effect (and on
+        PostgreSQL would only hit the aborted transaction). They are returned
+        as not executed with BATCH_REQUEST_NOT_EXECUTED_STATUS.
+
+        Returns:
+            List[Dict]: Sub-responses in request order.
+        """
+        responses: List[Dict] = []
+        with transaction.atomic():
+            for index, sub_request in enumerate(self.sub_requests):
+                response: Dict = self.execute_sub_request(sub_request)
+                responses.append(response)
+                if response["status"] >= 400:
+                    transaction.set_rollback(True)
+                    self.rolled_back: bool = True
+                    responses.extend(
+                        {
+                            "status": BATCH_REQUEST_NOT_EXECUTED_STATUS,
+                            "body": {
+                                "error": f"Not executed, sub-request {index} failed"
+                            },
+                        }
+                        for _ in self.sub_requests[index + 1 :]
+                    )
+                    break
+        return responses
+
+    def execute(self) -> List[Dict]:
+        """
+        Executes all sub-requests and returns their responses in request order.
+
+        Returns:
+            List[Dict]: Sub-responses in request order.
+        """
+        if self.atomic:
+            return self.execute_atomic()
+
+        responses: List[Dict] = []
+        for group in self.get_execution_groups():
+            responses.extend(self.execute_group(group=group))
+        return responses
@@ -0,0 +1,237 @@
+import logging
+import time
+from typing import Any, Dict, Iterable, Iterator, List
+
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models import Model
+from django.db.models.deletion import Collector
+from django.db.models.query import QuerySet
+
+from core.settings import logger
+
+logger = logging.LoggerAdapter(logger, {"app_name": "ChunkedDeleteEngine"})
+
+# ? Default number of primary keys deleted per batch
+MULTI_DELETE_BATCH_SIZE: int = getattr(settings, "MULTI_DELETE_BATCH_SIZE", 500)
+
+
+def iter_keyset_ids(queryset: QuerySet[Model], batch_size: int) -> Iterator[List]:
+    """
+    Yields the queryset's primary keys in pk order, one batch at a time.
+    Each batch starts after the last key of the previous one (keyset
+    pagination), so no OFFSET scan is needed and rows deleted or changed by
+    the caller between batches do not shift the window.
+
+    Args:
+        queryset (QuerySet[Model]): Rows to walk through.
+        batch_size (int): Primary keys per batch.
+
+    Yields:
+        List: A batch of primary keys.
+    """
+    last_pk: Any = None
+    while True:
+        page_queryset: QuerySet[Model] = queryset.order_by("pk")
+        if last_pk is not None:
+            page_queryset: QuerySet[Model] = page_queryset.filter(pk__gt=last_pk)
+        ids: List = list(page_queryset.values_list("pk", flat=True)[:batch_size])
+        if not ids:
+            return
+        yield ids
+        last_pk: Any = ids[-1]
+
+
+class ChunkedDeleteEngine:
+    """
+    Deletes rows of a queryset by primary key in fixed-size batches.
+
+    Each batch is committed in its own transaction so locks are held only for
+    the duration of one batch, unless `atomic` is set, in which case the whole
+    delete runs in one outer transaction. Every batch goes through the public
+    `QuerySet.delete()`: when the model has no delete signals and no cascades,
+    Django's collector already issues a single DELETE for it without loading
+    the objects, and otherwise signals and cascades are honoured.
+
+    Attributes:
+        queryset (QuerySet[Model]): Queryset that restricts which rows may be deleted.
+        batch_size (int): Number of primary keys deleted per batch.
+        atomic (bool): Run all batches inside a single transaction.
+        using (str): Database alias used for the delete.
+    """
+
+    queryset: QuerySet[Model]
+    batch_size: int
+    atomic: bool
+    using: str
+
+    def __init__(
+        self,
+        queryset: QuerySet[Model],
+        batch_size: int = MULTI_DELETE_BATCH_SIZE,
+        atomic: bool = False,
+    ):
+        """
+        Initializes the engine for the given queryset.
+
+        Args:
+            queryset (QuerySet[Model]): Queryset the primary keys are deleted from.
+            batch_size (int, optional): Primary keys per batch. Defaults to MULTI_DELETE_BATCH_SIZE.
+            atomic (bool, optional): Run every batch in one transaction. Defaults to False.
+        """
+        self.queryset: QuerySet[Model] = queryset.order_by()
+        self.batch_size: int = max(1, batch_size)
+        self.atomic: bool = atomic
+        self.using: str = router.db_for_write(queryset.model)
+
+    def chunk_ids(self, ids: List) -> Iterator[List]:
+        """
+        Splits the primary keys into batches of `batch_size`, dropping duplicates.
+
+        Args:
+            ids (List): Primary keys to split.
+
+        Yields:
+            List: A batch of primary keys.
+        """
+        unique_ids: List = list(dict.fromkeys(ids))
+        for start in range(0, len(unique_ids), self.batch_size):
+            yield unique_ids[start : start + self.batch_size]
+
+    def iter_keyset_ids(self) -> Iterator[List]:
+        """
+        Yields the queryset's primary keys in keyset-ordered batches.
+        """
+        return iter_keyset_ids(queryset=self.queryset, batch_size=self.batch_size)
+
+    def count_existing(self, ids: List) -> int:
+        """
+        Counts how many of the primary keys exist in the queryset, batch by batch.
+
+        Args:
+            ids (List): Primary keys to look up.
+
+        Returns:
+            int: Number of matching rows.
+        """
+        return sum(
+            self.queryset.filter(pk__in=batch).count() for batch in self.chunk_ids(ids)
+        )
+
+    def can_fast_delete(self) -> bool:
+        """
+        Checks whether Django deletes the rows without loading them, for the report.
+
+        Returns:
+            bool: True when the model has no delete signals, cascades or parents.
+        """
+        return Collector(using=self.using).can_fast_delete(self.queryset)
+
+    def delete_batch(self, ids: List) -> int:
+        """
+        Deletes a single batch of primary keys.
+
+        Args:
+            ids (List): Primary keys of the batch.
+
+        Returns:
+            int: Number of rows deleted from the queryset's table.
+        """
+        batch_queryset: QuerySet[Model] = self.queryset.filter(pk__in=ids)
+        with transaction.atomic(using=self.using):
+            _, deleted_per_model = batch_queryset.delete()
+        return deleted_per_model.get(self.queryset.model._meta.label, 0)
+
+    def run_batches(
+        self, batches: Iterable[List], pause_seconds: float = 0.0
+    ) -> List[Dict]:
+        """
+        Deletes every batch and records its size, row count and duration.
+
+        Args:
+            batches (Iterable[List]): Batches of primary keys to delete.
+            pause_seconds (float, optional): Sleep between batches to leave room for other writers.
+
+        Returns:
+            List[Dict]: Per-batch report entries.
+        """
+        report_batches: List[Dict] = []
+        for batch_number, batch in enumerate(batches, start=1):
+            if batch_number > 1 and pause_seconds:
+                time.sleep(pause_seconds)
+            started_at: float = time.perf_counter()
+            deleted: int = self.delete_batch(ids=batch)
+            report_batches.append(
+                {
+                    "batch": batch_number,
+                    "size": len(batch),
+                    "deleted": deleted,
+                    "duration_ms": round((time.perf_counter() - started_at) * 1000, 3),
+                }
+            )
+        return report_batches
+
+    def build_report(
+        self, batches: List[Dict], fast_delete: bool, started_at: float
+    ) -> Dict:
+        """
+        Summarizes the per-batch entries of a delete run and logs the totals.
+        """
+        report: Dict = {
+            "total_deleted": sum(batch["deleted"] for batch in batches),
+            "fast_delete": fast_delete,
+            "atomic": self.atomic,
+            "duration_ms": round((time.perf_counter() - started_at) * 1000, 3),
+            "batches": batches,
+        }
+        logger.info(
+            "Deleted %s %s rows in %s batches (fast_delete=%s)",
+            report["total_deleted"],
+            self.queryset.model.__name__,
+            len(batches),
+            fast_delete,
+        )
+        return report
+
+    def delete(self, ids: List) -> Dict:
+        """
+        Deletes all given primary keys and returns a report.
+
+        Args:
+            ids (List): Primary keys to delete.
+
+        Returns:
+            Dict: Total rows deleted, delete mode and per-batch counts and timings.
+        """
+        fast_delete: bool = self.can_fast_delete()
+        started_at: float = time.perf_counter()
+
+        if self.atomic:
+            with transaction.atomic(using=self.using):
+                batches: List[Dict] = self.run_batches(batches=self.chunk_ids(ids))
+        else:
+            batches: List[Dict] = self.run_batches(batches=self.chunk_ids(ids))
+
+        return self.build_report(
+            batches=batches, fast_delete=fast_delete, started_at=started_at
+        )
+
+    def delete_matching(self, pause_seconds: float = 0.0) -> Dict:
+        """
+        Deletes every row of the queryset in keyset-ordered batches,
+        each committed on its own, pausing between batches.
+
+        Args:
+            pause_seconds (float, optional): Sleep between batches. Defaults to 0.
+
+        Returns:
+            Dict: Total rows deleted, delete mode and per-batch counts and timings.
+        """
+        fast_delete: bool = self.can_fast_delete()
+        started_at: float = time.perf_counter()
+        batches: List[Dict] = self.run_batches(
+            batches=self.iter_keyset_ids(), pause_seconds=pause_seconds
+        )
+        return self.build_report(
+            batches=batches, fast_delete=fast_delete, started_at=started_at
+        )
@@ -11,8 +11,7 @@ class GetModels:
     A utility class to retrieve all Django models from specified custom apps.
     """
 
-    # ? Initialize with all available custom apps by default
-    custom_apps: List[str] = GetCustomApps().get_custom_apps()
+    custom_apps: List[str]
 
     def __init__(self, custom_apps: List[str] = [], filtered_apps: List[str] = []):
         """
@@ -23,12 +22,15 @@ class GetModels:
             custom_apps (List[str], optional): A list of full app names. Defaults to an empty list.
             filtered_apps (List[str], optional): A predefined filtered list of app names. Defaults to an empty list.
         """
-        if filtered_apps:
-            self.custom_apps = filtered_apps  # ? Use the provided filtered app list
         if custom_apps:
             # ? Process and extract the final app names from the given custom apps
             custom_app_instance = GetCustomApps(custom_apps)
             self.custom_apps = custom_app_instance.get_custom_apps()
+        elif filtered_apps:
+            self.custom_apps = filtered_apps  # ? Use the provided filtered app list
+        else:
+            # ? All available custom apps, resolved when needed rather than at import
+            self.custom_apps = GetCustomApps().get_custom_apps()
 
     def get_custom_apps_models(self) -> List[Model]:
         """
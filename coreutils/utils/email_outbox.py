@@ -0,0 +1,194 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils.timezone import now as django_now
+
+from core.settings import logger
+from coreutils.models import EmailOutboxModel
+from coreutils.utils.send_emails import send_many_emails
+
+logger = logging.LoggerAdapter(logger, {"app_name": "EmailOutbox"})
+
+# ? Delivery attempts before an email is marked FAILED
+EMAIL_OUTBOX_MAX_ATTEMPTS: int = getattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 5)
+# ? Seconds before the first retry; doubled after every failed attempt
+EMAIL_OUTBOX_RETRY_BACKOFF: float = getattr(settings, "EMAIL_OUTBOX_RETRY_BACKOFF", 30)
+# ? Upper bound for the retry delay
+EMAIL_OUTBOX_MAX_BACKOFF: float = getattr(settings, "EMAIL_OUTBOX_MAX_BACKOFF", 3600)
+# ? Seconds a claimed email is reserved for its worker before another may take it
+EMAIL_OUTBOX_LEASE_SECONDS: float = getattr(settings, "EMAIL_OUTBOX_LEASE_SECONDS", 300)
+
+
+class EmailOutbox:
+    """
+    Transactional outbox for email.
+
+    `enqueue` only inserts a row, so callers write it inside the transaction
+    of the event being announced and never wait on SMTP. The worker claims
+    due rows with `SELECT ... FOR UPDATE SKIP LOCKED`, leases them by moving
+    NEXT_ATTEMPT_AT forward, sends them over one pooled SMTP session and
+    records the outcome. Failed sends are retried with exponential backoff;
+    rows of a worker that died are claimable again once the lease ends.
+    """
+
+    @classmethod
+    def enqueue(
+        cls,
+        receiver_email: List[str],
+        subject: str,
+        body: str,
+        send_after: datetime = None,
+    ) -> EmailOutboxModel:
+        """
+        Queues an email. Call inside the transaction that triggers it.
+
+        Args:
+            receiver_email (List[str]): Recipient addresses.
+            subject (str): Email subject.
+            body (str): Email body (HTML format).
+            send_after (datetime, optional): Earliest delivery time. Defaults to now.
+
+        Returns:
+            EmailOutboxModel: The queued row.
+        """
+        return EmailOutboxModel.objects.create(
+            receiver_email=list(receiver_email),
+            subject=subject,
+            body=body,
+            next_attempt_at=send_after or django_now(),
+        )
+
+    @classmethod
+    def enqueue_many(
+        cls,
+        emails: List[Dict],
+        send_after: datetime = None,
+    ) -> List[EmailOutboxModel]:
+        """
+        Queues several emails with one insert, e.g. the output of
+        `EmailTemplateRegistry.render_many`.
+
+        Args:
+            emails (List[Dict]): Each with receiver_email, subject and body.
+            send_after (datetime, optional): Earliest delivery time. Defaults to now.
+
+        Returns:
+            List[EmailOutboxModel]: The queued rows.
+        """
+        next_attempt_at: datetime = send_after or django_now()
+        return EmailOutboxModel.objects.bulk_create(
+            [
+                EmailOutboxModel(
+                    receiver_email=list(email["receiver_email"]),
+                    subject=email["subject"],
+                    body=email["body"],
+                    next_attempt_at=next_attempt_at,
+                )
+                for email in emails
+            ]
+        )
+
+    @classmethod
+    def claim_batch(cls, batch_size: int) -> List[EmailOutboxModel]:
+        """
+        Claims up to `batch_size` due emails for this worker.
+        Rows locked by another worker are skipped rather than waited on.
+        """
+        current_time: datetime = django_now()
+        with transaction.atomic():
+            emails: List[EmailOutboxModel] = list(
+                EmailOutboxModel.objects.select_for_update(skip_locked=True)
+                .filter(
+                    Q(status=EmailOutboxModel.STATUS_PENDING)
+                    | Q(status=EmailOutboxModel.STATUS_SENDING),
+                    next_attempt_at__lte=current_time,
+                )
+                .order_by("next_attempt_at")[:batch_size]
+            )
+            if emails:
+                EmailOutboxModel.objects.filter(
+                    pk__in=[email.pk for email in emails]
+                ).update(
+                    status=EmailOutboxModel.STATUS_SENDING,
+                    attempts=F("attempts") + 1,
+                    next_attempt_at=current_time
+                    + timedelta(seconds=EMAIL_OUTBOX_LEASE_SECONDS),
+                )
+        for email in emails:
+            email.attempts += 1
+        return emails
+
+    @classmethod
+    def get_retry_delay(cls, attempts: int) -> float:
+        return min(
+            EMAIL_OUTBOX_RETRY_BACKOFF * 2 ** max(attempts - 1, 0),
+            EMAIL_OUTBOX_MAX_BACKOFF,
+        )
+
+    @classmethod
+    def record_results(
+        cls, emails: List[EmailOutboxModel], results: List[Tuple[bool, str]]
+    ) -> Dict[str, int]:
+        """
+        Marks sent emails and schedules retries for the failed ones.
+        """
+        current_time: datetime = django_now()
+        counts: Dict[str, int] = {"sent": 0, "retrying": 0, "failed": 0}
+        for email, (is_sent, message) in zip(emails, results):
+            if is_sent:
+                email.status = EmailOutboxModel.STATUS_SENT
+                email.sent_at = current_time
+                email.last_error = None
+                counts["sent"] += 1
+            elif email.attempts >= EMAIL_OUTBOX_MAX_ATTEMPTS:
+                email.status = EmailOutboxModel.STATUS_FAILED
+                email.last_error = message
+                counts["failed"] += 1
+            else:
+                email.status = EmailOutboxModel.STATUS_PENDING
+                email.next_attempt_at = current_time + timedelta(
+                    seconds=cls.get_retry_delay(attempts=email.attempts)
+                )
+                email.last_error = message
+                counts["retrying"] += 1
+
+        EmailOutboxModel.objects.bulk_update(
+            emails, ["status", "sent_at", "next_attempt_at", "last_error"]
+        )
+        return counts
+
+    @classmethod
+    def process_batch(cls, batch_size: int) -> Dict[str, int]:
+        """
+        Claims, sends and records one batch.
+
+        Returns:
+            Dict[str, int]: Number of emails claimed, sent, retrying and failed.
+        """
+        emails: List[EmailOutboxModel] = cls.claim_batch(batch_size=batch_size)
+        if not emails:
+            return {"claimed": 0, "sent": 0, "retrying": 0, "failed": 0}
+
+        results: List[Tuple[bool, str]] = send_many_emails(
+            emails=[
+                {
+                    "receiver_email": email.receiver_email,
+                    "subject": email.subject,
+                    "body": email.body,
+                }
+                for email in emails
+            ]
+        )
+        counts: Dict[str, int] = cls.record_results(emails=emails, results=results)
+        logger.info(
+            "Outbox batch: %s claimed, %s sent, %s retrying, %s failed",
+            len(emails),
+            counts["sent"],
+            counts["retrying"],
+            counts["failed"],
+        )
+        return {"claimed": len(emails), **counts}
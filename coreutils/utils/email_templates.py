@@ -0,0 +1,89 @@
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+from django.template import Context, Template, engines
+from django.template.backends.base import BaseEngine
+
+# ? Folder of the email templates inside an app's templates directory
+EMAIL_TEMPLATE_DIRECTORY: str = "emails"
+
+
+class EmailTemplateRegistry:
+    """
+    Compiled email templates, loaded once per process.
+
+    An email named `<name>` is made of `emails/<name>_subject.txt` and
+    `emails/<name>.html`. Both are compiled on first use and kept for the
+    life of the process. Rendering reuses one `Context` per batch and pushes
+    each recipient's values on top of the shared ones, instead of building a
+    new context (and looking the template up again) for every message.
+    The subject is rendered without HTML escaping.
+    """
+
+    templates: Dict[str, Tuple[Template, Template]] = {}
+    lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def get(cls, name: str) -> Tuple[Template, Template]:
+        """
+        Returns the compiled (subject, body) templates of an email.
+
+        Raises:
+            TemplateDoesNotExist: If either template file is missing.
+        """
+        compiled_templates: Tuple[Template, Template] = cls.templates.get(name)
+        if compiled_templates is not None:
+            return compiled_templates
+
+        with cls.lock:
+            compiled_templates: Tuple[Template, Template] = cls.templates.get(name)
+            if compiled_templates is None:
+                engine: BaseEngine = engines["django"]
+                compiled_templates: Tuple[Template, Template] = (
+                    engine.get_template(
+                        f"{EMAIL_TEMPLATE_DIRECTORY}/{name}_subject.txt"
+                    ).template,
+                    engine.get_template(
+                        f"{EMAIL_TEMPLATE_DIRECTORY}/{name}.html"
+                    ).template,
+                )
+                cls.templates[name] = compiled_templates
+        return compiled_templates
+
+    @classmethod
+    def render_many(
+        cls,
+        name: str,
+        contexts: Iterable[Dict],
+        shared_context: Dict = None,
+    ) -> List[Tuple[str, str]]:
+        """
+        Renders an email for every recipient context.
+
+        Args:
+            name (str): Email template name.
+            contexts (Iterable[Dict]): Per-recipient values.
+            shared_context (Dict, optional): Values common to the whole batch.
+
+        Returns:
+            List[Tuple[str, str]]: (subject, body) per context, in order.
+        """
+        subject_template, body_template = cls.get(name=name)
+        subject_context: Context = Context(shared_context or {}, autoescape=False)
+        body_context: Context = Context(shared_context or {})
+
+        rendered_emails: List[Tuple[str, str]] = []
+        for context in contexts:
+            with subject_context.push(context):
+                subject: str = subject_template.render(subject_context).strip()
+            with body_context.push(context):
+                body: str = body_template.render(body_context)
+            rendered_emails.append((subject, body))
+        return rendered_emails
+
+    @classmethod
+    def render(cls, name: str, context: Dict) -> Tuple[str, str]:
+        """
+        Renders a single email and returns its (subject, body).
+        """
+        return cls.render_many(name=name, contexts=[context])[0]
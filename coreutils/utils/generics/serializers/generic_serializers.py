@@ -1,6 +1,10 @@
 from rest_framework import serializers
 from django.db.models import QuerySet, Model
 from typing import Any
+from coreutils.utils.db_utils.chunked_delete import (
+    ChunkedDeleteEngine,
+    MULTI_DELETE_BATCH_SIZE,
+)
 
 
 class CoreGenericGetQuerysetSerializer:
@@ -30,9 +34,26 @@ class CoreGenericGetQuerysetSerializer:
 class CoreGenericMultipleObjectDeleteSerializer(CoreGenericGetQuerysetSerializer):
     """
     Serializer to validate and delete multiple model instances by primary key.
+
+    Lookups and deletes are split into batches of `delete_batch_size` primary keys.
     """
 
     INCORRECT_DELETE_ID_ERROR_MESSAGE = "Incorrect Delete ID(s) provided."
+    delete_batch_size: int = MULTI_DELETE_BATCH_SIZE
+    delete_atomic: bool = False
+
+    def get_delete_engine(self) -> ChunkedDeleteEngine:
+        """
+        Builds the chunked delete engine for the serializer's queryset.
+
+        Returns:
+            ChunkedDeleteEngine: Engine configured with the serializer's batch settings.
+        """
+        return ChunkedDeleteEngine(
+            queryset=self.get_queryset(),
+            batch_size=self.delete_batch_size,
+            atomic=self.delete_atomic,
+        )
 
     def validate(self, data):
         """
@@ -47,21 +68,23 @@ class CoreGenericMultipleObjectDeleteSerializer(CoreGenericGetQuerysetSerializer
         Raises:
             ValidationError: If any delete ID does not exist.
         """
-        if self.get_queryset().filter(pk__in=data["delete_id"]).count() != len(
-            data["delete_id"]
+        if self.get_delete_engine().count_existing(ids=data["delete_id"]) != len(
+            set(data["delete_id"])
         ):
             raise serializers.ValidationError(self.INCORRECT_DELETE_ID_ERROR_MESSAGE)
         return data
 
     def create(self, validated_data):
         """
-        Deletes objects matching the validated delete IDs.
+        Deletes objects matching the validated delete IDs in batches.
 
         Args:
             validated_data (dict): Validated data with delete_id list.
 
         Returns:
-            dict: Same validated data after deletion.
+            dict: Same validated data with the per-batch delete report.
         """
-        self.get_queryset().filter(pk__in=validated_data["delete_id"]).delete()
+        validated_data["delete_report"] = self.get_delete_engine().delete(
+            ids=validated_data["delete_id"]
+        )
         return validated_data
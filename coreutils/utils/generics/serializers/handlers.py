@@ -1,12 +1,37 @@
+from coreutils.utils.generics.generic_models import CoreGenericModel
 from coreutils.utils.generics.serializers.mixins import CoreGenericBaseHandler
-from typing import Dict
+from coreutils.utils.db_utils.chunked_delete import (
+    ChunkedDeleteEngine,
+    MULTI_DELETE_BATCH_SIZE,
+)
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Field, Model
+from django.db.models.options import Options
+from rest_framework.serializers import Serializer
+from typing import Any, Dict, List, Type
+
+# ? Default number of rows written per bulk_create / bulk_update statement
+BULK_WRITE_BATCH_SIZE: int = getattr(settings, "BULK_WRITE_BATCH_SIZE", 500)
+
+# ? Audit columns of CoreGenericModel, never set from a bulk row
+CORE_GENERIC_AUDIT_FIELDS: List[str] = [
+    field.name for field in CoreGenericModel._meta.fields
+]
 
 
 class CoreGenericMultiDeleteHandler(CoreGenericBaseHandler):
     """
     Handles custom multi-delete validation and execution logic for queryset objects.
+
+    Deletion runs in batches of `delete_batch_size` primary keys, each committed
+    separately unless `delete_atomic` is set.
     """
 
+    delete_batch_size: int = MULTI_DELETE_BATCH_SIZE
+    delete_atomic: bool = False
+
     incorrect_delete_id_message: Dict = {
         "title": "Delete ID",
         "description": "One or more provided delete IDs are invalid.",
@@ -15,13 +40,356 @@ class CoreGenericMultiDeleteHandler(CoreGenericBaseHandler):
     def validate(self):
         """
         Validates whether provided delete IDs exist in the queryset.
+        Looks them up in batches of `delete_batch_size`, stopping at the first hit.
         Adds error message to data if validation fails.
         """
-        if not self.queryset.filter(pk__in=self.data["delete_id"]).exists():
+        delete_engine: ChunkedDeleteEngine = ChunkedDeleteEngine(
+            queryset=self.queryset, batch_size=self.delete_batch_size
+        )
+        if not any(
+            self.queryset.filter(pk__in=batch).exists()
+            for batch in delete_engine.chunk_ids(self.data["delete_id"])
+        ):
             self.data["error_message"] = self.incorrect_delete_id_message
 
     def create(self):
         """
-        Executes deletion of objects with provided primary keys.
+        Executes deletion of objects with provided primary keys in batches
+        and attaches the per-batch report to the data.
+        """
+        delete_engine: ChunkedDeleteEngine = ChunkedDeleteEngine(
+            queryset=self.queryset,
+            batch_size=self.delete_batch_size,
+            atomic=self.delete_atomic,
+        )
+        self.data["delete_report"] = delete_engine.delete(ids=self.data["delete_id"])
+
+
+class CoreGenericBulkHandler(CoreGenericBaseHandler):
+    """
+    Base handler for writing many rows in a single request.
+
+    Expects a list of row dicts in `self.data[rows_key]`. Every row is first
+    validated on its own through `row_serializer_class` (field-level checks only),
+    then `validate_batch` runs the set-based checks that need the database once
+    for the whole payload. Errors are collected per row index.
+
+    Without `row_serializer_class`, a row may only set the fields of
+    `get_row_fields()` (by default the model's concrete editable fields except
+    the primary key and the CoreGenericModel audit columns); values are
+    converted with the model field and other keys are reported as row errors.
+
+    The default `write()` inserts the rows with `bulk_create`;
+    `CoreGenericBulkUpdateHandler` overrides it with `bulk_update`.
+
+    Attributes:
+        rows_key (str): Key holding the rows in the payload.
+        batch_size (int): Rows per bulk statement.
+        row_serializer_class (Type[Serializer]): Optional serializer applied to each row.
+        row_fields (List[str]): Fields a row may set when there is no row serializer.
+            Defaults to the editable model fields.
+        allow_partial (bool): Write the valid rows even when other rows failed validation.
+        row_errors (Dict[int, Dict]): Validation errors keyed by row index.
+        valid_rows (Dict[int, Dict]): Validated rows keyed by row index.
+    """
+
+    rows_key: str = "rows"
+    batch_size: int = BULK_WRITE_BATCH_SIZE
+    row_serializer_class: Type[Serializer] = None
+    row_fields: List[str] = []
+    allow_partial: bool = False
+
+    row_errors: Dict[int, Dict]
+    valid_rows: Dict[int, Dict]
+    allowed_row_fields: Dict[str, Field]
+
+    rows_failed_message: Dict = {
+        "title": "Bulk validation failed",
+        "description": "One or more rows are invalid.",
+    }
+    write_failed_message: Dict = {
+        "title": "Bulk write failed",
+        "description": "The rows conflict with existing records: {error}",
+    }
+    unknown_field_message: str = "Unknown or read-only field."
+
+    def get_rows(self) -> List[Dict]:
+        """
+        Returns the raw rows from the payload.
+        """
+        return self.data.get(self.rows_key) or []
+
+    def add_row_error(self, index: int, error: Dict):
+        """
+        Records a validation error for a row. Later errors on the same field are ignored.
+
+        :param index: Index of the row in the payload
+        :param error: Mapping of field name to error description
+        """
+        row_error: Dict = self.row_errors.setdefault(index, {})
+        for field_name, description in error.items():
+            row_error.setdefault(field_name, description)
+
+    def get_row_fields(self) -> Dict[str, Field]:
+        """
+        Returns the model fields a row may set without a row serializer,
+        keyed by field name and by attname (e.g. both `user` and `user_id`).
+        """
+        model_options: Options = self.queryset.model._meta
+        if self.row_fields:
+            fields: List[Field] = [
+                model_options.get_field(field_name) for field_name in self.row_fields
+            ]
+        else:
+            fields: List[Field] = [
+                field
+                for field in model_options.concrete_fields
+                if field.editable
+                and not field.primary_key
+                and field.name not in CORE_GENERIC_AUDIT_FIELDS
+            ]
+        row_fields: Dict[str, Field] = {}
+        for field in fields:
+            row_fields[field.name] = field
+            row_fields[field.attname] = field
+        return row_fields
+
+    def clean_row(self, index: int, row: Dict) -> Dict | None:
+        """
+        Keeps the allowed fields of a row and converts their values with the model fields.
+
+        :param index: Index of the row in the payload
+        :param row: Raw row data
+        :return: Row keyed by attname, or None if a key or value is invalid
+        """
+        cleaned_row: Dict = {}
+        row_error: Dict = {}
+        for key, raw_value in row.items():
+            field: Field = self.allowed_row_fields.get(key)
+            if field is None:
+                row_error[key] = self.unknown_field_message
+                continue
+            try:
+                converted_value: Any = field.to_python(raw_value)
+            except ValidationError as error:
+                row_error[key] = error.messages[0]
+                continue
+            # ? Relations are set through their attname, so ids can be assigned
+            cleaned_row[field.attname if key == field.name else key] = converted_value
+
+        if row_error:
+            self.add_row_error(index=index, error=row_error)
+            return None
+        return cleaned_row
+
+    def validate_row(self, index: int, row: Dict) -> Dict | None:
+        """
+        Runs field-level validation for a single row.
+
+        :param index: Index of the row in the payload
+        :param row: Raw row data
+        :return: Validated row, or None if the row is invalid
+        """
+        if self.row_serializer_class is None:
+            return self.clean_row(index=index, row=row)
+
+        row_serializer: Serializer = self.row_serializer_class(
+            data=row, context={"request": self.request}
+        )
+        if row_serializer.is_valid():
+            return dict(row_serializer.validated_data)
+
+        self.add_row_error(
+            index=index,
+            error={
+                field_name: errors[0] if isinstance(errors, list) else errors
+                for field_name, errors in row_serializer.errors.items()
+            },
+        )
+        return None
+
+    def validate_batch(self, rows: Dict[int, Dict]):
+        """
+        Hook for set-based validation across all rows.
+        Implementations should query once for the whole payload and report
+        problems through `add_row_error`.
+
+        :param rows: Rows that passed field-level validation, keyed by index
+        """
+        pass
+
+    def validate(self):
+        """
+        Validates every row and then the batch as a whole.
+        Sets an error message with per-row errors unless partial writes are allowed.
         """
-        self.queryset.filter(pk__in=self.data["delete_id"]).delete()
+        self.row_errors: Dict[int, Dict] = {}
+        if self.row_serializer_class is None:
+            self.allowed_row_fields: Dict[str, Field] = self.get_row_fields()
+        rows: Dict[int, Dict] = {}
+        for index, row in enumerate(self.get_rows()):
+            validated_row: Dict | None = self.validate_row(index=index, row=row)
+            if validated_row is not None:
+                rows[index] = validated_row
+
+        if rows:
+            self.validate_batch(rows=rows)
+
+        self.valid_rows: Dict[int, Dict] = {
+            index: row for index, row in rows.items() if index not in self.row_errors
+        }
+
+        if self.row_errors and (not self.allow_partial or not self.valid_rows):
+            self.data["error_message"] = self.rows_failed_message
+            self.data["field_errors"] = {
+                self.rows_key: {
+                    str(index): error
+                    for index, error in sorted(self.row_errors.items())
+                }
+            }
+
+    def build_instance(self, row: Dict) -> Model:
+        """
+        Builds an unsaved model instance from a validated row.
+
+        :param row: Validated row data
+        :return: Unsaved model instance
+        """
+        return self.queryset.model(**row)
+
+    def write(self, rows: List[Dict]) -> int:
+        """
+        Writes the validated rows, by default inserting them with `bulk_create`.
+
+        :param rows: Validated rows in payload order
+        :return: Number of rows written
+        """
+        instances: List[Model] = [self.build_instance(row=row) for row in rows]
+        self.queryset.bulk_create(instances, batch_size=self.batch_size)
+        return len(instances)
+
+    def create(self):
+        """
+        Writes the valid rows in one transaction and replaces the payload rows
+        with a summary of the write. A constraint violation rolls the write
+        back and is reported as an error message.
+        """
+        rows: List[Dict] = [row for _, row in sorted(self.valid_rows.items())]
+        try:
+            with transaction.atomic():
+                written: int = self.write(rows=rows)
+        except IntegrityError as error:
+            return self.set_error_message(
+                error_message={
+                    "title": self.write_failed_message["title"],
+                    "description": self.write_failed_message["description"].format(
+                        error=error
+                    ),
+                }
+            )
+
+        self.data.pop(self.rows_key, None)
+        self.data["written"] = written
+        self.data["row_errors"] = {
+            str(index): error for index, error in sorted(self.row_errors.items())
+        }
+
+
+class CoreGenericBulkCreateHandler(CoreGenericBulkHandler):
+    """
+    Bulk handler that inserts rows with `bulk_create` in batches of `batch_size`,
+    the default `write()` of `CoreGenericBulkHandler`.
+    """
+
+
+class CoreGenericBulkUpdateHandler(CoreGenericBulkHandler):
+    """
+    Bulk handler that updates existing rows with `bulk_update` in batches of `batch_size`.
+
+    Every row must carry `pk_field`. The matching instances are loaded with a
+    single query during validation.
+
+    Attributes:
+        pk_field (str): Row key holding the primary key.
+        update_fields (List[str]): Fields to update. Defaults to every field present in the rows.
+        instances (Dict[Any, Model]): Instances loaded for the rows, keyed by primary key.
+    """
+
+    pk_field: str = "id"
+    update_fields: List[str] = []
+    instances: Dict[Any, Model]
+
+    incorrect_pk_message: str = "Record does not exist."
+
+    def get_row_fields(self) -> Dict[str, Field]:
+        """
+        Adds the primary key column to the fields a row may carry.
+        """
+        row_fields: Dict[str, Field] = super().get_row_fields()
+        row_fields[self.pk_field] = self.queryset.model._meta.pk
+        return row_fields
+
+    def get_row_pk(self, row: Dict) -> Any:
+        """
+        Converts the row's primary key to the model's primary key type.
+        """
+        return self.queryset.model._meta.pk.to_python(row.get(self.pk_field))
+
+    def validate_batch(self, rows: Dict[int, Dict]):
+        """
+        Loads every instance referenced by the rows in one query and reports
+        rows whose primary key is malformed or does not exist.
+        """
+        row_pks: Dict[int, Any] = {}
+        for index, row in rows.items():
+            try:
+                row_pks[index] = self.get_row_pk(row=row)
+            except ValidationError as error:
+                self.add_row_error(
+                    index=index, error={self.pk_field: error.messages[0]}
+                )
+
+        self.instances: Dict[Any, Model] = self.queryset.in_bulk(list(row_pks.values()))
+        for index, row_pk in row_pks.items():
+            if row_pk not in self.instances:
+                self.add_row_error(
+                    index=index, error={self.pk_field: self.incorrect_pk_message}
+                )
+
+    def get_update_fields(self, rows: List[Dict]) -> List[str]:
+        """
+        Returns the fields passed to `bulk_update`.
+        """
+        if self.update_fields:
+            return self.update_fields
+        field_names: Dict = {}
+        for row in rows:
+            field_names.update(dict.fromkeys(row))
+        field_names.pop(self.pk_field, None)
+        return list(field_names)
+
+    def apply_row(self, instance: Model, row: Dict, update_fields: List[str]):
+        """
+        Copies the row's values onto the instance.
+        """
+        for field_name in update_fields:
+            if field_name in row:
+                setattr(instance, field_name, row[field_name])
+
+    def write(self, rows: List[Dict]) -> int:
+        """
+        Updates the rows with `bulk_update`.
+        """
+        update_fields: List[str] = self.get_update_fields(rows=rows)
+        if not update_fields:
+            return 0
+
+        instances: List[Model] = []
+        for row in rows:
+            instance: Model = self.instances[self.get_row_pk(row=row)]
+            self.apply_row(instance=instance, row=row, update_fields=update_fields)
+            instances.append(instance)
+
+        return self.queryset.bulk_update(
+            instances, fields=update_fields, batch_size=self.batch_size
+        )
@@ -6,7 +6,11 @@ from coreutils.utils.generics.serializers.generic_serializers import (
 )
 from django.db.models.query import QuerySet
 from django.db.models import Model
+from rest_framework import serializers
 from rest_framework.request import Request
+from coreutils.utils.generics.serializers.validation_context import (
+    ValidationContextLoader,
+)
 
 
 class CoreGenericSerializerMixin(CoreGenericGetQuerysetSerializer):
@@ -44,6 +48,7 @@ class CoreGenericSerializerMixin(CoreGenericGetQuerysetSerializer):
         """
         self.set_validator()
         self.custom_validator.set_data(data=data)
+        self.custom_validator.load_validation_context()
         self.custom_validator.validate()
         self.api_data = data
 
@@ -74,6 +79,16 @@ class CoreGenericSerializerMixin(CoreGenericGetQuerysetSerializer):
         return validated_data
 
 
+class CoreGenericBulkSerializer(CoreGenericSerializerMixin, serializers.Serializer):
+    """
+    Serializer for bulk endpoints. Accepts a non-empty list of row dicts under
+    `rows`; per-row validation is left to the bulk handler so every row's
+    errors can be reported by index.
+    """
+
+    rows = serializers.ListField(child=serializers.DictField(), allow_empty=False)
+
+
 class CoreGenericBaseHandler:
     """
     Handler class for converting uploaded files to URLs and saving metadata
@@ -88,6 +103,7 @@ class CoreGenericBaseHandler:
     request: Request
     data: Dict
     queryset: QuerySet[Model]
+    validation_context: ValidationContextLoader
 
     def __init__(self, request: Request, queryset: QuerySet):
         """
@@ -107,6 +123,26 @@ class CoreGenericBaseHandler:
         """
         self.data: Dict = data
 
+    def declare_validation_context(self, context: ValidationContextLoader):
+        """
+        Hook for declaring the rows and counts the validators need.
+        Everything declared here is fetched in batch before `validate()` runs
+        and stays available through `self.validation_context` in `create()`.
+
+        :param context: Loader to declare lookups on
+        """
+        pass
+
+    def load_validation_context(self):
+        """
+        Collects the declarations of `declare_validation_context` and loads them.
+        """
+        self.validation_context: ValidationContextLoader = ValidationContextLoader(
+            request=self.request
+        )
+        self.declare_validation_context(context=self.validation_context)
+        self.validation_context.load()
+
     def check_validation_classes(
         self, validation_methods_list: List[List[Union[Callable, Dict]]]
     ) -> bool:
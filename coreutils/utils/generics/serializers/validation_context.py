@@ -0,0 +1,172 @@
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Field, Model, Q
+from django.db.models.query import QuerySet
+from rest_framework.request import Request
+
+# ? Attribute on the underlying HttpRequest that holds the loaded values
+VALIDATION_CONTEXT_REQUEST_ATTRIBUTE: str = "_validation_context_cache"
+
+
+class ValidationContextLoader:
+    """
+    Request-scoped loader for the rows and counts a handler's validators need.
+
+    Validators declare what they need up front (`declare_by_pk`,
+    `declare_by_field`, `declare_count`); `load()` then fetches everything in
+    as few queries as possible:
+
+    - lookups on the same queryset and field are merged into one `__in` query,
+    - counts on the same queryset are merged into one `aggregate()` with
+      filtered `Count` expressions.
+
+    Loaded values are memoized on the request, so `create()` and any other
+    handler running for the same request read them without querying again.
+
+    Attributes:
+        request (Request): Request the values are memoized on.
+        lookups (Dict[str, Tuple[QuerySet, str, Any]]): Pending row lookups by key.
+        counts (Dict[str, Tuple[QuerySet, Q]]): Pending counts by key.
+        results (Dict[str, Any]): Loaded values by key.
+    """
+
+    request: Request
+    lookups: Dict[str, Tuple[QuerySet, str, Any]]
+    counts: Dict[str, Tuple[QuerySet, Q]]
+    results: Dict[str, Any]
+
+    def __init__(self, request: Request):
+        """
+        Initializes the loader and attaches it to the request's memo.
+
+        Args:
+            request (Request): The incoming request.
+        """
+        self.request: Request = request
+        self.lookups: Dict[str, Tuple[QuerySet, str, Any]] = {}
+        self.counts: Dict[str, Tuple[QuerySet, Q]] = {}
+        http_request: Any = getattr(request, "_request", request)
+        if not hasattr(http_request, VALIDATION_CONTEXT_REQUEST_ATTRIBUTE):
+            setattr(http_request, VALIDATION_CONTEXT_REQUEST_ATTRIBUTE, {})
+        self.results: Dict[str, Any] = getattr(
+            http_request, VALIDATION_CONTEXT_REQUEST_ATTRIBUTE
+        )
+
+    def declare_by_pk(self, key: str, queryset: QuerySet, pk: Any):
+        """
+        Declares a row looked up by primary key.
+
+        Args:
+            key (str): Name the row is stored under.
+            queryset (QuerySet): Queryset to look the row up in.
+            pk (Any): Primary key value.
+        """
+        self.declare_by_field(key=key, queryset=queryset, field_name="pk", value=pk)
+
+    def declare_by_field(
+        self, key: str, queryset: QuerySet, field_name: str, value: Any
+    ):
+        """
+        Declares a row looked up by a unique field (email, username, ...).
+
+        Args:
+            key (str): Name the row is stored under.
+            queryset (QuerySet): Queryset to look the row up in.
+            field_name (str): Concrete field on the queryset's model.
+            value (Any): Value to match.
+        """
+        if key not in self.results:
+            self.lookups[key] = (queryset, field_name, value)
+
+    def declare_count(self, key: str, queryset: QuerySet, **filters: Any):
+        """
+        Declares a count of the queryset's rows matching the filters.
+
+        Args:
+            key (str): Name the count is stored under.
+            queryset (QuerySet): Queryset to count in.
+            **filters: Lookups the counted rows must match.
+        """
+        if key not in self.results:
+            self.counts[key] = (queryset, Q(**filters))
+
+    def get_lookup_field(self, queryset: QuerySet, field_name: str) -> Field:
+        """
+        Returns the model field used for a lookup.
+        """
+        if field_name == "pk":
+            return queryset.model._meta.pk
+        return queryset.model._meta.get_field(field_name)
+
+    def load_lookups(self):
+        """
+        Fetches every pending lookup, one query per queryset and field.
+        """
+        groups: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        for key, (queryset, field_name, _) in self.lookups.items():
+            groups[(str(queryset.query), field_name)].append(key)
+
+        for keys in groups.values():
+            queryset, field_name, _ = self.lookups[keys[0]]
+            field: Field = self.get_lookup_field(
+                queryset=queryset, field_name=field_name
+            )
+
+            # ? Normalize values so they compare equal to the loaded attributes
+            values: Dict[str, Any] = {}
+            for key in keys:
+                try:
+                    values[key] = field.to_python(self.lookups[key][2])
+                except ValidationError:
+                    self.results[key] = None
+
+            rows: Dict[Any, Model] = {
+                getattr(row, field.attname): row
+                for row in queryset.filter(
+                    **{f"{field_name}__in": set(values.values())}
+                )
+            }
+            for key, lookup_value in values.items():
+                self.results[key] = rows.get(lookup_value)
+        self.lookups: Dict[str, Tuple[QuerySet, str, Any]] = {}
+
+    def load_counts(self):
+        """
+        Fetches every pending count, one aggregate query per queryset.
+        """
+        groups: Dict[str, List[str]] = defaultdict(list)
+        for key, (queryset, _) in self.counts.items():
+            groups[str(queryset.query)].append(key)
+
+        for keys in groups.values():
+            queryset: QuerySet = self.counts[keys[0]][0]
+            self.results.update(
+                queryset.order_by().aggregate(
+                    **{key: Count("pk", filter=self.counts[key][1]) for key in keys}
+                )
+            )
+        self.counts: Dict[str, Tuple[QuerySet, Q]] = {}
+
+    def load(self):
+        """
+        Fetches everything declared since the last load.
+        """
+        if self.lookups:
+            self.load_lookups()
+        if self.counts:
+            self.load_counts()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Returns a loaded row, or `default` when it does not exist.
+        """
+        result: Any = self.results.get(key)
+        return default if result is None else result
+
+    def get_count(self, key: str) -> int:
+        """
+        Returns a loaded count, 0 if it was never declared.
+        """
+        return self.results.get(key) or 0
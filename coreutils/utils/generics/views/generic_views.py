@@ -4,16 +4,19 @@ from coreutils.utils.generics.views.queryset import (
     CoreGenericQueryset,
     CoreGenericQuerysetInstance,
 )
+from django.http import StreamingHttpResponse
+from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.serializers import Serializer
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from coreutils.utils.generics.views.process_view import (
     CoreGenericProcessDataAPIView,
     CoreGenericProcessDataModelSerializerAPIView,
 )
 from coreutils.utils.generics.views.core_generic_utils import CoreGenericUtils
+from coreutils.utils.generics.views.streaming import CoreGenericJSONStream
 
 
 class CoreGenericListAPIView(CoreGenericQueryset):
@@ -22,9 +25,86 @@ class CoreGenericListAPIView(CoreGenericQueryset):
 
     This class expects a valid queryset and a serializer class.
     It handles pagination and returns serialized data accordingly.
+    A `?fields=` parameter trims the serialized fields and the loaded columns.
+
+    Large responses can be streamed row by row (`stream_response = True` or
+    `?stream=true`) instead of being rendered in one piece.
     """
 
     queryset: QuerySet[Model]
+    # ? Streaming mode for large pages and exports
+    stream_response: bool = False
+    stream_param_name: str = "stream"
+    stream_paginate: bool = True
+    stream_chunk_size: int = 500
+
+    def is_streaming_requested(self) -> bool:
+        """
+        Checks whether the response should be streamed.
+
+        Returns:
+            bool: True if the view streams by default or `?stream=true` was passed.
+        """
+        stream_param: str = str(self.get_params().get(self.stream_param_name, ""))
+        return self.stream_response or stream_param.lower() in ("1", "true")
+
+    def get_streaming_page(self, queryset: QuerySet[Model]) -> Tuple[QuerySet, Dict]:
+        """
+        Slices the queryset for limit/offset pagination without evaluating it.
+
+        Args:
+            queryset (QuerySet[Model]): Filtered queryset.
+
+        Returns:
+            Tuple[QuerySet, Dict]: The page queryset and its pagination keys (count, next, previous).
+        """
+        paginator: LimitOffsetPagination = self.paginator
+        if not self.stream_paginate or not isinstance(paginator, LimitOffsetPagination):
+            return queryset, {}
+
+        paginator.request = self.request
+        paginator.limit = paginator.get_limit(self.request)
+        if paginator.limit is None:
+            return queryset, {}
+
+        paginator.offset = paginator.get_offset(self.request)
+        paginator.count = paginator.get_count(queryset)
+        page_queryset: QuerySet[Model] = queryset[
+            paginator.offset : paginator.offset + paginator.limit
+        ]
+        return page_queryset, {
+            "count": paginator.count,
+            "next": paginator.get_next_link(),
+            "previous": paginator.get_previous_link(),
+        }
+
+    def get_streaming_response(
+        self, queryset: QuerySet[Model]
+    ) -> StreamingHttpResponse:
+        """
+        Streams the envelope and then each serialized row from a queryset iterator.
+
+        Args:
+            queryset (QuerySet[Model]): Filtered queryset.
+
+        Returns:
+            StreamingHttpResponse: JSON response written incrementally.
+        """
+        page_queryset, pagination = self.get_streaming_page(queryset=queryset)
+
+        serializer: Serializer = self.get_serializer(context=self.set_context_data())
+        self.apply_sparse_fieldset(serializer)
+        self.report_missing_joins(queryset=queryset, serializer=serializer)
+
+        json_stream: CoreGenericJSONStream = CoreGenericJSONStream(
+            # ? Same envelope as the paginated (non-streamed) response
+            envelope=pagination,
+            rows=page_queryset.iterator(chunk_size=self.stream_chunk_size),
+            serialize_row=serializer.to_representation,
+        )
+        return StreamingHttpResponse(
+            json_stream.iter_chunks(), content_type="application/json"
+        )
 
     def list(self, request: Request, *args: List, **kwargs: Dict):
         """
@@ -43,6 +123,10 @@ class CoreGenericListAPIView(CoreGenericQueryset):
                 )
             # ? Get paginated queryset from CoreGenericQueryset
             queryset = self.filter_queryset(self.get_queryset())
+            # ? Load only the columns needed by a requested ?fields= subset
+            queryset = self.apply_sparse_queryset(queryset)
+            if self.is_streaming_requested():
+                return self.get_streaming_response(queryset=queryset)
             paginated_queryset: QuerySet[Model] = self.paginate_queryset(queryset)
 
             # ? Prepare context for serializer (can include request/user/etc.)
@@ -52,6 +136,8 @@ class CoreGenericListAPIView(CoreGenericQueryset):
             serializer: Serializer = self.get_serializer(
                 paginated_queryset, context=context, many=True
             )
+            self.apply_sparse_fieldset(serializer)
+            self.report_missing_joins(queryset=queryset, serializer=serializer)
 
             # ? Return paginated response with serialized data
             return self.get_paginated_response(serializer.data)
@@ -98,7 +184,9 @@ class CoreGenericGetAPIView(CoreGenericQueryset, CoreGenericQuerysetInstance):
                 )
             # ? Fetch queryset or single object
             if self.many:
-                queryset: QuerySet[Model] = self.filter_queryset(self.get_queryset())
+                queryset: QuerySet[Model] = self.apply_sparse_queryset(
+                    self.filter_queryset(self.get_queryset())
+                )
             else:
                 queryset: Model = self.get_object()
 
@@ -107,11 +195,26 @@ class CoreGenericGetAPIView(CoreGenericQueryset, CoreGenericQuerysetInstance):
             serializer: Serializer = self.get_serializer(
                 queryset, context=context, many=self.many
             )
+            self.apply_sparse_fieldset(serializer)
+            if self.many:
+                self.report_missing_joins(queryset=queryset, serializer=serializer)
 
             return self.success_response(validated_data=serializer.data)
         except Exception as e:
             return self.custom_handle_exception(e)
 
+    def get_object(self) -> Model:
+        """
+        Retrieves the single instance, loading only the columns needed by a
+        requested ?fields= subset.
+
+        Returns:
+            Model: A single model instance matching the filter.
+        """
+        return self.apply_sparse_queryset(self.get_queryset()).get(
+            **self.get_filterset_for_pk()
+        )
+
 
 class CoreGenericGetDataFromSerializerAPIView(
     CoreGenericGetAPIView, CoreGenericQueryset, CoreGenericProcessDataAPIView
@@ -194,6 +297,50 @@ class CoreGenericListCreateAPIView(CoreGenericCreateAPIView, CoreGenericListAPIV
     """
 
 
+class CoreGenericBulkCreateAPIView(
+    CoreGenericProcessDataAPIView,
+    CoreGenericUtils,
+):
+    """
+    Generic POST API for creating many objects in one request.
+
+    Pair with a `CoreGenericBulkSerializer` whose handler extends
+    `CoreGenericBulkCreateHandler`; rows are validated together and
+    written with `bulk_create` in batches.
+    """
+
+    def post(self, request: Request, *args: List, **kwargs: Dict):
+        """
+        POST handler that passes the rows through the bulk handler.
+        """
+        return self.handle_request()
+
+
+class CoreGenericBulkUpdateAPIView(
+    CoreGenericProcessDataAPIView,
+    CoreGenericUtils,
+):
+    """
+    Generic PUT/PATCH API for updating many objects in one request.
+
+    Pair with a `CoreGenericBulkSerializer` whose handler extends
+    `CoreGenericBulkUpdateHandler`; instances are loaded with one query and
+    written with `bulk_update` in batches.
+    """
+
+    def put(self, request: Request, *args: List, **kwargs: Dict):
+        """
+        PUT handler that passes the rows through the bulk handler.
+        """
+        return self.handle_request()
+
+    def patch(self, request: Request, *args: List, **kwargs: Dict):
+        """
+        PATCH handler that passes the rows through the bulk handler.
+        """
+        return self.handle_request()
+
+
 class CoreGenericPutAPIView(
     CoreGenericProcessDataAPIView,
     CoreGenericUtils,
@@ -117,6 +117,9 @@ class CoreGenericProcessDataAPIView(CoreGenericUtils):
         validated_data.pop("remove_serializer_errors", None)
         # ? Delegate logic to serializer's create method
         response_data: Dict = serializer_class.create(validated_data)
+        # ? Handlers may still fail while writing (e.g. a constraint violation)
+        if isinstance(response_data, dict) and response_data.get("error_message"):
+            return self.validation_response(validated_data=response_data)
         return self.success_response(validated_data=response_data)
 
     def handle_request(self) -> Response:
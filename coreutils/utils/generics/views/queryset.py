@@ -1,13 +1,24 @@
-from django.db.models import Model
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Field, Model, Prefetch
+from django.db.models.options import Options
 from django.db.models.query import QuerySet
-from typing import Dict, Any, Union
+from rest_framework import serializers
+from rest_framework.serializers import Serializer
+from typing import Dict, Any, List, Set, Tuple, Type, Union
 from coreutils.utils.generics.views.core_generic_utils import CoreGenericUtils
 
+# ? (view class, relation path) pairs already reported by report_missing_joins
+REPORTED_MISSING_JOINS: Set[Tuple[Type, str]] = set()
+
 
 class CoreGenericQueryset(CoreGenericUtils):
     """
     Utility class that extends CoreGenericUtils to provide
     ordering and queryset handling for list-based views.
+
+    Joins are declared on the view through `select_related_fields`,
+    `prefetch_fields` and `annotate_fields` and applied to every queryset.
     """
 
     # ? Query parameter name to specify ordering
@@ -15,6 +26,12 @@ class CoreGenericQueryset(CoreGenericUtils):
     queryset: QuerySet  # ? Should be overridden by subclass or view
     default_ordering_field: str = "-core_generic_created_at"  # ? Default ordering
     rename_sorting_params: dict = {}
+    # ? Query parameter name to request a subset of serializer fields (?fields=id,name)
+    fields_param_name: str = "fields"
+    # ? Query optimization hints applied by get_optimized_queryset
+    select_related_fields: List[str] = []
+    prefetch_fields: List[Union[str, Prefetch]] = []
+    annotate_fields: Dict[str, Any] = {}
 
     def get_ordering_dict(self) -> Union[str, None]:
         """
@@ -31,14 +48,35 @@ class CoreGenericQueryset(CoreGenericUtils):
             )
         return self.default_ordering_field
 
+    def get_optimized_queryset(self, queryset: QuerySet) -> QuerySet:
+        """
+        Applies the declared `select_related_fields`, `prefetch_fields`
+        and `annotate_fields` to the queryset.
+
+        Args:
+            queryset (QuerySet): Base queryset.
+
+        Returns:
+            QuerySet: Queryset with joins, prefetches and annotations applied.
+        """
+        if self.select_related_fields:
+            queryset = queryset.select_related(*self.select_related_fields)
+        if self.prefetch_fields:
+            queryset = queryset.prefetch_related(*self.prefetch_fields)
+        if self.annotate_fields:
+            queryset = queryset.annotate(**self.annotate_fields)
+        return queryset
+
     def get_queryset_order_by(self) -> QuerySet:
         """
-        Applies ordering to the queryset.
+        Applies the declared query optimizations and ordering to the queryset.
 
         Returns:
             QuerySet: Ordered queryset based on ordering field.
         """
-        return self.queryset.order_by(self.get_ordering_dict())
+        return self.get_optimized_queryset(self.queryset).order_by(
+            self.get_ordering_dict()
+        )
 
     def get_queryset(self) -> QuerySet:
         """
@@ -59,6 +97,319 @@ class CoreGenericQueryset(CoreGenericUtils):
         """
         return self.get_queryset()
 
+    def get_requested_fields(self) -> List[str]:
+        """
+        Retrieves the sparse fieldset requested through `fields_param_name`.
+
+        Returns:
+            List[str]: Requested field names, empty when every field is wanted.
+        """
+        fields: str = self.get_params().get(self.fields_param_name) or ""
+        return [field.strip() for field in fields.split(",") if field.strip()]
+
+    def get_serializer_fields(self, serializer: Serializer) -> Dict:
+        """
+        Returns the field mapping of a serializer, unwrapping list serializers.
+
+        Args:
+            serializer (Serializer): A serializer or list serializer instance.
+
+        Returns:
+            Dict: Field name to serializer field mapping.
+        """
+        return getattr(serializer, "child", serializer).fields
+
+    def get_sparse_field_names(self, serializer: Serializer) -> List[str]:
+        """
+        Returns the serializer fields kept for the requested sparse fieldset.
+        Unknown names are ignored; when none of the requested names exist
+        every field is kept.
+
+        Args:
+            serializer (Serializer): A serializer or list serializer instance.
+
+        Returns:
+            List[str]: Kept field names, empty when no trimming applies.
+        """
+        requested_fields: List[str] = self.get_requested_fields()
+        if not requested_fields:
+            return []
+        return [
+            field_name
+            for field_name in self.get_serializer_fields(serializer)
+            if field_name in requested_fields
+        ]
+
+    def apply_sparse_fieldset(self, serializer: Serializer) -> Serializer:
+        """
+        Removes every field that was not requested from the serializer, so
+        expensive method fields are never evaluated.
+
+        Args:
+            serializer (Serializer): A serializer or list serializer instance.
+
+        Returns:
+            Serializer: The same serializer with trimmed fields.
+        """
+        kept_fields: List[str] = self.get_sparse_field_names(serializer)
+        if not kept_fields:
+            return serializer
+
+        fields: Dict = self.get_serializer_fields(serializer)
+        for field_name in list(fields):
+            if field_name not in kept_fields:
+                fields.pop(field_name)
+        return serializer
+
+    def get_sparse_field_paths(
+        self, serializer: Serializer, field_name: str
+    ) -> List[str] | None:
+        """
+        Returns the model paths a serializer field reads from.
+
+        Method fields and `source="*"` fields cannot be introspected; they declare
+        their paths in the serializer's `sparse_field_sources` mapping
+        (e.g. {"available_slots": ["id"]}).
+
+        Args:
+            serializer (Serializer): The (child) serializer owning the field.
+            field_name (str): Name of the serializer field.
+
+        Returns:
+            List[str] | None: ORM paths, or None when the field's sources are unknown.
+        """
+        field: serializers.Field = serializer.fields[field_name]
+        if isinstance(field, serializers.SerializerMethodField) or field.source == "*":
+            return getattr(serializer, "sparse_field_sources", {}).get(field_name)
+        return ["__".join(field.source_attrs)]
+
+    def get_sparse_field_roots(
+        self, queryset: QuerySet, serializer: Serializer
+    ) -> Set[str] | None:
+        """
+        Computes the top-level model fields read by the kept serializer fields.
+
+        Args:
+            queryset (QuerySet): The queryset about to be serialized.
+            serializer (Serializer): Serializer instance used to introspect the fields.
+
+        Returns:
+            Set[str] | None: Model field names, or None if the needed fields are unknown.
+        """
+        child_serializer: Serializer = getattr(serializer, "child", serializer)
+        model_meta: Options = queryset.model._meta
+        field_roots: Set[str] = set()
+
+        for field_name in self.get_sparse_field_names(child_serializer):
+            field_paths: List[str] | None = self.get_sparse_field_paths(
+                serializer=child_serializer, field_name=field_name
+            )
+            if field_paths is None:
+                return None
+            for field_path in field_paths:
+                field_root: str = field_path.split("__")[0]
+                try:
+                    model_meta.get_field(field_root)
+                except FieldDoesNotExist:
+                    # ? Properties or model methods: the needed columns are unknown
+                    return None
+                field_roots.add(field_root)
+        return field_roots
+
+    def apply_sparse_queryset(self, queryset: QuerySet) -> QuerySet:
+        """
+        Restricts the loaded columns and joins to the ones needed by the
+        requested fields. `select_related` and `prefetch_related` lookups of
+        relations that are not requested are dropped.
+
+        Args:
+            queryset (QuerySet): The queryset about to be serialized.
+
+        Returns:
+            QuerySet: Narrowed queryset, or unchanged when no fieldset is requested.
+        """
+        if not self.get_requested_fields() or queryset.query.select_related is True:
+            return queryset
+
+        serializer: Serializer = self.get_serializer_class()(
+            context=self.set_context_data()
+        )
+        field_roots: Set[str] | None = self.get_sparse_field_roots(
+            queryset=queryset, serializer=serializer
+        )
+        if not field_roots:
+            return queryset
+
+        model_meta: Options = queryset.model._meta
+        select_related_paths: List[str] = [
+            path
+            for path in self.get_select_related_paths(queryset=queryset)
+            if path.split("__")[0] in field_roots
+        ]
+        prefetch_lookups: List[Union[str, Prefetch]] = [
+            lookup
+            for lookup in queryset._prefetch_related_lookups
+            if self.get_prefetch_path(lookup=lookup).split("__")[0] in field_roots
+        ]
+        only_fields: Set[str] = {model_meta.pk.name} | {
+            field_root
+            for field_root in field_roots
+            if model_meta.get_field(field_root).concrete
+        }
+
+        queryset = queryset.select_related(None).prefetch_related(None)
+        if select_related_paths:
+            queryset = queryset.select_related(*select_related_paths)
+        if prefetch_lookups:
+            queryset = queryset.prefetch_related(*prefetch_lookups)
+        return queryset.only(*only_fields)
+
+    def get_select_related_paths(self, queryset: QuerySet) -> List[str]:
+        """
+        Flattens the queryset's `select_related` tree into lookup paths.
+
+        Args:
+            queryset (QuerySet): Queryset to inspect.
+
+        Returns:
+            List[str]: Deepest `select_related` paths, e.g. ["slot__slot_id"].
+        """
+        paths: List[str] = []
+
+        def flatten(tree: Dict, prefix: str):
+            for relation_name, subtree in tree.items():
+                path: str = f"{prefix}{relation_name}"
+                if subtree:
+                    flatten(tree=subtree, prefix=f"{path}__")
+                else:
+                    paths.append(path)
+
+        if isinstance(queryset.query.select_related, dict):
+            flatten(tree=queryset.query.select_related, prefix="")
+        return paths
+
+    def get_prefetch_path(self, lookup: Union[str, Prefetch]) -> str:
+        """
+        Returns the lookup path of a prefetch entry.
+        """
+        if isinstance(lookup, Prefetch):
+            return lookup.prefetch_through
+        return lookup
+
+    def get_relation_path(self, model: Type[Model], field_path: str) -> str:
+        """
+        Returns the part of a field path that traverses relations.
+
+        Args:
+            model (Type[Model]): Model the path starts from.
+            field_path (str): ORM path such as "classes__title".
+
+        Returns:
+            str: Relation part of the path (e.g. "classes"), empty if no relation is traversed.
+        """
+        relation_names: List[str] = []
+        for field_name in field_path.split("__"):
+            try:
+                model_field: Field = model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                break
+            if not model_field.is_relation or model_field.related_model is None:
+                break
+            relation_names.append(field_name)
+            model: Type[Model] = model_field.related_model
+        return "__".join(relation_names)
+
+    def get_serializer_relation_paths(
+        self, serializer: Serializer, model: Type[Model], prefix: str = ""
+    ) -> Set[str]:
+        """
+        Collects the relation paths read by a serializer's declared sources,
+        including nested serializers and `sparse_field_sources` of method fields.
+
+        Args:
+            serializer (Serializer): Serializer (or list serializer) to inspect.
+            model (Type[Model]): Model the serializer reads from.
+            prefix (str, optional): Path of the serializer inside its parent.
+
+        Returns:
+            Set[str]: Relation paths such as {"classes", "slot__slot_id"}.
+        """
+        child_serializer: Serializer = getattr(serializer, "child", serializer)
+        relation_paths: Set[str] = set()
+
+        for field_name, field in child_serializer.fields.items():
+            field_paths: List[str] = (
+                self.get_sparse_field_paths(
+                    serializer=child_serializer, field_name=field_name
+                )
+                or []
+            )
+            for field_path in field_paths:
+                relation_path: str = self.get_relation_path(
+                    model=model, field_path=field_path
+                )
+                if not relation_path:
+                    continue
+                relation_paths.add(f"{prefix}{relation_path}")
+
+                nested_serializer: Serializer = getattr(field, "child", field)
+                if isinstance(nested_serializer, serializers.BaseSerializer):
+                    related_model: Type[Model] = model
+                    for relation_name in relation_path.split("__"):
+                        related_model = related_model._meta.get_field(
+                            relation_name
+                        ).related_model
+                    relation_paths |= self.get_serializer_relation_paths(
+                        serializer=nested_serializer,
+                        model=related_model,
+                        prefix=f"{prefix}{relation_path}__",
+                    )
+        return relation_paths
+
+    def report_missing_joins(self, queryset: QuerySet, serializer: Serializer):
+        """
+        In DEBUG, logs relation paths the serializer reads that the queryset
+        neither `select_related` nor prefetches. Each view reports a given
+        path only once per process.
+
+        Args:
+            queryset (QuerySet): The queryset being serialized.
+            serializer (Serializer): The serializer that will render it.
+        """
+        if not settings.DEBUG or not isinstance(queryset, QuerySet):
+            return
+
+        joined_paths: List[str] = [
+            *self.get_select_related_paths(queryset=queryset),
+            *[
+                self.get_prefetch_path(lookup=lookup)
+                for lookup in queryset._prefetch_related_lookups
+            ],
+        ]
+        missing_paths: List[str] = sorted(
+            relation_path
+            for relation_path in self.get_serializer_relation_paths(
+                serializer=serializer, model=queryset.model
+            )
+            if not any(
+                joined_path == relation_path
+                or joined_path.startswith(f"{relation_path}__")
+                for joined_path in joined_paths
+            )
+            and (type(self), relation_path) not in REPORTED_MISSING_JOINS
+        )
+        if not missing_paths:
+            return
+
+        REPORTED_MISSING_JOINS.update(
+            (type(self), relation_path) for relation_path in missing_paths
+        )
+        self.get_logger().warning(
+            f"{type(self).__name__} serializes relations without a join: "
+            f"{', '.join(missing_paths)}. Add them to select_related_fields "
+            "or prefetch_fields."
+        )
+
     def get_paginate_queryset(self) -> QuerySet[Model]:
         """
         Paginates the filtered and ordered queryset using DRF's pagination mechanism.
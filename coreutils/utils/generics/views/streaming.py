@@ -0,0 +1,100 @@
+import json
+import logging
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+from core.settings import logger
+
+logger = logging.LoggerAdapter(logger, {"app_name": "CoreGenericJSONStream"})
+
+
+class CoreGenericJSONStream:
+    """
+    Incrementally encodes a list response as JSON.
+
+    The envelope (message, pagination keys) is written first, followed by the
+    `results` array whose rows are serialized one at a time from an iterator,
+    so memory use depends on `buffer_rows` rather than on the number of rows.
+
+    Attributes:
+        envelope (Dict): Top-level keys written before `results`.
+        rows (Iterable): Model instances (or any objects) to serialize.
+        serialize_row (Callable): Converts one row into JSON-compatible data.
+        buffer_rows (int): Number of encoded rows joined into one chunk.
+    """
+
+    envelope: Dict
+    rows: Iterable
+    serialize_row: Callable[[Any], Any]
+    buffer_rows: int
+    encoder: json.JSONEncoder
+
+    def __init__(
+        self,
+        envelope: Dict,
+        rows: Iterable,
+        serialize_row: Callable[[Any], Any],
+        buffer_rows: int = 100,
+    ):
+        """
+        Initializes the stream.
+
+        Args:
+            envelope (Dict): Top-level keys written before `results`.
+            rows (Iterable): Rows to serialize, ideally a queryset iterator.
+            serialize_row (Callable): Converts one row into JSON-compatible data.
+            buffer_rows (int, optional): Rows per yielded chunk. Defaults to 100.
+        """
+        self.envelope: Dict = envelope
+        self.rows: Iterable = rows
+        self.serialize_row: Callable[[Any], Any] = serialize_row
+        self.buffer_rows: int = max(1, buffer_rows)
+        # ? Match the output format of DRF's JSONRenderer
+        self.encoder: json.JSONEncoder = JSONEncoder(
+            ensure_ascii=not api_settings.UNICODE_JSON,
+            separators=(",", ":") if api_settings.COMPACT_JSON else (", ", ": "),
+            allow_nan=not api_settings.STRICT_JSON,
+        )
+
+    def encode(self, data: Any) -> str:
+        """
+        Encodes a value with the stream's JSON encoder.
+        """
+        return self.encoder.encode(data)
+
+    def get_envelope_prefix(self) -> bytes:
+        """
+        Returns the opening of the document up to and including `"results":[`.
+        """
+        envelope: str = self.encode(self.envelope)
+        separator: str = "," if self.envelope else ""
+        return f'{envelope[:-1]}{separator}"results":['.encode()
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """
+        Yields the encoded document in chunks of `buffer_rows` rows.
+
+        Yields:
+            bytes: Next part of the JSON document.
+        """
+        yield self.get_envelope_prefix()
+
+        buffer: List[str] = []
+        is_first_chunk: bool = True
+        try:
+            for row in self.rows:
+                buffer.append(self.encode(self.serialize_row(row)))
+                if len(buffer) >= self.buffer_rows:
+                    yield (("" if is_first_chunk else ",") + ",".join(buffer)).encode()
+                    buffer: List[str] = []
+                    is_first_chunk: bool = False
+        except Exception as e:
+            # ? Headers are already sent; the truncated body signals the failure
+            logger.error("Streaming response failed: %s", str(e))
+            raise
+
+        if buffer:
+            yield (("" if is_first_chunk else ",") + ",".join(buffer)).encode()
+        yield b"]}"
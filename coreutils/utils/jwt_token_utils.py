@@ -1,8 +1,9 @@
+import hashlib
 import jwt
-from datetime import datetime
+from datetime import datetime, timezone
 import logging
 from core.settings import logger
-from typing import Dict
+from typing import Dict, Union
 
 logger = logging.LoggerAdapter(logger, {"app_name": __name__})
 
@@ -13,6 +14,28 @@ class JwtTokenUtils:
     def __init__(self, jwt_token: str):
         self.jwt_token = jwt_token
 
+    @staticmethod
+    def hash_token(jwt_token: str) -> str:
+        """
+        Returns the fixed-length SHA-256 hex digest of a JWT, used to look tokens up by index.
+        """
+        return hashlib.sha256(jwt_token.encode("utf-8")).hexdigest()
+
+    def get_token_hash(self) -> str:
+        """
+        Returns the digest of this token.
+        """
+        return self.hash_token(self.jwt_token)
+
+    def get_expires_at(self) -> Union[datetime, None]:
+        """
+        Returns the token's `exp` claim as an aware datetime, or None if it cannot be read.
+        """
+        exp_timestamp: Union[int, None] = self.decrypt_jwt_token().get("exp")
+        if exp_timestamp is None:
+            return None
+        return datetime.fromtimestamp(exp_timestamp, tz=timezone.utc)
+
     def decrypt_jwt_token(self) -> Dict:
         """
         This method will decode the JWT token and return its payload without verifying its signature.
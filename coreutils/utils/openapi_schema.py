@@ -0,0 +1,134 @@
+import hashlib
+import logging
+import os
+import threading
+from typing import Dict, List, Tuple
+
+from django.conf import settings
+from drf_yasg import openapi
+
+from core.settings import logger
+
+logger = logging.LoggerAdapter(logger, {"app_name": "OpenAPISchema"})
+
+# ? Folder the deploy step writes schema.json and schema.yaml to
+OPENAPI_SCHEMA_DIRECTORY: str = getattr(
+    settings, "OPENAPI_SCHEMA_DIRECTORY", os.path.join(settings.BASE_DIR, "openapi")
+)
+
+OPENAPI_INFO: openapi.Info = openapi.Info(
+    title="Your Project API",
+    default_version="v1",
+    description="API documentation for Your Project",
+    terms_of_service="https://www.example.com/terms/",
+    contact=openapi.Contact(email="contact@example.com"),
+    license=openapi.License(name="BSD License"),
+)
+
+
+class PrecomputedOpenAPISchema:
+    """
+    The OpenAPI document, generated once and served from memory.
+
+    `write` introspects every view and serializer and stores the encoded
+    schema on disk; it is run by the `generate_openapi_schema` command on
+    deploy. Each process reads the files once, on first use, and keeps the
+    bytes with their ETag. If no file exists the schema is generated in
+    the process instead, once, so it never depends on the request rate.
+    """
+
+    # ? URL format -> (file name, content type)
+    FORMATS: Dict[str, Tuple[str, str]] = {
+        ".json": ("schema.json", "application/json"),
+        ".yaml": ("schema.yaml", "application/yaml"),
+    }
+
+    documents: Dict[str, Tuple[bytes, str]] = {}
+    lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def generate(cls) -> Dict[str, bytes]:
+        """
+        Introspects the API and returns the encoded schema for every format.
+        """
+        # ? Imported here: generation is a deploy step, not part of worker startup
+        from drf_yasg.codecs import OpenAPICodecJson, OpenAPICodecYaml
+        from drf_yasg.generators import OpenAPISchemaGenerator
+        from rest_framework.request import Request
+        from rest_framework.test import APIRequestFactory
+
+        # ? An empty url leaves host and schemes out, so clients use the serving host
+        generator: OpenAPISchemaGenerator = OpenAPISchemaGenerator(
+            info=OPENAPI_INFO, url=""
+        )
+        # ? Views build their serializers from the request, so introspect with one
+        request: Request = Request(APIRequestFactory().get("/swagger.json"))
+        schema: openapi.Swagger = generator.get_schema(request=request, public=True)
+        return {
+            ".json": OpenAPICodecJson(validators=[]).encode(schema),
+            ".yaml": OpenAPICodecYaml(validators=[]).encode(schema),
+        }
+
+    @classmethod
+    def write(cls, directory: str = OPENAPI_SCHEMA_DIRECTORY) -> List[str]:
+        """
+        Generates the schema and writes one file per format.
+        Files are replaced atomically, so running workers never read a partial file.
+
+        Returns:
+            List[str]: Paths of the written files.
+        """
+        os.makedirs(directory, exist_ok=True)
+        file_paths: List[str] = []
+        for schema_format, content in cls.generate().items():
+            file_path: str = os.path.join(directory, cls.FORMATS[schema_format][0])
+            with open(f"{file_path}.tmp", "wb") as schema_file:
+                schema_file.write(content)
+            os.replace(f"{file_path}.tmp", file_path)
+            file_paths.append(file_path)
+
+        # ? Swapped, not cleared, so a concurrent `get` never sees a partial dict
+        with cls.lock:
+            cls.documents: Dict[str, Tuple[bytes, str]] = {}
+        return file_paths
+
+    @classmethod
+    def load(cls) -> Dict[str, bytes]:
+        """
+        Reads the precomputed files, generating the schema if any is missing.
+        """
+        contents: Dict[str, bytes] = {}
+        try:
+            for schema_format, (file_name, _) in cls.FORMATS.items():
+                with open(
+                    os.path.join(OPENAPI_SCHEMA_DIRECTORY, file_name), "rb"
+                ) as schema_file:
+                    contents[schema_format] = schema_file.read()
+        except FileNotFoundError:
+            logger.warning(
+                "No precomputed OpenAPI schema in %s, generating it. "
+                "Run `manage.py generate_openapi_schema` on deploy.",
+                OPENAPI_SCHEMA_DIRECTORY,
+            )
+            contents: Dict[str, bytes] = cls.generate()
+        return contents
+
+    @classmethod
+    def get(cls, schema_format: str) -> Tuple[bytes, str]:
+        """
+        Returns the (content, etag) of the schema in the given format.
+
+        Raises:
+            KeyError: If the format is not one of FORMATS.
+        """
+        # ? Read once: the dict is only ever replaced whole, never filled in place
+        documents: Dict[str, Tuple[bytes, str]] = cls.documents
+        if not documents:
+            with cls.lock:
+                if not cls.documents:
+                    cls.documents: Dict[str, Tuple[bytes, str]] = {
+                        key: (content, f'"{hashlib.sha256(content).hexdigest()}"')
+                        for key, content in cls.load().items()
+                    }
+                documents: Dict[str, Tuple[bytes, str]] = cls.documents
+        return documents[schema_format]
@@ -0,0 +1,248 @@
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    BasePasswordHasher,
+    PBKDF2PasswordHasher,
+    get_hasher,
+    make_password,
+)
+
+from core.settings import logger
+
+# ? Worker processes import this module before `django.setup()`, so no models at import time
+if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractBaseUser
+
+logger = logging.LoggerAdapter(logger, {"app_name": "PasswordHashingExecutor"})
+
+# ? Maximum number of password hashes computed at the same time
+PASSWORD_HASH_MAX_CONCURRENCY: int = getattr(
+    settings, "PASSWORD_HASH_MAX_CONCURRENCY", os.cpu_count() or 1
+)
+# ? Seconds a request waits for a hashing slot before it is rejected
+PASSWORD_HASH_QUEUE_TIMEOUT: float = getattr(
+    settings, "PASSWORD_HASH_QUEUE_TIMEOUT", 5.0
+)
+# ? Worker processes used to hash passwords in bulk (imports, migrations of users)
+PASSWORD_HASH_POOL_WORKERS: int = getattr(
+    settings, "PASSWORD_HASH_POOL_WORKERS", os.cpu_count() or 1
+)
+# ? Start method of the bulk hashing pool; "spawn" never forks a multithreaded process
+PASSWORD_HASH_POOL_START_METHOD: str = getattr(
+    settings, "PASSWORD_HASH_POOL_START_METHOD", "spawn"
+)
+# ? Passwords sent to a worker process per task
+PASSWORD_HASH_POOL_CHUNK_SIZE: int = getattr(
+    settings, "PASSWORD_HASH_POOL_CHUNK_SIZE", 50
+)
+
+
+class PasswordHashingBusyError(Exception):
+    """
+    Raised when no hashing slot frees up within PASSWORD_HASH_QUEUE_TIMEOUT.
+    """
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 hasher whose work factor comes from PASSWORD_HASH_ITERATIONS.
+
+    It keeps the `pbkdf2_sha256` algorithm name, so existing hashes still
+    verify, and Django's `must_update` compares the stored iteration count
+    with the configured one: after the setting changes, every successful
+    `check_password` transparently re-hashes the password.
+    """
+
+    iterations: int = getattr(
+        settings, "PASSWORD_HASH_ITERATIONS", PBKDF2PasswordHasher.iterations
+    )
+
+
+def setup_hashing_worker():
+    """
+    Initializer of the bulk hashing pool: a spawned worker starts with a
+    fresh interpreter, so Django is set up before any task is unpickled.
+    """
+    django.setup()
+
+
+def hash_password_chunk(
+    hasher: BasePasswordHasher, raw_passwords: List[str]
+) -> List[str]:
+    """
+    Hashes a chunk of passwords inside a worker process.
+    Module level so it can be pickled by `ProcessPoolExecutor`.
+    """
+    return [
+        hasher.encode(raw_password, hasher.salt()) for raw_password in raw_passwords
+    ]
+
+
+class PasswordHashingExecutor:
+    """
+    Admission control for CPU-heavy password hashing.
+
+    At most PASSWORD_HASH_MAX_CONCURRENCY hashes run at once; further callers
+    wait up to PASSWORD_HASH_QUEUE_TIMEOUT for a slot and are then rejected
+    with PasswordHashingBusyError. A burst of logins therefore queues behind
+    a fixed number of hashing slots instead of occupying every request thread,
+    and other endpoints stay responsive.
+
+    Queue depth, rejections and wait/hash latencies are tracked for
+    `get_metrics()`.
+    """
+
+    slots: threading.BoundedSemaphore = threading.BoundedSemaphore(
+        PASSWORD_HASH_MAX_CONCURRENCY
+    )
+    metrics_lock: threading.Lock = threading.Lock()
+    metrics: Dict[str, float] = {
+        "waiting": 0,
+        "running": 0,
+        "completed": 0,
+        "rejected": 0,
+        "total_wait_ms": 0.0,
+        "total_hash_ms": 0.0,
+        "max_wait_ms": 0.0,
+        "max_hash_ms": 0.0,
+    }
+
+    @classmethod
+    def update_metrics(cls, **increments: float):
+        with cls.metrics_lock:
+            for key, increment in increments.items():
+                cls.metrics[key] += increment
+
+    @classmethod
+    def record_max(cls, key: str, value: float):
+        with cls.metrics_lock:
+            cls.metrics[key] = max(cls.metrics[key], value)
+
+    @classmethod
+    def run(cls, function: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Runs a hashing function once a slot is free.
+
+        Args:
+            function (Callable): Function that performs the hashing.
+            *args, **kwargs: Arguments for the function.
+
+        Returns:
+            Any: The function's return value.
+
+        Raises:
+            PasswordHashingBusyError: If no slot frees up within the queue timeout.
+        """
+        queued_at: float = time.perf_counter()
+        cls.update_metrics(waiting=1)
+        acquired: bool = cls.slots.acquire(timeout=PASSWORD_HASH_QUEUE_TIMEOUT)
+        wait_ms: float = (time.perf_counter() - queued_at) * 1000
+        cls.update_metrics(waiting=-1)
+
+        if not acquired:
+            cls.update_metrics(rejected=1)
+            logger.warning("Password hashing rejected after %.0f ms in queue", wait_ms)
+            raise PasswordHashingBusyError()
+
+        cls.update_metrics(running=1, total_wait_ms=wait_ms)
+        cls.record_max("max_wait_ms", wait_ms)
+        started_at: float = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            hash_ms: float = (time.perf_counter() - started_at) * 1000
+            cls.slots.release()
+            cls.update_metrics(running=-1, completed=1, total_hash_ms=hash_ms)
+            cls.record_max("max_hash_ms", hash_ms)
+
+    @classmethod
+    def check_password(
+        cls, user_instance: "AbstractBaseUser", raw_password: str
+    ) -> bool:
+        """
+        Checks a user's password, re-hashing it if the configured work factor changed.
+        """
+        return cls.run(user_instance.check_password, raw_password)
+
+    @classmethod
+    def make_password(cls, raw_password: str) -> str:
+        """
+        Hashes a raw password with the default hasher.
+        """
+        return cls.run(make_password, raw_password)
+
+    @classmethod
+    def make_passwords(
+        cls, raw_passwords: List[str], max_workers: int = 1
+    ) -> List[str]:
+        """
+        Hashes many passwords with the default hasher, optionally across worker processes.
+
+        PBKDF2 holds the GIL for most of its run, so threads do not help; with
+        `max_workers` above 1 the passwords are split into chunks and hashed in
+        a process pool instead. The pool uses PASSWORD_HASH_POOL_START_METHOD
+        and sets Django up in every worker. It is meant for bulk jobs run from
+        a command: request handlers keep the default of 1 and hash in the
+        calling thread, since starting processes from a multithreaded server
+        is unsafe. The hasher instance is sent to the workers, so its iteration
+        count (PASSWORD_HASH_ITERATIONS) applies there too. This does not take
+        the request admission slots.
+
+        Args:
+            raw_passwords (List[str]): Passwords to hash.
+            max_workers (int): Worker processes to use, e.g. PASSWORD_HASH_POOL_WORKERS.
+
+        Returns:
+            List[str]: Encoded passwords in input order.
+        """
+        hasher: BasePasswordHasher = get_hasher("default")
+        chunks: List[List[str]] = [
+            raw_passwords[start : start + PASSWORD_HASH_POOL_CHUNK_SIZE]
+            for start in range(0, len(raw_passwords), PASSWORD_HASH_POOL_CHUNK_SIZE)
+        ]
+        if max_workers <= 1 or len(chunks) <= 1:
+            return [
+                encoded
+                for chunk in chunks
+                for encoded in hash_password_chunk(hasher, chunk)
+            ]
+
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(chunks)),
+            mp_context=multiprocessing.get_context(PASSWORD_HASH_POOL_START_METHOD),
+            initializer=setup_hashing_worker,
+        ) as pool:
+            hashed_chunks: List[List[str]] = list(
+                pool.map(hash_password_chunk, [hasher] * len(chunks), chunks)
+            )
+        return [encoded for chunk in hashed_chunks for encoded in chunk]
+
+    @classmethod
+    def get_metrics(cls) -> Dict[str, float]:
+        """
+        Returns a snapshot of the executor's counters with average latencies.
+        """
+        with cls.metrics_lock:
+            metrics: Dict[str, float] = dict(cls.metrics)
+        completed: float = metrics["completed"] or 1
+        return {
+            "max_concurrency": PASSWORD_HASH_MAX_CONCURRENCY,
+            "queue_timeout_seconds": PASSWORD_HASH_QUEUE_TIMEOUT,
+            "iterations": TunablePBKDF2PasswordHasher.iterations,
+            "queue_depth": metrics["waiting"],
+            "running": metrics["running"],
+            "completed": metrics["completed"],
+            "rejected": metrics["rejected"],
+            "avg_wait_ms": round(metrics["total_wait_ms"] / completed, 3),
+            "avg_hash_ms": round(metrics["total_hash_ms"] / completed, 3),
+            "max_wait_ms": round(metrics["max_wait_ms"], 3),
+            "max_hash_ms": round(metrics["max_hash_ms"], 3),
+        }
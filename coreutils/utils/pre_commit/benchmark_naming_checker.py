@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, List
+
+# Run as a script; make the project importable
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+from coreutils.utils.pre_commit.check_duplicate_class_names import (  # noqa: E402
+    find_python_files,
+)
+from coreutils.utils.pre_commit.file_cache import PreCommitFileCache  # noqa: E402
+from coreutils.utils.pre_commit.precommit_check_variable_naming import (  # noqa: E402
+    check_variable_naming,
+)
+
+
+def run_case(label: str, run: Callable[[], int], file_count: int, repeat: int):
+    """
+    Print the best of `repeat` runs of one case.
+    :param label: Case name.
+    :param run: Runs the case and returns the number of errors found.
+    :param file_count: Files checked per run.
+    :param repeat: Number of runs.
+    """
+    durations: List[float] = []
+    for _ in range(repeat):
+        started_at: float = time.perf_counter()
+        error_count: int = run()
+        durations.append(time.perf_counter() - started_at)
+    duration: float = min(durations)
+    print(
+        f"{label:<28} {duration * 1000:>9.1f} ms "
+        f"{file_count / duration:>9.0f} files/s {error_count:>5} errors"
+    )
+
+
+def main() -> None:
+    """
+    Benchmark the naming checker on the repository's Python files:
+    sequentially without cache, on a cold cache (parallel) and on a warm cache.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-workers", type=int, default=None)
+    arguments: argparse.Namespace = parser.parse_args()
+
+    file_paths: List[str] = find_python_files()
+    print(f"{len(file_paths)} Python files, {os.cpu_count()} CPUs")
+
+    def run_sequential() -> int:
+        return sum(len(check_variable_naming(file_path)) for file_path in file_paths)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+
+        def run_cached(clear: bool) -> int:
+            cache: PreCommitFileCache = PreCommitFileCache(
+                namespace="variable_naming_benchmark", cache_dir=cache_dir
+            )
+            if clear:
+                cache.clear()
+            errors_per_file: dict = cache.map(
+                file_paths=file_paths,
+                compute=check_variable_naming,
+                max_workers=arguments.max_workers,
+                prune=False,
+            )
+            return sum(len(errors) for errors in errors_per_file.values())
+
+        run_case(
+            "sequential, no cache", run_sequential, len(file_paths), arguments.repeat
+        )
+        run_case(
+            "cold cache (parallel)",
+            lambda: run_cached(clear=True),
+            len(file_paths),
+            arguments.repeat,
+        )
+        run_case(
+            "warm cache",
+            lambda: run_cached(clear=False),
+            len(file_paths),
+            arguments.repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,23 @@
 #!/usr/bin/env python3
 
+import argparse
 import ast
 import os
 import sys
+import time
 from collections import defaultdict
 from typing import List, Dict
 
+# ? Run as a script by pre-commit; make the project importable for the shared cache
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+from coreutils.utils.pre_commit.file_cache import (  # noqa: E402
+    PreCommitFileCache,
+    hash_file,
+)
+
 # Root directory to start scanning
 PROJECT_DIR: str = os.getcwd()
 
@@ -35,27 +47,41 @@ def find_classes_in_file(filepath: str) -> List[str]:
     ]
 
 
-def scan_project_for_classes() -> Dict[str, List[str]]:
+def find_python_files() -> List[str]:
     """
-    Scan the entire project directory for classes and map class names to their file locations.
-    :return: A dictionary where keys are class names and values are lists of file paths where the class is found.
+    List the Python files of the project.
+    :return: Paths of the Python files, skipping migrations, virtual environments and caches.
     """
-    class_map: Dict[str, List[str]] = defaultdict(list)
-
-    for root, _, files in os.walk(PROJECT_DIR):
+    python_files: List[str] = []
+    for root, dirs, files in os.walk(PROJECT_DIR):
         # Optional: skip migrations or virtual environments
         if "migrations" in root or "venv" in root or "__pycache__" in root:
             continue
+        # Hidden folders (.git, .pre_commit_cache, ...) are not walked
+        dirs[:] = [folder for folder in dirs if not folder.startswith(".")]
 
         for file in files:
             if file.endswith(PYTHON_FILE_EXTENSIONS):
-                # type hint for filepath (str)
-                filepath: str = os.path.join(root, file)
-                class_names: List[str] = find_classes_in_file(
-                    filepath
-                )  # type hint for class_names (List[str])
-                for name in class_names:
-                    class_map[name].append(filepath)
+                python_files.append(os.path.join(root, file))
+    return python_files
+
+
+def scan_project_for_classes(
+    cache: PreCommitFileCache,
+) -> Dict[str, List[str]]:
+    """
+    Scan the entire project directory for classes and map class names to their file locations.
+    Only files changed since the last run are parsed, in a process pool; the rest come from the cache.
+    :param cache: Class index cache, keyed by file path.
+    :return: A dictionary where keys are class names and values are lists of file paths where the class is found.
+    """
+    class_map: Dict[str, List[str]] = defaultdict(list)
+    classes_per_file: Dict[str, List[str]] = cache.map(
+        file_paths=find_python_files(), compute=find_classes_in_file
+    )
+    for filepath, class_names in classes_per_file.items():
+        for name in class_names:
+            class_map[name].append(filepath)
 
     return class_map
 
@@ -65,8 +91,25 @@ def main() -> None:
     Main function to check for duplicate class names in the project.
     If duplicates are found, block the commit; otherwise, allow it.
     """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    # The whole project is always scanned; the staged files pre-commit passes are ignored
+    parser.add_argument("filenames", nargs="*")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Drop the class index first."
+    )
+    arguments: argparse.Namespace = parser.parse_args()
+
+    started_at: float = time.perf_counter()
+    # The hook's own source is the version, so editing it drops stale results
+    cache: PreCommitFileCache = PreCommitFileCache(
+        namespace="duplicate_class_names",
+        version=hash_file(file_path=__file__),
+    )
+    if arguments.no_cache:
+        cache.clear()
+
     duplicates_found: bool = False  # type hint for duplicates_found (bool)
-    class_map: Dict[str, List[str]] = scan_project_for_classes()
+    class_map: Dict[str, List[str]] = scan_project_for_classes(cache=cache)
 
     for class_name, locations in class_map.items():
         if len(locations) > 1:
@@ -75,6 +118,11 @@ def main() -> None:
             for loc in locations:
                 print(f"  - {loc}")
 
+    print(
+        f"Scanned {len(cache.entries)} files ({cache.stale_count} parsed, "
+        f"{len(cache.entries) - cache.stale_count} cached) "
+        f"in {(time.perf_counter() - started_at) * 1000:.1f} ms"
+    )
     if duplicates_found:
         print("\nCommit blocked due to duplicate class names.")
         sys.exit(1)
@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List
+
+# ? Cache folder, shared by every pre-commit hook (one file per hook)
+PRE_COMMIT_CACHE_DIR: str = os.path.join(os.getcwd(), ".pre_commit_cache")
+
+# ? Below this many files to (re)compute, the pool costs more than it saves
+PRE_COMMIT_POOL_MIN_FILES: int = 16
+
+
+def hash_file(file_path: str) -> str:
+    """
+    SHA-256 of a file's content.
+    """
+    with open(file_path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+class PreCommitFileCache:
+    """
+    Persistent per-file results for pre-commit hooks.
+
+    Each hook keeps its own namespace, stored as JSON in PRE_COMMIT_CACHE_DIR
+    and mapping a file path to its mtime, size, content hash and the hook's
+    result for that file. A result is reused while the file's mtime and size
+    are unchanged. If they changed but the content hash did not (e.g. after
+    a checkout), the result is kept and only the stat is updated. Everything
+    else is recomputed, in a process pool when there are enough files.
+
+    Attributes:
+        namespace (str): Hook name, used as the cache file name.
+        version (str): Version of the hook's per-file logic, e.g. a hash of its
+            source; a change drops the cache.
+        cache_path (str): JSON file holding the namespace.
+        entries (Dict[str, Dict]): Cached entries keyed by file path.
+        stale_count (int): Files recomputed by the last `map` call.
+    """
+
+    namespace: str
+    version: str
+    cache_path: str
+    entries: Dict[str, Dict]
+    stale_count: int = 0
+
+    def __init__(
+        self,
+        namespace: str,
+        version: str = "1",
+        cache_dir: str = PRE_COMMIT_CACHE_DIR,
+    ):
+        self.namespace = namespace
+        self.version = version
+        self.cache_path = os.path.join(cache_dir, f"{namespace}.json")
+        self.entries = self.load()
+
+    def load(self) -> Dict[str, Dict]:
+        """
+        Reads the namespace from disk; a missing, corrupt or outdated cache is empty.
+        """
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as cache_file:
+                cache: Dict = json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+        if cache.get("version") != self.version:
+            return {}
+        return cache.get("entries", {})
+
+    def save(self):
+        """
+        Writes the namespace to disk, replacing the previous file atomically.
+        """
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        with open(f"{self.cache_path}.tmp", "w", encoding="utf-8") as cache_file:
+            json.dump({"version": self.version, "entries": self.entries}, cache_file)
+        os.replace(f"{self.cache_path}.tmp", self.cache_path)
+
+    def clear(self):
+        self.entries = {}
+        if os.path.exists(self.cache_path):
+            os.remove(self.cache_path)
+
+    def get_stale_files(self, file_paths: List[str]) -> List[str]:
+        """
+        Returns the files whose cached result cannot be reused.
+        """
+        stale_files: List[str] = []
+        for file_path in file_paths:
+            entry: Dict = self.entries.get(file_path)
+            stat: os.stat_result = os.stat(file_path)
+            if entry is None:
+                stale_files.append(file_path)
+            elif (
+                entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size
+            ):
+                continue
+            elif entry["sha256"] == hash_file(file_path=file_path):
+                # ? Touched but unchanged, keep the result
+                entry["mtime_ns"] = stat.st_mtime_ns
+                entry["size"] = stat.st_size
+            else:
+                stale_files.append(file_path)
+        return stale_files
+
+    def update(self, file_path: str, result: Any):
+        stat: os.stat_result = os.stat(file_path)
+        self.entries[file_path] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": hash_file(file_path=file_path),
+            "result": result,
+        }
+
+    def map(
+        self,
+        file_paths: List[str],
+        compute: Callable[[str], Any],
+        max_workers: int = None,
+        prune: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Returns `compute(file_path)` for every file, computing only stale ones.
+
+        `compute` must be a module-level function returning JSON data, so it
+        can run in worker processes. The cache is saved afterwards.
+
+        Args:
+            file_paths (List[str]): Files to get results for.
+            compute (Callable[[str], Any]): Per-file computation.
+            max_workers (int, optional): Pool size. Defaults to the CPU count.
+            prune (bool): Drop entries of files not in `file_paths`, for hooks
+                that always get the whole project. Otherwise only entries of
+                deleted files are dropped.
+
+        Returns:
+            Dict[str, Any]: Result per file path.
+        """
+        stale_files: List[str] = self.get_stale_files(file_paths=file_paths)
+        if len(stale_files) >= PRE_COMMIT_POOL_MIN_FILES:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results: List[Any] = list(
+                    executor.map(
+                        compute,
+                        stale_files,
+                        chunksize=max(
+                            1, len(stale_files) // ((os.cpu_count() or 1) * 4)
+                        ),
+                    )
+                )
+        else:
+            results: List[Any] = [compute(file_path) for file_path in stale_files]
+        for file_path, result in zip(stale_files, results):
+            self.update(file_path=file_path, result=result)
+
+        if prune:
+            wanted_files: set = set(file_paths)
+            self.entries = {
+                file_path: entry
+                for file_path, entry in self.entries.items()
+                if file_path in wanted_files
+            }
+        else:
+            self.entries = {
+                file_path: entry
+                for file_path, entry in self.entries.items()
+                if os.path.exists(file_path)
+            }
+        self.save()
+        self.stale_count = len(stale_files)
+        return {
+            file_path: self.entries[file_path]["result"] for file_path in file_paths
+        }
@@ -1,6 +1,17 @@
+import ast
+import os
 import re
 import sys
-import os
+
+# Run as a script by pre-commit; make the project importable for the shared cache
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+from coreutils.utils.pre_commit.file_cache import (  # noqa: E402
+    PreCommitFileCache,
+    hash_file,
+)
 
 SNAKE_CASE_REGEX: re.Pattern = re.compile(r"^[a-z_][a-z0-9_]*$")
 BAD_NAMES: set[str] = {"x", "temp", "data", "value"}
@@ -17,11 +28,6 @@ EXCLUDED_FILES: list[str] = [
 ]
 EXCLUDED_FOLDERS: list[str] = ["migrations", "project_utils"]
 
-# Regex to detect function/method definitions
-FUNCTION_DEF_REGEX: re.Pattern = re.compile(
-    r"^\s*(def|class)\s+[a-zA-Z_][a-zA-Z0-9_]*\s*\("
-)
-
 
 def should_skip_file(file_path: str) -> bool:
     """Check if the file should be skipped (models.py or any migration file)."""
@@ -31,31 +37,128 @@ def should_skip_file(file_path: str) -> bool:
     )
 
 
-def is_function_call(line: str) -> bool:
-    """Check if the line contains a function call."""
-    return "(" in line and ")" in line and "=" not in line.split("(")[0]
-
-
-def skip_parentheses_content(lines: list[str]) -> list[str]:
-    """Remove all content inside parentheses (including multi-line content)."""
-    result = []
-    paren_level = 0
-
-    for line in lines:
-        line = line.strip()
-        if "(" in line:
-            paren_level += line.count("(")
-        if ")" in line:
-            paren_level -= line.count(")")
-
-        # If inside parentheses, skip this line
-        if paren_level > 0:
-            continue
-
-        # Otherwise, add this line to result
-        result.append(line)
-
-    return result
+def contains_call(node: ast.AST) -> bool:
+    """Check if an expression calls anything."""
+    return any(isinstance(child, ast.Call) for child in ast.walk(node))
+
+
+class NamingVisitor(ast.NodeVisitor):
+    """
+    Checks a module's names in one pass over its AST.
+
+    Assignment targets, attributes (assigned to or declared in a class body)
+    and function arguments must be snake_case; all-uppercase names are
+    constants and skipped. Variables must also avoid BAD_NAMES, which is not
+    applied to arguments and attributes because those often follow an
+    inherited interface (e.g. `validate(self, data)`, `self.data`).
+    A plain assignment to a single name needs a type hint unless its value
+    calls something. Names bound by loops, `with ... as`, `except ... as`,
+    walrus expressions and comprehensions cannot be annotated and are only
+    checked for their spelling.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path: str = file_path
+        self.errors: list[str] = []
+        self.in_class_body: bool = False
+
+    def add_error(self, node: ast.AST, message: str):
+        self.errors.append(f"{self.file_path}:{node.lineno} - {message}")
+
+    def check_name(self, name: str, node: ast.AST, kind: str):
+        # Ignore all-uppercase names (constants like BASE_DIR, SECRET_KEY, etc.)
+        if name.isupper():
+            return
+        if not SNAKE_CASE_REGEX.match(name):
+            self.add_error(node, f"{kind} '{name}' should be in snake_case.")
+        if kind == "Variable" and name in BAD_NAMES:
+            self.add_error(
+                node, f"{kind} '{name}' is too generic; use a meaningful name."
+            )
+
+    def check_target(self, target: ast.AST, requires_type_hint: bool):
+        if isinstance(target, ast.Name):
+            kind: str = "Attribute" if self.in_class_body else "Variable"
+            self.check_name(target.id, target, kind)
+            if requires_type_hint and not target.id.isupper():
+                self.add_error(target, f"{kind} '{target.id}' is missing a type hint.")
+        elif isinstance(target, ast.Attribute):
+            self.check_name(target.attr, target, "Attribute")
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            # Unpacked names cannot be annotated
+            for element in target.elts:
+                self.check_target(element, requires_type_hint=False)
+        elif isinstance(target, ast.Starred):
+            self.check_target(target.value, requires_type_hint=False)
+
+    def visit_scope(self, node: ast.AST, in_class_body: bool):
+        outer_scope: bool = self.in_class_body
+        self.in_class_body = in_class_body
+        self.generic_visit(node)
+        self.in_class_body = outer_scope
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self.visit_scope(node, in_class_body=True)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        self.visit_scope(node, in_class_body=False)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
+        self.visit_scope(node, in_class_body=False)
+
+    def visit_Lambda(self, node: ast.Lambda):
+        self.visit_scope(node, in_class_body=False)
+
+    def visit_Assign(self, node: ast.Assign):
+        requires_type_hint: bool = len(node.targets) == 1 and not contains_call(
+            node.value
+        )
+        for target in node.targets:
+            self.check_target(target, requires_type_hint=requires_type_hint)
+        self.generic_visit(node)
+
+    def visit_AnnAssign(self, node: ast.AnnAssign):
+        self.check_target(node.target, requires_type_hint=False)
+        self.generic_visit(node)
+
+    def visit_For(self, node: ast.For):
+        self.check_target(node.target, requires_type_hint=False)
+        self.generic_visit(node)
+
+    def visit_AsyncFor(self, node: ast.AsyncFor):
+        self.check_target(node.target, requires_type_hint=False)
+        self.generic_visit(node)
+
+    def visit_withitem(self, node: ast.withitem):
+        if node.optional_vars is not None:
+            self.check_target(node.optional_vars, requires_type_hint=False)
+        self.generic_visit(node)
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler):
+        # The bound name is a plain string, not a Name node
+        if node.name is not None:
+            self.check_name(node.name, node, "Variable")
+        self.generic_visit(node)
+
+    def visit_NamedExpr(self, node: ast.NamedExpr):
+        self.check_target(node.target, requires_type_hint=False)
+        self.generic_visit(node)
+
+    def visit_comprehension(self, node: ast.comprehension):
+        self.check_target(node.target, requires_type_hint=False)
+        self.generic_visit(node)
+
+    def visit_arguments(self, node: ast.arguments):
+        for argument in [
+            *node.posonlyargs,
+            *node.args,
+            node.vararg,
+            *node.kwonlyargs,
+            node.kwarg,
+        ]:
+            if argument is not None:
+                self.check_name(argument.arg, argument, "Argument")
+        self.generic_visit(node)
 
 
 def check_variable_naming(file_path: str) -> list[str]:
@@ -63,76 +166,33 @@ def check_variable_naming(file_path: str) -> list[str]:
     if should_skip_file(file_path):
         return []
 
-    errors: list[str] = []
-    inside_function: bool = False
-
     with open(file_path, "r", encoding="utf-8") as file:
-        lines = file.readlines()
-        lines = skip_parentheses_content(lines)
+        try:
+            tree: ast.Module = ast.parse(file.read(), filename=file_path)
+        except SyntaxError as error:
+            return [f"{file_path}:{error.lineno} - Syntax error: {error.msg}"]
 
-        for line_number, line in enumerate(lines, start=1):
-            line = line.strip()
-
-            # Skip comments and empty lines
-            if not line or line.startswith("#"):
-                continue
-
-            # Detect function/method/class definitions
-            if FUNCTION_DEF_REGEX.match(line):
-                inside_function = True
-                continue
-
-            # Exit function/class scope if we encounter an empty line or return to global scope
-            if inside_function and (not line or not line.startswith((" ", "\t"))):
-                inside_function = False
-
-            # Skip function calls completely
-            if is_function_call(line):
-                continue
-
-            # Skip lines with function calls on the right side of assignment
-            if "=" in line and ("(" in line.split("=")[1] or ")" in line.split("=")[1]):
-                continue
-
-            # Check for variable assignments
-            if "=" in line and not line.lstrip().startswith(("def ", "class ")):
-                # Split on = and get the left part
-                var_part = line.split("=")[0].strip()
-
-                # Handle type hints by splitting on :
-                var_name = var_part.split(":")[0].strip()
-
-                # Ignore all-uppercase variables (constants like BASE_DIR, SECRET_KEY, etc.)
-                if var_name.isupper():
-                    continue
-
-                if var_name.isidentifier():  # Ensure it's a valid Python identifier
-                    if not SNAKE_CASE_REGEX.match(var_name):
-                        errors.append(
-                            f"{file_path}:{line_number} - Variable '{var_name}' should be in snake_case."
-                        )
-                    if var_name in BAD_NAMES:
-                        errors.append(
-                            f"{file_path}:{line_number} - Variable '{var_name}' is too generic; use a meaningful name."
-                        )
-
-                    # Check for missing type hints
-                    if ":" not in var_part:
-                        errors.append(
-                            f"{file_path}:{line_number} - Variable '{var_name}' is missing a type hint."
-                        )
-
-    return errors
+    visitor: NamingVisitor = NamingVisitor(file_path)
+    visitor.visit(tree)
+    return visitor.errors
 
 
 def main() -> None:
     """Main function to check all Python files passed as arguments."""
-    filenames: list[str] = sys.argv[1:]
-    all_errors: list[str] = []
-
-    for file in filenames:
-        if file.endswith(".py"):  # Only check Python files
-            all_errors.extend(check_variable_naming(file))
+    # Only check Python files
+    filenames: list[str] = [file for file in sys.argv[1:] if file.endswith(".py")]
+    # The checker's own source is the version, so editing it drops stale results
+    cache: PreCommitFileCache = PreCommitFileCache(
+        namespace="variable_naming",
+        version=hash_file(file_path=__file__),
+    )
+    # Files are checked in parallel; unchanged ones come from the cache
+    errors_per_file: dict[str, list[str]] = cache.map(
+        file_paths=filenames, compute=check_variable_naming, prune=False
+    )
+    all_errors: list[str] = [
+        error for file in filenames for error in errors_per_file[file]
+    ]
 
     if all_errors:
         for error in all_errors:
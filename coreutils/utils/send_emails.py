@@ -1,16 +1,119 @@
 from core.settings import logger
 from core import settings
-from email import encoders
-from email.mime.base import MIMEBase
+from coreutils.utils.smtp_transport import SMTPTransport
+from coreutils.utils.streaming_email import StreamingEmailMessage
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-import smtplib
+from typing import Dict, List, Tuple
 import logging
 
 # Configure logger with application name
 logger = logging.LoggerAdapter(logger, {"app_name": "send_an_email"})
 
 
+def build_email_message(
+    sender_email,
+    receiver_email,
+    subject,
+    body,
+    file_name=None,
+    file_path=None,
+):
+    """
+    Builds the MIME message for an email with an optional attachment.
+    With an attachment, a StreamingEmailMessage is returned so the file is
+    encoded and sent in chunks instead of being read into memory.
+
+    Args:
+        sender_email (str): Address used in the From header.
+        receiver_email (list): List of recipient email addresses.
+        subject (str): Email subject.
+        body (str): Email body (HTML format).
+        file_name (str, optional): Name of the file attachment. Defaults to None.
+        file_path (str, optional): Full path to the file attachment. Defaults to None.
+
+    Returns:
+        MIMEMultipart | StreamingEmailMessage: The message, ready to be serialized or streamed.
+    """
+    # Create an instance of MIMEMultipart for constructing the email
+    msg = MIMEMultipart()
+    msg["Subject"] = subject
+    msg["From"] = sender_email
+    msg["To"] = ", ".join(receiver_email)
+
+    # Attach the email body
+    msg.attach(MIMEText(body, "html"))
+
+    # Attach file if provided
+    if file_path is not None:
+        return StreamingEmailMessage(msg=msg, file_name=file_name, file_path=file_path)
+    return msg
+
+
+def get_sender_credentials(login_user_name=None, login_user_pass=None):
+    """
+    Returns the sender address and password, preferring custom login credentials.
+    """
+    if None not in [login_user_name, login_user_pass]:
+        return login_user_name, login_user_pass
+    return settings.SMTP_SENDER_EMAIL, settings.SMTP_PASSWORD
+
+
+def send_many_emails(
+    emails: List[Dict],
+    login_user_name=None,
+    login_user_pass=None,
+) -> List[Tuple[bool, str]]:
+    """
+    Sends several emails over one pooled SMTP session.
+
+    Args:
+        emails (List[Dict]): Keyword arguments of `build_email_message` per email
+            (receiver_email, subject, body and optionally file_name, file_path).
+        login_user_name (str, optional): SMTP username for authentication. Defaults to None.
+        login_user_pass (str, optional): SMTP password for authentication. Defaults to None.
+
+    Returns:
+        List[Tuple[bool, str]]: (success, message) per email, in order.
+    """
+    smtp_sender_email, smtp_password = get_sender_credentials(
+        login_user_name=login_user_name, login_user_pass=login_user_pass
+    )
+    logger.info(
+        "SMTP Config: Server=%s, Port=%s, Sender=%s",
+        settings.SMTP_SERVER,
+        settings.SMTP_PORT,
+        smtp_sender_email,
+    )
+
+    results: List[Tuple[bool, str]] = []
+    messages: List[Dict] = []
+    message_indexes: List[int] = []
+    for index, email in enumerate(emails):
+        try:
+            msg = build_email_message(sender_email=smtp_sender_email, **email)
+        except Exception as e:
+            logger.error("Email sending failed: %s", str(e))
+            results.append((False, str(e)))
+            continue
+        results.append((False, "Not sent"))
+        message_indexes.append(index)
+        if not isinstance(msg, StreamingEmailMessage):
+            msg = msg.as_string()
+        messages.append({"to_addrs": email["receiver_email"], "message": msg})
+
+    transport: SMTPTransport = SMTPTransport.for_sender(
+        username=smtp_sender_email, password=smtp_password
+    )
+    for index, result in zip(message_indexes, transport.send_many(messages=messages)):
+        results[index] = result
+        if result[0]:
+            logger.info(
+                "Email successfully sent to %s", emails[index]["receiver_email"]
+            )
+    return results
+
+
 def send_an_email(
     receiver_email,
     subject,
@@ -21,7 +124,7 @@ def send_an_email(
     login_user_pass=None,
 ):
     """
-    Sends an email with optional attachments.
+    Sends an email with optional attachments over a pooled SMTP connection.
 
     Args:
         receiver_email (list): List of recipient email addresses.
@@ -35,71 +138,16 @@ def send_an_email(
     Returns:
         tuple: (bool, str) indicating success or failure message.
     """
-    try:
-        # Create an instance of MIMEMultipart for constructing the email
-        msg = MIMEMultipart()
-        msg["Subject"] = subject
-
-        # Retrieve SMTP configuration from settings
-        smtp_server: str = settings.SMTP_SERVER
-        smtp_port: int = settings.SMTP_PORT
-        msg["From"] = smtp_sender_email = settings.SMTP_SENDER_EMAIL
-        smtp_password: str = settings.SMTP_PASSWORD
-
-        # If custom login credentials are provided, override default SMTP settings
-        if None not in [login_user_name, login_user_pass]:
-            msg["From"] = smtp_sender_email = login_user_name
-            smtp_password: str = login_user_pass
-
-        logger.info(
-            "SMTP Config: Server=%s, Port=%s, Sender=%s",
-            smtp_server,
-            smtp_port,
-            smtp_sender_email,
-        )
-
-        # Attach the email body
-        msg.attach(MIMEText(body, "html"))
-
-        # Attach file if provided
-        if file_path is not None:
-            with open(file_path, "rb") as attachment:
-                p = MIMEBase("application", "octet-stream")
-                p.set_payload(attachment.read())
-                encoders.encode_base64(p)
-                p.add_header("Content-Disposition", f"attachment; filename={file_name}")
-                msg.attach(p)
-
-        # Establish SMTP session
-        if settings.EMAIL_CONNECTION == "TLS":
-            s = smtplib.SMTP(smtp_server, smtp_port)
-            logger.info("SMTP TLS connection established")
-            # ? start TLS for security
-            s.starttls()
-            logger.info("TLS session started")
-        else:
-            s = smtplib.SMTP_SSL(smtp_server, smtp_port)
-            logger.info("SMTP SSL connection established")
-            logger.info("SSL session started")
-
-        # Authenticate with the SMTP server
-        s.login(smtp_sender_email, smtp_password)
-        logger.info("SMTP authentication successful")
-
-        # Set recipients
-        for recipient in receiver_email:
-            msg["To"] = recipient
-
-        # Send email
-        s.sendmail(
-            from_addr=smtp_sender_email, to_addrs=receiver_email, msg=msg.as_string()
-        )
-        logger.info("Email successfully sent to %s", receiver_email)
-
-        # Terminate the SMTP session
-        s.quit()
-        return True, "Success"
-
-    except Exception as e:
-        logger.error("Email sending failed: %s", str(e))
-        return False, str(e)
+    return send_many_emails(
+        emails=[
+            {
+                "receiver_email": receiver_email,
+                "subject": subject,
+                "body": body,
+                "file_name": file_name,
+                "file_path": file_path,
+            }
+        ],
+        login_user_name=login_user_name,
+        login_user_pass=login_user_pass,
+    )[0]
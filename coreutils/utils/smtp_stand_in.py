@@ -0,0 +1,113 @@
+import socketserver
+import threading
+import time
+from typing import Dict
+
+
+class LocalSMTPStandInHandler(socketserver.StreamRequestHandler):
+    """
+    Speaks just enough SMTP for smtplib: EHLO/HELO, AUTH PLAIN, MAIL, RCPT,
+    DATA, RSET, NOOP and QUIT. Every credential is accepted and messages
+    are counted, not delivered.
+    """
+
+    server: "LocalSMTPStandInServer"
+
+    def reply(self, line: str):
+        if self.server.command_latency:
+            time.sleep(self.server.command_latency)
+        self.wfile.write(f"{line}\r\n".encode("ascii"))
+
+    def read_data(self) -> int:
+        """
+        Reads a DATA payload up to the terminating dot line and returns its size.
+        """
+        size: int = 0
+        while True:
+            line: bytes = self.rfile.readline()
+            if not line or line == b".\r\n":
+                return size
+            size += len(line)
+
+    def handle(self):
+        # ? The greeting delay stands in for the TLS handshake of a real server
+        if self.server.handshake_latency:
+            time.sleep(self.server.handshake_latency)
+        self.server.record(connections=1)
+        self.reply("220 localhost stand-in ESMTP")
+        while True:
+            line: bytes = self.rfile.readline()
+            if not line:
+                return
+            command: str = line.decode("utf-8", "replace").strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                self.reply("250-localhost")
+                self.reply("250-AUTH PLAIN")
+                self.reply("250 8BITMIME")
+            elif command.startswith("AUTH"):
+                self.server.record(logins=1)
+                self.reply("235 2.7.0 Authentication successful")
+            elif command.startswith("DATA"):
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                self.server.record(messages=1, bytes_received=self.read_data())
+                self.reply("250 OK")
+            elif command.startswith("QUIT"):
+                self.reply("221 Bye")
+                return
+            elif command.startswith(("MAIL", "RCPT", "RSET", "NOOP")):
+                self.reply("250 OK")
+            else:
+                self.reply("502 Command not implemented")
+
+
+class LocalSMTPStandInServer(socketserver.ThreadingTCPServer):
+    """
+    In-process SMTP server for benchmarks and local development.
+
+    Binds to 127.0.0.1 on a free port unless one is given, runs in a daemon
+    thread and records connections, logins, messages and bytes received.
+    `handshake_latency` delays each new session and `command_latency` each
+    reply, to approximate a remote server.
+    """
+
+    daemon_threads: bool = True
+    allow_reuse_address: bool = True
+
+    handshake_latency: float
+    command_latency: float
+    stats: Dict[str, int]
+    stats_lock: threading.Lock
+
+    def __init__(
+        self,
+        port: int = 0,
+        handshake_latency: float = 0.0,
+        command_latency: float = 0.0,
+    ):
+        super().__init__(("127.0.0.1", port), LocalSMTPStandInHandler)
+        self.handshake_latency: float = handshake_latency
+        self.command_latency: float = command_latency
+        self.stats: Dict[str, int] = {
+            "connections": 0,
+            "logins": 0,
+            "messages": 0,
+            "bytes_received": 0,
+        }
+        self.stats_lock: threading.Lock = threading.Lock()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def record(self, **increments: int):
+        with self.stats_lock:
+            for key, increment in increments.items():
+                self.stats[key] += increment
+
+    def start(self) -> "LocalSMTPStandInServer":
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,306 @@
+import logging
+import re
+import smtplib
+import threading
+import time
+from typing import Dict, Iterable, List, Tuple
+
+from django.conf import settings
+
+from core.settings import logger
+
+logger = logging.LoggerAdapter(logger, {"app_name": "SMTPTransport"})
+
+# ? Authenticated connections kept open per sender
+SMTP_POOL_SIZE: int = getattr(settings, "SMTP_POOL_SIZE", 4)
+# ? Seconds an idle connection is reused before it is closed and replaced
+SMTP_POOL_IDLE_TIMEOUT: float = getattr(settings, "SMTP_POOL_IDLE_TIMEOUT", 60.0)
+# ? Socket timeout for SMTP commands
+SMTP_TIMEOUT: float = getattr(settings, "SMTP_TIMEOUT", 30.0)
+
+# ? Attempts per message, each after a dropped connection runs on a new one
+SMTP_SEND_ATTEMPTS: int = 2
+
+# ? Refusals of a single message; the session stays usable after these
+SMTP_REJECTION_ERRORS: Tuple = (
+    smtplib.SMTPRecipientsRefused,
+    smtplib.SMTPSenderRefused,
+    smtplib.SMTPDataError,
+    smtplib.SMTPNotSupportedError,
+)
+# ? A dot at the start of a line is doubled inside DATA
+DOT_STUFFING_PATTERN: re.Pattern = re.compile(rb"^\.", re.MULTILINE)
+# ? Any other SMTP or socket error drops the connection (SMTPException is an OSError)
+SMTP_CONNECTION_ERRORS: Tuple = (OSError,)
+
+
+class SMTPTransport:
+    """
+    Sends mail over pooled, authenticated SMTP connections.
+
+    Opening a session costs a TCP connect, the TLS handshake and AUTH; the
+    transport keeps up to `pool_size` sessions open per sender and reuses
+    them, so a batch of messages pays that cost once. A connection that
+    fails mid-send is discarded and the message is retried once on a fresh
+    connection; connections idle for longer than `idle_timeout` are closed
+    instead of reused, since servers drop idle sessions.
+
+    Use `for_sender()` for the transport configured in settings.
+
+    Attributes:
+        server (str): SMTP host.
+        port (int): SMTP port.
+        connection_type (str): TLS (STARTTLS), SSL or PLAIN.
+        username (str): Sender address, also used for AUTH.
+        password (str): AUTH password; AUTH is skipped when empty.
+    """
+
+    server: str
+    port: int
+    connection_type: str
+    username: str
+    password: str
+    pool_size: int
+    idle_timeout: float
+    timeout: float
+    idle_connections: List[Tuple[float, smtplib.SMTP]]
+    lock: threading.Lock
+
+    transports: Dict[Tuple[str, str], "SMTPTransport"] = {}
+    transports_lock: threading.Lock = threading.Lock()
+
+    def __init__(
+        self,
+        server: str,
+        port: int,
+        connection_type: str,
+        username: str,
+        password: str,
+        pool_size: int = SMTP_POOL_SIZE,
+        idle_timeout: float = SMTP_POOL_IDLE_TIMEOUT,
+        timeout: float = SMTP_TIMEOUT,
+    ):
+        self.server: str = server
+        self.port: int = port
+        self.connection_type: str = connection_type.upper()
+        self.username: str = username
+        self.password: str = password
+        self.pool_size: int = max(1, pool_size)
+        self.idle_timeout: float = idle_timeout
+        self.timeout: float = timeout
+        self.idle_connections: List[Tuple[float, smtplib.SMTP]] = []
+        self.lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def for_sender(cls, username: str = None, password: str = None) -> "SMTPTransport":
+        """
+        Returns the shared transport for a sender, using the SMTP settings.
+        Defaults to SMTP_SENDER_EMAIL / SMTP_PASSWORD.
+        """
+        if None in [username, password]:
+            username: str = settings.SMTP_SENDER_EMAIL
+            password: str = settings.SMTP_PASSWORD
+
+        with cls.transports_lock:
+            transport: SMTPTransport = cls.transports.get((username, password))
+            if transport is None:
+                transport: SMTPTransport = cls(
+                    server=settings.SMTP_SERVER,
+                    port=settings.SMTP_PORT,
+                    connection_type=settings.EMAIL_CONNECTION,
+                    username=username,
+                    password=password,
+                )
+                cls.transports[(username, password)] = transport
+        return transport
+
+    def connect(self) -> smtplib.SMTP:
+        """
+        Opens and authenticates a new SMTP session.
+        """
+        if self.connection_type == "SSL":
+            connection: smtplib.SMTP = smtplib.SMTP_SSL(
+                self.server, self.port, timeout=self.timeout
+            )
+        else:
+            connection: smtplib.SMTP = smtplib.SMTP(
+                self.server, self.port, timeout=self.timeout
+            )
+            if self.connection_type == "TLS":
+                # ? start TLS for security
+                connection.starttls()
+
+        if self.password:
+            connection.login(self.username, self.password)
+        logger.info(
+            "SMTP %s session opened to %s:%s",
+            self.connection_type,
+            self.server,
+            self.port,
+        )
+        return connection
+
+    def acquire(self) -> smtplib.SMTP:
+        """
+        Returns an idle connection, or opens a new one when none is fresh enough.
+        """
+        while True:
+            with self.lock:
+                if not self.idle_connections:
+                    break
+                released_at, connection = self.idle_connections.pop()
+            if time.monotonic() - released_at <= self.idle_timeout:
+                return connection
+            self.discard(connection=connection)
+        return self.connect()
+
+    def release(self, connection: smtplib.SMTP):
+        """
+        Returns a healthy connection to the pool, closing it if the pool is full.
+        """
+        with self.lock:
+            if len(self.idle_connections) < self.pool_size:
+                self.idle_connections.append((time.monotonic(), connection))
+                return
+        self.discard(connection=connection)
+
+    def discard(self, connection: smtplib.SMTP):
+        """
+        Closes a connection without raising.
+        """
+        try:
+            connection.quit()
+        except Exception:
+            connection.close()
+
+    def close(self):
+        """
+        Closes every idle connection.
+        """
+        with self.lock:
+            idle_connections: List[Tuple[float, smtplib.SMTP]] = self.idle_connections
+            self.idle_connections: List[Tuple[float, smtplib.SMTP]] = []
+        for _, connection in idle_connections:
+            self.discard(connection=connection)
+
+    def send_many(self, messages: List[Dict]) -> List[Tuple[bool, str]]:
+        """
+        Sends messages one after another over a single session.
+
+        A message the server rejects is reported and the session moves on. If
+        the connection drops, it is replaced and the message retried once; if
+        no connection can be opened the remaining messages are reported as failed.
+
+        Args:
+            messages (List[Dict]): Each with `to_addrs` (list of addresses) and
+                `message` (the serialized message as str or bytes, or a
+                re-iterable of CRLF terminated byte chunks to stream).
+                `from_addr` defaults to the transport's sender.
+
+        Returns:
+            List[Tuple[bool, str]]: (success, "Success" or the error) per message, in order.
+        """
+        results: List[Tuple[bool, str]] = []
+        connection: smtplib.SMTP = None
+        try:
+            for message in messages:
+                for attempt in range(1, SMTP_SEND_ATTEMPTS + 1):
+                    if connection is None:
+                        connection = self.acquire()
+                    try:
+                        self.send_message(connection=connection, message=message)
+                        results.append((True, "Success"))
+                        break
+                    except SMTP_REJECTION_ERRORS as e:
+                        # ? Rejected by the server, the session itself is still usable
+                        logger.error("Email sending failed: %s", str(e))
+                        results.append((False, str(e)))
+                        connection.rset()
+                        break
+                    except SMTP_CONNECTION_ERRORS as e:
+                        logger.warning("SMTP connection lost: %s", str(e))
+                        self.discard(connection=connection)
+                        connection: smtplib.SMTP = None
+                        if attempt == SMTP_SEND_ATTEMPTS:
+                            results.append((False, str(e)))
+        except SMTP_CONNECTION_ERRORS as e:
+            logger.error("SMTP connection failed: %s", str(e))
+            results.extend((False, str(e)) for _ in messages[len(results) :])
+            connection: smtplib.SMTP = None
+        finally:
+            if connection is not None:
+                self.release(connection=connection)
+        return results
+
+    def send_message(self, connection: smtplib.SMTP, message: Dict):
+        """
+        Sends one message; a message given as an iterable of byte chunks is streamed.
+        """
+        if isinstance(message["message"], (str, bytes)):
+            connection.sendmail(
+                from_addr=message.get("from_addr") or self.username,
+                to_addrs=message["to_addrs"],
+                msg=message["message"],
+            )
+            return
+        self.send_stream(
+            connection=connection,
+            from_addr=message.get("from_addr") or self.username,
+            to_addrs=message["to_addrs"],
+            chunks=message["message"],
+        )
+
+    def send_stream(
+        self,
+        connection: smtplib.SMTP,
+        from_addr: str,
+        to_addrs: List[str],
+        chunks: Iterable[bytes],
+    ):
+        """
+        Runs MAIL, RCPT and DATA itself and writes the message chunk by chunk,
+        so the serialized message never has to exist in memory as a whole.
+
+        Every chunk must end on a CRLF line boundary; lines starting with a
+        dot are escaped as SMTP requires.
+
+        Raises:
+            SMTPSenderRefused, SMTPRecipientsRefused, SMTPDataError: As `sendmail` does.
+        """
+        connection.ehlo_or_helo_if_needed()
+        code, response = connection.mail(from_addr)
+        if code != 250:
+            connection.rset()
+            raise smtplib.SMTPSenderRefused(code, response, from_addr)
+
+        refused_recipients: Dict[str, Tuple[int, bytes]] = {}
+        for recipient in to_addrs:
+            code, response = connection.rcpt(recipient)
+            if code not in (250, 251):
+                refused_recipients[recipient] = (code, response)
+        if len(refused_recipients) == len(to_addrs):
+            connection.rset()
+            raise smtplib.SMTPRecipientsRefused(refused_recipients)
+
+        code, response = connection.docmd("data")
+        if code != 354:
+            connection.rset()
+            raise smtplib.SMTPDataError(code, response)
+
+        last_chunk: bytes = b"\r\n"
+        for chunk in chunks:
+            if chunk:
+                connection.send(DOT_STUFFING_PATTERN.sub(b"..", chunk))
+                last_chunk: bytes = chunk
+        connection.send(b".\r\n" if last_chunk.endswith(b"\r\n") else b"\r\n.\r\n")
+
+        code, response = connection.getreply()
+        if code != 250:
+            connection.rset()
+            raise smtplib.SMTPDataError(code, response)
+
+    def send(self, to_addrs: List[str], message: str | bytes) -> Tuple[bool, str]:
+        """
+        Sends a single message over a pooled connection.
+        """
+        return self.send_many(messages=[{"to_addrs": to_addrs, "message": message}])[0]
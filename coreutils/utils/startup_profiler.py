@@ -0,0 +1,138 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List
+
+# ? `python -X importtime` line: "import time: <self us> | <cumulative us> | <indent><module>"
+IMPORT_TIME_PATTERN: re.Pattern = re.compile(
+    r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$"
+)
+
+
+class StartupProfiler:
+    """
+    Profiles the cold start of the project in a fresh interpreter.
+
+    The child process runs under `python -X importtime`, wraps every app's
+    `ready()` with a timer and measures the startup phases: loading settings,
+    the rest of `django.setup()`, and importing the URLconf (which a worker
+    does on its first request). The parent parses the import log into
+    per-module self and cumulative times.
+    """
+
+    @classmethod
+    def profile(
+        cls, settings_module: str, base_dir: str, include_urls: bool = True
+    ) -> Dict:
+        """
+        Profiles one cold start.
+
+        Args:
+            settings_module (str): DJANGO_SETTINGS_MODULE for the child process.
+            base_dir (str): Project root, used as the child's working directory.
+            include_urls (bool): Also time loading the URLconf.
+
+        Returns:
+            Dict: `phases` and `ready` in seconds, and `imports` with times in microseconds.
+
+        Raises:
+            RuntimeError: If the child process fails.
+        """
+        command: List[str] = [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-m",
+            "coreutils.utils.startup_profiler",
+        ]
+        if include_urls:
+            command.append("--include-urls")
+        process: subprocess.CompletedProcess = subprocess.run(
+            command,
+            cwd=base_dir,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": settings_module},
+            capture_output=True,
+            text=True,
+        )
+        if process.returncode != 0:
+            raise RuntimeError(process.stderr.strip().splitlines()[-1])
+
+        result: Dict = json.loads(process.stdout.strip().splitlines()[-1])
+        result["imports"] = cls.parse_import_times(output=process.stderr)
+        return result
+
+    @staticmethod
+    def parse_import_times(output: str) -> List[Dict]:
+        """
+        Parses `-X importtime` output into one entry per imported module.
+        """
+        imports: List[Dict] = []
+        for line in output.splitlines():
+            match: re.Match = IMPORT_TIME_PATTERN.match(line)
+            if match:
+                imports.append(
+                    {
+                        "module": match.group(4),
+                        "self_us": int(match.group(1)),
+                        "cumulative_us": int(match.group(2)),
+                        # ? Top-level imports are indented by a single space
+                        "depth": (len(match.group(3)) - 1) // 2,
+                    }
+                )
+        return imports
+
+    @staticmethod
+    def run_startup(include_urls: bool) -> Dict:
+        """
+        Runs in the child process: starts Django and times each phase.
+        """
+        from django.apps import AppConfig
+
+        ready_times: Dict[str, float] = {}
+        create_app_config: Callable = AppConfig.create.__func__
+
+        def create(cls, entry: str) -> AppConfig:
+            app_config: AppConfig = create_app_config(cls, entry)
+            ready: Callable = app_config.ready
+
+            def timed_ready():
+                started_at: float = time.perf_counter()
+                ready()
+                ready_times[app_config.label] = time.perf_counter() - started_at
+
+            app_config.ready = timed_ready
+            return app_config
+
+        AppConfig.create = classmethod(create)
+
+        import django
+        from django.conf import settings
+
+        phases: Dict[str, float] = {}
+        started_at: float = time.perf_counter()
+        settings.INSTALLED_APPS
+        phases["settings"] = time.perf_counter() - started_at
+
+        started_at: float = time.perf_counter()
+        django.setup()
+        phases["django.setup"] = time.perf_counter() - started_at
+
+        if include_urls:
+            from django.urls import get_resolver
+
+            started_at: float = time.perf_counter()
+            get_resolver().url_patterns
+            phases["urlconf"] = time.perf_counter() - started_at
+
+        return {"phases": phases, "ready": ready_times}
+
+
+if __name__ == "__main__":
+    print(
+        json.dumps(
+            StartupProfiler.run_startup(include_urls="--include-urls" in sys.argv)
+        )
+    )
@@ -0,0 +1,102 @@
+import base64
+import mmap
+import os
+import uuid
+from email import policy
+from email.mime.base import MIMEBase
+from email.mime.multipart import MIMEMultipart
+from typing import Iterator
+
+from django.conf import settings
+
+# ? Base64 encodes 57 input bytes into one 76 character line
+BASE64_LINE_INPUT_SIZE: int = 57
+# ? Attachment bytes encoded per chunk, rounded down to whole base64 lines
+EMAIL_ATTACHMENT_CHUNK_SIZE: int = getattr(
+    settings, "EMAIL_ATTACHMENT_CHUNK_SIZE", BASE64_LINE_INPUT_SIZE * 1024
+)
+
+
+def iter_base64_file(
+    file_path: str, chunk_size: int = EMAIL_ATTACHMENT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Yields a file base64-encoded in CRLF terminated 76 character lines.
+
+    The file is memory-mapped and encoded one chunk at a time, so only one
+    chunk of encoded output exists in memory at once.
+
+    Args:
+        file_path (str): File to encode.
+        chunk_size (int): Input bytes per chunk, rounded down to a multiple of 57.
+
+    Yields:
+        bytes: Encoded lines for one chunk.
+    """
+    chunk_size: int = max(
+        BASE64_LINE_INPUT_SIZE, chunk_size - chunk_size % BASE64_LINE_INPUT_SIZE
+    )
+    with open(file_path, "rb") as attachment:
+        file_size: int = os.fstat(attachment.fileno()).st_size
+        if not file_size:
+            return
+        with mmap.mmap(attachment.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for start in range(0, file_size, chunk_size):
+                yield base64.encodebytes(mapped[start : start + chunk_size]).replace(
+                    b"\n", b"\r\n"
+                )
+
+
+class StreamingEmailMessage:
+    """
+    A MIME message whose file attachment is streamed from disk when sent.
+
+    The message is serialized with a unique marker in place of the
+    attachment body; iterating yields the bytes before the marker, the
+    attachment encoded chunk by chunk, then the rest of the message. Every
+    chunk ends on a CRLF line boundary, which `SMTPTransport` relies on
+    for dot-stuffing. The object can be iterated again, e.g. to retry a send.
+
+    Attributes:
+        msg (MIMEMultipart): Message with the attachment part attached.
+        file_path (str): Attachment on disk.
+        marker (bytes): Placeholder for the attachment body.
+    """
+
+    msg: MIMEMultipart
+    file_path: str
+    marker: bytes
+
+    def __init__(self, msg: MIMEMultipart, file_name: str, file_path: str):
+        """
+        Attaches a placeholder part for the file to the message.
+
+        Raises:
+            OSError: If the file does not exist or cannot be read.
+        """
+        # ? Fail while building, like reading the file up front did
+        os.stat(file_path)
+        self.msg: MIMEMultipart = msg
+        self.file_path: str = file_path
+        self.marker: bytes = f"attachment-{uuid.uuid4().hex}".encode("ascii")
+
+        part: MIMEBase = MIMEBase("application", "octet-stream")
+        part.set_payload(self.marker.decode("ascii"))
+        part.add_header("Content-Transfer-Encoding", "base64")
+        part.add_header("Content-Disposition", f"attachment; filename={file_name}")
+        self.msg.attach(part)
+
+    def __iter__(self) -> Iterator[bytes]:
+        serialized: bytes = self.msg.as_bytes(policy=policy.SMTP)
+        prefix, suffix = serialized.split(self.marker, 1)
+        yield prefix
+
+        has_attachment_data: bool = False
+        for chunk in iter_base64_file(file_path=self.file_path):
+            has_attachment_data: bool = True
+            yield chunk
+
+        # ? The encoded lines already end with CRLF
+        if has_attachment_data and suffix.startswith(b"\r\n"):
+            suffix: bytes = suffix[2:]
+        yield suffix
@@ -0,0 +1,76 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Tuple
+
+
+class TTLLRUCache:
+    """
+    Thread-safe, size-bounded in-process cache whose entries expire after a TTL.
+
+    The least recently used entry is evicted once `max_size` is reached, and an
+    entry older than `ttl` seconds is treated as missing.
+
+    Attributes:
+        ttl (float): Seconds an entry stays valid.
+        max_size (int): Maximum number of entries kept.
+    """
+
+    ttl: float
+    max_size: int
+    entries: "OrderedDict[Hashable, Tuple[float, Any]]"
+    lock: threading.Lock
+
+    def __init__(self, ttl: float, max_size: int):
+        """
+        Initializes an empty cache.
+
+        Args:
+            ttl (float): Seconds an entry stays valid.
+            max_size (int): Maximum number of entries kept.
+        """
+        self.ttl: float = ttl
+        self.max_size: int = max(1, max_size)
+        self.entries: OrderedDict = OrderedDict()
+        self.lock: threading.Lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value, or `default` if it is missing or expired.
+        """
+        with self.lock:
+            entry: Tuple[float, Any] = self.entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] < time.monotonic():
+                del self.entries[key]
+                return default
+            self.entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any):
+        """
+        Stores a value, evicting the least recently used entry when full.
+        """
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        """
+        Removes a value if it is cached.
+        """
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        """
+        Removes every entry.
+        """
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -22,6 +22,14 @@ class BookingListModelSerializer(serializers.ModelSerializer):
     class_details = serializers.SerializerMethodField()
     slot_details = serializers.SerializerMethodField()
 
+    # ? Model fields read by the method fields, used to narrow ?fields= queries
+    sparse_field_sources = {
+        "client_details": ["client"],
+        "instructor_details": ["slot__class_id__instructor"],
+        "class_details": ["slot__class_id__classes"],
+        "slot_details": ["slot__slot_id"],
+    }
+
     class Meta:
         model = BookingsModel
         fields = [
@@ -26,6 +26,12 @@ class SlotBookingAPIView(
 
 class BookingsListAPIView(CoreGenericListAPIView, generics.ListAPIView):
     queryset = BookingsModel.objects.all()
+    select_related_fields = [
+        "client",
+        "slot__slot_id",
+        "slot__class_id__instructor",
+        "slot__class_id__classes",
+    ]
     filter_backends = [DjangoFilterBackend]
     filterset_class = BookingsModelFilterSet
 
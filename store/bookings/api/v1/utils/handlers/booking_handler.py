@@ -1,13 +1,18 @@
 from store.bookings.models import BookingsModel
 from django.db import transaction
 from django.db.models.query import QuerySet
+from coreutils.utils.email_outbox import EmailOutbox
+from coreutils.utils.email_templates import EmailTemplateRegistry
 from coreutils.utils.generics.serializers.mixins import CoreGenericBaseHandler
 from userauth.models import UserModel
 from django.contrib.auth import get_user_model
 from store.slots.models import AssignedSlotsTimingsToClassesModel
 from typing import Dict
+from coreutils.utils.generics.serializers.validation_context import (
+    ValidationContextLoader,
+)
 from django.utils.timezone import now as django_now
-from datetime import datetime
+from datetime import datetime, time
 
 
 class BookingHandler(CoreGenericBaseHandler):
@@ -23,44 +28,64 @@ class BookingHandler(CoreGenericBaseHandler):
     # ? Instance-level reference to the assigned slot class (populated during validation)
     assigned_slots_timings_to_class_instance: AssignedSlotsTimingsToClassesModel
 
-    def validate_class_id(
-        self,
-        assigned_slots_timings_to_class_queryset: QuerySet[
-            AssignedSlotsTimingsToClassesModel
-        ],
-    ) -> Dict:
+    def declare_validation_context(self, context: ValidationContextLoader):
+        """
+        Declares the slot, the client and the booking counts needed by the validators.
+        The two counts share one aggregate query and the client row is reused by `create()`.
+
+        Args:
+            context (ValidationContextLoader): Loader to declare lookups on.
+        """
+        context.declare_by_pk(
+            key="assigned_slot",
+            queryset=AssignedSlotsTimingsToClassesModel.objects.select_related(
+                "slot_id", "class_id__classes"
+            ),
+            pk=self.data["class_id"],
+        )
+        context.declare_by_field(
+            key="client",
+            queryset=get_user_model().objects.all(),
+            field_name="email",
+            value=self.data["client_email"],
+        )
+        booking_queryset: QuerySet[BookingsModel] = BookingsModel.objects.all()
+        context.declare_count(
+            key="client_slot_bookings",
+            queryset=booking_queryset,
+            slot_id=self.data["class_id"],
+            client__email=self.data["client_email"],
+        )
+        context.declare_count(
+            key="slot_date_bookings",
+            queryset=booking_queryset,
+            slot_id=self.data["class_id"],
+            date_of_booking=self.data["date_of_booking"],
+        )
+
+    def validate_class_id(self) -> Dict:
         """
         Validates the class ID provided in self.data:
         - Checks if the class ID exists.
         - Prevents duplicate bookings by the same client for the same slot.
         - Prevents overbooking beyond the slot's capacity.
 
-        Args:
-            assigned_slots_timings_to_class_queryset (QuerySet): Queryset of all class assignments.
-
         Returns:
             Dict: Error message dict if validation fails, otherwise an empty dict.
         """
         error_message: Dict = {}
 
         # ? Check if the class ID exists
-        if not assigned_slots_timings_to_class_queryset.filter(
-            pk=self.data["class_id"]
-        ).exists():
+        if self.validation_context.get("assigned_slot") is None:
             return {"title": "Incorrect Id", "description": "class id is incorrect"}
 
         # ? Retrieve the class instance
-        self.assigned_slots_timings_to_class_instance = (
-            assigned_slots_timings_to_class_queryset.get(pk=self.data["class_id"])
+        self.assigned_slots_timings_to_class_instance = self.validation_context.get(
+            "assigned_slot"
         )
 
-        booking_queryset = BookingsModel.objects.all()
-
         # ? Check if this client has already booked this slot
-        if booking_queryset.filter(
-            slot=self.assigned_slots_timings_to_class_instance,
-            client__email=self.data["client_email"],
-        ).exists():
+        if self.validation_context.get_count("client_slot_bookings"):
             return {
                 "title": "Already booked",
                 "description": "You have already booked for this slot",
@@ -68,11 +93,8 @@ class BookingHandler(CoreGenericBaseHandler):
 
         # ? Check if the slot is fully booked for today's date
         if (
-            booking_queryset.filter(
-                slot=self.assigned_slots_timings_to_class_instance,
-                date_of_booking=self.data["date_of_booking"],
-            ).count()
-            == self.assigned_slots_timings_to_class_instance.slot_id.max_no_of_attendies
+            self.validation_context.get_count("slot_date_bookings")
+            >= self.assigned_slots_timings_to_class_instance.slot_id.max_no_of_attendies
         ):
             return {
                 "title": "Slot's are filled",
@@ -108,7 +130,7 @@ class BookingHandler(CoreGenericBaseHandler):
 
         # Only check slot time if booking for today
         if booking_date == today:
-            slot_start_time = (
+            slot_start_time: time = (
                 self.assigned_slots_timings_to_class_instance.slot_id.start_time
             )
 
@@ -125,13 +147,7 @@ class BookingHandler(CoreGenericBaseHandler):
         Executes all necessary validations before creating a booking.
         Adds any validation errors using `set_error_message`.
         """
-        assigned_slots_timings_to_class_queryset = (
-            AssignedSlotsTimingsToClassesModel.objects.all()
-        )
-
-        class_id_error_message: Dict = self.validate_class_id(
-            assigned_slots_timings_to_class_queryset=assigned_slots_timings_to_class_queryset
-        )
+        class_id_error_message: Dict = self.validate_class_id()
 
         if class_id_error_message:
             return self.set_error_message(
@@ -148,16 +164,14 @@ class BookingHandler(CoreGenericBaseHandler):
     def get_user_instance(self) -> UserModel:
         """
         Retrieves or creates a UserModel instance based on client_email.
+        The existing user was already loaded with the validation context.
 
         Returns:
             UserModel: The existing or newly created user.
         """
-        user_queryset = get_user_model().objects.all()
-
-        if user_queryset.filter(email=self.data["client_email"]).exists():
-            user_instance = user_queryset.get(email=self.data["client_email"])
-        else:
-            user_instance = user_queryset.create(
+        user_instance: UserModel = self.validation_context.get("client")
+        if user_instance is None:
+            user_instance = get_user_model().objects.create(
                 username=self.data["client_name"],
                 email=self.data["client_email"],
                 is_active=True,
@@ -167,15 +181,38 @@ class BookingHandler(CoreGenericBaseHandler):
             )
         return user_instance
 
+    def queue_confirmation_email(self, booking_instance: BookingsModel):
+        """
+        Queues the booking confirmation in the email outbox.
+        Written in the booking's transaction and delivered by the outbox worker.
+        """
+        assigned_slot: AssignedSlotsTimingsToClassesModel = (
+            self.assigned_slots_timings_to_class_instance
+        )
+        subject, body = EmailTemplateRegistry.render(
+            name="booking_confirmation",
+            context={
+                "client_name": self.data["client_name"],
+                "class_title": assigned_slot.class_id.classes.title,
+                "date_of_booking": booking_instance.date_of_booking,
+                "start_time": assigned_slot.slot_id.start_time.strftime("%H:%M"),
+            },
+        )
+        EmailOutbox.enqueue(
+            receiver_email=[self.data["client_email"]], subject=subject, body=body
+        )
+
     def create(self):
         """
         Creates a new booking for the validated slot and client.
-        Executes within an atomic transaction to ensure consistency.
+        Executes within an atomic transaction to ensure consistency;
+        the confirmation email is queued in the same transaction.
         """
         with transaction.atomic():
             user_instance = self.get_user_instance()
-            self.queryset.create(
+            booking_instance: BookingsModel = self.queryset.create(
                 client=user_instance,
                 slot=self.assigned_slots_timings_to_class_instance,
                 date_of_booking=self.data["date_of_booking"],
             )
+            self.queue_confirmation_email(booking_instance=booking_instance)
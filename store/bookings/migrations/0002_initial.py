@@ -0,0 +1,43 @@
+# Generated by Django 5.2.3 on 2026-10-19 00:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("bookings", "0001_initial"),
+        ("slots", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bookingsmodel",
+            name="client",
+            field=models.ForeignKey(
+                db_column="CLIENT_ID",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="BookingsModel_client",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name="bookingsmodel",
+            name="slot",
+            field=models.ForeignKey(
+                db_column="SLOT_ID",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="BookingsModel_slot",
+                to="slots.assignedslotstimingstoclassesmodel",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="bookingsmodel",
+            unique_together={("client", "slot", "date_of_booking")},
+        ),
+    ]
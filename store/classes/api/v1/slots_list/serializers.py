@@ -13,6 +13,12 @@ class ClassListModelSerializer(serializers.ModelSerializer):
     week_days_off = serializers.SerializerMethodField()
     available_slots = serializers.SerializerMethodField()
 
+    # ? Model fields read by the method fields, used to narrow ?fields= queries
+    sparse_field_sources = {
+        "week_days_off": ["week_days_off"],
+        "available_slots": ["id"],
+    }
+
     class Meta:
         model = ClassAssignedInstructorModel
         fields = ["id", "class_name", "instructor", "week_days_off", "available_slots"]
@@ -7,6 +7,7 @@ from userauth.api.v1.utils.constants import USER_REGISTERED_SUCCESS_MESSAGE
 
 class ClassListModelAPIView(CoreGenericListAPIView, generics.ListAPIView):
     queryset = ClassAssignedInstructorModel.objects.all()
+    select_related_fields = ["classes", "instructor", "week_days_off"]
     # authentication_classes = [CustomAuthentication]
     # permission_classes = [permissions.IsAuthenticated]
     success_message = USER_REGISTERED_SUCCESS_MESSAGE
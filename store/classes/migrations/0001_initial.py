@@ -0,0 +1,125 @@
+# Generated by Django 5.2.3 on 2026-10-19 00:31
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="ClassAssignedInstructorModel",
+            fields=[
+                (
+                    "core_generic_created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        db_column="CORE_GENERIC_CREATED_AT",
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        db_column="CORE_GENERIC_LAST_UPDATED_AT",
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_created_by",
+                    models.CharField(
+                        blank=True,
+                        db_column="CORE_GENERIC_CREATED_BY",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_updated_by",
+                    models.CharField(
+                        blank=True,
+                        db_column="CORE_GENERIC_UPDATED_BY",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "id",
+                    models.UUIDField(
+                        db_column="ID",
+                        default=uuid.uuid1,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "CLASSES_ASSIGNED_INSTRUCTOR_TABLE",
+            },
+        ),
+        migrations.CreateModel(
+            name="ClassesModel",
+            fields=[
+                (
+                    "core_generic_created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        db_column="CORE_GENERIC_CREATED_AT",
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        db_column="CORE_GENERIC_LAST_UPDATED_AT",
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_created_by",
+                    models.CharField(
+                        blank=True,
+                        db_column="CORE_GENERIC_CREATED_BY",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_updated_by",
+                    models.CharField(
+                        blank=True,
+                        db_column="CORE_GENERIC_UPDATED_BY",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "id",
+                    models.UUIDField(
+                        db_column="ID",
+                        default=uuid.uuid1,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "title",
+                    models.CharField(db_column="TITLE", max_length=256, unique=True),
+                ),
+                ("description", models.TextField(db_column="DESCRIPTION")),
+            ],
+            options={
+                "db_table": "CLASSES_TABLE",
+            },
+        ),
+    ]
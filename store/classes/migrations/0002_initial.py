@@ -0,0 +1,53 @@
+# Generated by Django 5.2.3 on 2026-10-19 00:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("classes", "0001_initial"),
+        ("coreutils", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="classassignedinstructormodel",
+            name="instructor",
+            field=models.ForeignKey(
+                db_column="USER_ASSIGNED",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="ClassAssignedInstructorModel_instructor",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name="classassignedinstructormodel",
+            name="week_days_off",
+            field=models.ForeignKey(
+                db_column="WEEK_OFF_DAYS",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="ClassAssignedInstructorModel_week_days_off",
+                to="coreutils.weekdayoffmodel",
+            ),
+        ),
+        migrations.AddField(
+            model_name="classassignedinstructormodel",
+            name="classes",
+            field=models.ForeignKey(
+                db_column="CLASS_ASSIGNED",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="ClassAssignedInstructorModel_classes",
+                to="classes.classesmodel",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="classassignedinstructormodel",
+            unique_together={("instructor", "classes")},
+        ),
+    ]
@@ -0,0 +1,148 @@
+# Generated by Django 5.2.3 on 2026-10-19 00:31
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("classes", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SlotTimigsModel",
+            fields=[
+                (
+                    "core_generic_created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        db_column="CORE_GENERIC_CREATED_AT",
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        db_column="CORE_GENERIC_LAST_UPDATED_AT",
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_created_by",
+                    models.CharField(
+                        blank=True,
+                        db_column="CORE_GENERIC_CREATED_BY",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_updated_by",
+                    models.CharField(
+                        blank=True,
+                        db_column="CORE_GENERIC_UPDATED_BY",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "id",
+                    models.UUIDField(
+                        db_column="ID",
+                        default=uuid.uuid1,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                ("start_time", models.TimeField(db_column="START_TIME")),
+                ("end_time", models.TimeField(db_column="END_TIME")),
+                (
+                    "max_no_of_attendies",
+                    models.IntegerField(db_column="MAX_NO_OF_ATTENDIES"),
+                ),
+            ],
+            options={
+                "db_table": "SLOT_TIMINGS_TABLE",
+            },
+        ),
+        migrations.CreateModel(
+            name="AssignedSlotsTimingsToClassesModel",
+            fields=[
+                (
+                    "core_generic_created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        db_column="CORE_GENERIC_CREATED_AT",
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        db_column="CORE_GENERIC_LAST_UPDATED_AT",
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_created_by",
+                    models.CharField(
+                        blank=True,
+                        db_column="CORE_GENERIC_CREATED_BY",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_updated_by",
+                    models.CharField(
+                        blank=True,
+                        db_column="CORE_GENERIC_UPDATED_BY",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "id",
+                    models.UUIDField(
+                        db_column="ID",
+                        default=uuid.uuid1,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "class_id",
+                    models.ForeignKey(
+                        db_column="CLASS",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="AssignedSlotsTimingsToClassesModel_class_id",
+                        to="classes.classassignedinstructormodel",
+                    ),
+                ),
+                (
+                    "slot_id",
+                    models.ForeignKey(
+                        db_column="SLOTS",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="AssignedSlotsTimingsToClassesModel_slot_id",
+                        to="slots.slottimigsmodel",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "ASSIGNED_SLOTS_TIMINGS_TO_CLASSES_TABLE",
+                "unique_together": {("class_id", "slot_id")},
+            },
+        ),
+    ]
@@ -0,0 +1,60 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from rest_framework import serializers
+from typing import Dict
+from coreutils.utils.generics.serializers.mixins import CoreGenericBulkSerializer
+from userauth.api.v1.utils.constants import (
+    USER_BULK_IMPORT_TOO_MANY_ROWS_ERROR_MESSAGE,
+)
+from userauth.api.v1.utils.handlers.user_bulk_import_handler import (
+    UserBulkImportHandler,
+)
+from userauth.api.v1.utils.user_import_parser import UserImportFileParser
+
+# ? Rows accepted per request; every password is hashed inside the request
+USER_BULK_IMPORT_MAX_ROWS: int = getattr(settings, "USER_BULK_IMPORT_MAX_ROWS", 50)
+
+
+class UserBulkImportSerializer(CoreGenericBulkSerializer):
+    """
+    Accepts the users either as `rows` or as an uploaded CSV/JSON `file`,
+    up to USER_BULK_IMPORT_MAX_ROWS users per request.
+    """
+
+    handler_class = UserBulkImportHandler
+    queryset = get_user_model().objects.all()
+
+    rows = serializers.ListField(
+        child=serializers.DictField(), allow_empty=False, required=False
+    )
+    file = serializers.FileField(required=False, write_only=True)
+    allow_partial = serializers.BooleanField(
+        default=False, help_text="Create the valid users even if some rows fail."
+    )
+    return_generated_passwords = serializers.BooleanField(
+        default=False,
+        help_text="Return the passwords generated for rows without one in plain text.",
+    )
+
+    def validate(self, data: Dict):
+        import_file = data.pop("file", None)
+        if import_file is not None:
+            try:
+                data["rows"] = UserImportFileParser.parse(
+                    content=import_file.read(), file_name=import_file.name
+                )
+            except ValueError as error:
+                raise serializers.ValidationError({"file": str(error)})
+        if not data.get("rows"):
+            raise serializers.ValidationError(
+                {"rows": "Provide the users as rows or as a CSV/JSON file."}
+            )
+        if len(data["rows"]) > USER_BULK_IMPORT_MAX_ROWS:
+            raise serializers.ValidationError(
+                {
+                    "rows": USER_BULK_IMPORT_TOO_MANY_ROWS_ERROR_MESSAGE.format(
+                        max_rows=USER_BULK_IMPORT_MAX_ROWS
+                    )
+                }
+            )
+        return super().validate(data)
@@ -0,0 +1,29 @@
+from .serializers import UserBulkImportSerializer
+from django.contrib.auth import get_user_model
+from coreutils.utils.generics.views.generic_views import CoreGenericBulkCreateAPIView
+from rest_framework import generics, parsers, permissions
+from userauth.api.v1.utils.constants import USER_BULK_IMPORT_SUCCESS_MESSAGE
+from userauth.api.v1.utils.custom_authentication.custom_authentication import (
+    CustomAuthentication,
+)
+
+
+class UserBulkImportAPIView(
+    CoreGenericBulkCreateAPIView,
+    generics.GenericAPIView,
+):
+    """
+    Admin-only import of many users from JSON rows or a CSV/JSON upload.
+    """
+
+    queryset = get_user_model().objects.all()
+    authentication_classes = [CustomAuthentication]
+    permission_classes = [permissions.IsAdminUser]
+    parser_classes = [parsers.JSONParser, parsers.MultiPartParser]
+    success_message = USER_BULK_IMPORT_SUCCESS_MESSAGE
+
+    def get_serializer_class(self):
+        serializer_class = {
+            "POST": UserBulkImportSerializer,
+        }
+        return serializer_class.get(self.request.method)
@@ -0,0 +1,20 @@
+from rest_framework import serializers
+from coreutils.utils.generics.serializers.mixins import CoreGenericSerializerMixin
+from userauth.api.v1.utils.handlers.session_revoke_handler import (
+    UserSessionRevokeHandler,
+)
+from userauth.models import BlackListTokenModel
+
+
+class UserSessionRevokeSerializer(CoreGenericSerializerMixin, serializers.Serializer):
+    queryset = BlackListTokenModel.objects.all()
+    session_id = serializers.UUIDField(required=False)
+    revoke_all = serializers.BooleanField(default=False)
+    handler_class = UserSessionRevokeHandler
+
+    def validate(self, data):
+        if not data.get("session_id") and not data.get("revoke_all"):
+            raise serializers.ValidationError(
+                {"session_id": "session_id is required unless revoke_all is set"}
+            )
+        return super().validate(data)
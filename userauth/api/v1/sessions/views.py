@@ -0,0 +1,53 @@
+from .serializers import UserSessionRevokeSerializer
+from coreutils.utils.generics.views.core_generic_utils import CoreGenericUtils
+from coreutils.utils.generics.views.generic_views import CoreGenericPostAPIView
+from coreutils.utils.jwt_token_utils import JwtTokenUtils
+from rest_framework import generics, permissions
+from rest_framework.request import Request
+from rest_framework.response import Response
+from typing import Dict, List
+from userauth.api.v1.utils.constants import (
+    USER_SESSION_LIST_SUCCESS_MESSAGE,
+    USER_SESSION_REVOKE_SUCCESS_MESSAGE,
+)
+from userauth.api.v1.utils.custom_authentication.custom_authentication import (
+    CustomAuthentication,
+)
+from userauth.api.v1.utils.session_registry import SessionRegistry
+
+
+class UserSessionListAPIView(CoreGenericUtils, generics.GenericAPIView):
+    """
+    Lists the authenticated user's active sessions from the session registry.
+    """
+
+    authentication_classes = [CustomAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+    success_message = USER_SESSION_LIST_SUCCESS_MESSAGE
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        current_token_hash: str = JwtTokenUtils.hash_token(str(request.auth))
+        sessions: Dict[str, Dict] = SessionRegistry.get_sessions(
+            username=request.user.get_username()
+        )
+        results: List[Dict] = [
+            {**session, "is_current": token_hash == current_token_hash}
+            for token_hash, session in sessions.items()
+        ]
+        results.sort(key=lambda session: str(session["created_at"]), reverse=True)
+        return self.success_response(results)
+
+
+class UserSessionRevokeAPIView(
+    CoreGenericPostAPIView,
+    generics.GenericAPIView,
+):
+    authentication_classes = [CustomAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+    success_message = USER_SESSION_REVOKE_SUCCESS_MESSAGE
+
+    def get_serializer_class(self):
+        serializer_class = {
+            "POST": UserSessionRevokeSerializer,
+        }
+        return serializer_class.get(self.request.method)
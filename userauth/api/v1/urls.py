@@ -3,6 +3,11 @@ from rest_framework_jwt.views import ObtainJSONWebTokenView
 from userauth.api.v1.authentication.serializers import UserLoginWebTokenSerializer
 
 from userauth.api.v1.authentication.views import UserAuthRegisterAPIView
+from userauth.api.v1.bulk_import.views import UserBulkImportAPIView
+from userauth.api.v1.sessions.views import (
+    UserSessionListAPIView,
+    UserSessionRevokeAPIView,
+)
 
 urlpatterns = [
     path(
@@ -16,4 +21,19 @@ urlpatterns = [
         name="UserAuthRegisterAPIView",
     ),
     # UserAuthRegisterAPIView
+    path(
+        "user-bulk-import-api/",
+        UserBulkImportAPIView.as_view(),
+        name="UserBulkImportAPIView",
+    ),
+    path(
+        "sessions/",
+        UserSessionListAPIView.as_view(),
+        name="UserSessionListAPIView",
+    ),
+    path(
+        "sessions/revoke/",
+        UserSessionRevokeAPIView.as_view(),
+        name="UserSessionRevokeAPIView",
+    ),
 ]
@@ -5,6 +5,13 @@ INCORRECT_CREDENTIALS_ERROR_MESSAGE = (
 ACCOUNT_INACTIVE_ERROR_MESSAGE = "No active account found with this email."
 BLACKLIST_TOKEN_ALREADY_EXISTS_ERROR_MESSAGE = "User have active session"
 USER_IS_NOT_ACTIVE_ERROR_MESSAGE = "User is not active"
+PASSWORD_HASHING_BUSY_ERROR_MESSAGE = (
+    "Too many sign-in requests are being processed, please retry shortly."
+)
+USER_BULK_IMPORT_TOO_MANY_ROWS_ERROR_MESSAGE = (
+    "At most {max_rows} users can be imported per request; "
+    "use `manage.py import_users` for larger imports."
+)
 
 
 USER_REGISTERED_SUCCESS_MESSAGE = {
@@ -13,3 +20,24 @@ USER_REGISTERED_SUCCESS_MESSAGE = {
         "description": "User registered successfully",
     },
 }
+
+USER_SESSION_LIST_SUCCESS_MESSAGE = {
+    "GET": {
+        "title": "Active Sessions",
+        "description": "Active sessions fetched successfully",
+    },
+}
+
+USER_SESSION_REVOKE_SUCCESS_MESSAGE = {
+    "POST": {
+        "title": "Session Revoked",
+        "description": "Session revoked successfully",
+    },
+}
+
+USER_BULK_IMPORT_SUCCESS_MESSAGE = {
+    "POST": {
+        "title": "Users Imported",
+        "description": "Users imported successfully",
+    },
+}
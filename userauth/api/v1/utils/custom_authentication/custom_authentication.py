@@ -1,11 +1,11 @@
-from rest_framework_jwt.authentication import (
-    JSONWebTokenAuthentication,
-    get_authorization_header,
-)
+from rest_framework_jwt.authentication import JSONWebTokenAuthentication
+from rest_framework_jwt.compat import ExpiredSignature
+import jwt
 import logging
 from core.settings import logger
+from django.contrib.auth.models import AbstractBaseUser
 from rest_framework.request import Request
-from typing import List
+from typing import Dict, Tuple, Union
 from userauth.api.v1.utils.custom_authentication.validations import (
     CustomAuthenticationValidator,
 )
@@ -15,21 +15,60 @@ from rest_framework import exceptions
 class CustomAuthentication(JSONWebTokenAuthentication):
     """
     Custom Authentication Class for User's
+
+    The JWT is decoded and verified once per request. Its claims are attached
+    to the request as `request.jwt_claims` and reused for the expiry check,
+    the revocation check and the user lookup.
     """
 
     logger = logging.LoggerAdapter(logger, {"app_name": "CustomAuthentication"})
 
     www_authenticate_realm: str = "api"
 
-    def get_token_from_request(self, request: Request):
+    custom_validator: CustomAuthenticationValidator
 
-        auth: List = get_authorization_header(request).split()
-        custom_validator: CustomAuthenticationValidator = CustomAuthenticationValidator(
-            request=request
+    def get_token_from_request(self, request: Request) -> str:
+        self.custom_validator: CustomAuthenticationValidator = (
+            CustomAuthenticationValidator(request=request)
+        )
+        validator: Union[str, None] = (
+            self.custom_validator.auth_headers_length_validator()
         )
-        validator: str = custom_validator.validator()
 
         if validator:
             raise exceptions.AuthenticationFailed(validator)
 
-        return auth[1]
+        return self.custom_validator.authentication_details.jwt_token
+
+    def get_verified_claims(self, request: Request, token: str) -> Dict:
+        """
+        Decodes the token, verifying its signature and expiry, and attaches the
+        claims to the request.
+
+        Args:
+            request (Request): The incoming request.
+            token (str): The JWT from the Authorization header.
+
+        Returns:
+            Dict: The token's claims.
+        """
+        try:
+            claims: Dict = self.jwt_decode_token(token)
+        except ExpiredSignature:
+            raise exceptions.AuthenticationFailed("jwt token expired")
+        except jwt.InvalidTokenError:
+            raise exceptions.AuthenticationFailed("Invalid token.")
+
+        request.jwt_claims = claims
+        return claims
+
+    def authenticate(self, request: Request) -> Tuple[AbstractBaseUser, str]:
+        token: str = self.get_token_from_request(request)
+        claims: Dict = self.get_verified_claims(request=request, token=token)
+
+        self.custom_validator.set_claims(claims=claims)
+        validator: Union[str, None] = self.custom_validator.validator()
+        if validator:
+            raise exceptions.AuthenticationFailed(validator)
+
+        return self.authenticate_credentials(claims), token
@@ -0,0 +1,86 @@
+import logging
+from typing import Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.settings import logger
+from coreutils.utils.ttl_lru_cache import TTLLRUCache
+from userauth.api.v1.utils.session_registry import SessionRegistry
+
+logger = logging.LoggerAdapter(logger, {"app_name": "TokenRevocationCache"})
+
+# ? Seconds a token's login state is trusted without checking the database
+JWT_REVOCATION_CACHE_TTL: int = getattr(settings, "JWT_REVOCATION_CACHE_TTL", 30)
+# ? Maximum number of token states kept per process
+JWT_REVOCATION_CACHE_SIZE: int = getattr(settings, "JWT_REVOCATION_CACHE_SIZE", 10000)
+
+TOKEN_VERSION_CACHE_KEY: str = "jwt-token-version:{username}"
+
+
+class TokenRevocationCache:
+    """
+    Answers "is this token still logged in?" from memory where possible.
+
+    Token states are kept in a per-process TTL LRU keyed by the token digest.
+    Each entry records the user's token version at the time it was loaded; the
+    version lives in Django's cache and is bumped whenever the user's tokens
+    change (login, re-login, revocation), so a stale entry is ignored as soon
+    as the version moves. The TTL bounds staleness when the cache backend is
+    not shared between processes. Misses are answered by `SessionRegistry`,
+    which confirms tokens it does not know with an indexed DB lookup.
+    """
+
+    states: TTLLRUCache = TTLLRUCache(
+        ttl=JWT_REVOCATION_CACHE_TTL, max_size=JWT_REVOCATION_CACHE_SIZE
+    )
+
+    @classmethod
+    def get_version(cls, username: str) -> int:
+        """
+        Returns the user's current token version.
+        """
+        return cache.get(TOKEN_VERSION_CACHE_KEY.format(username=username), 0)
+
+    @classmethod
+    def bump_version(cls, username: str):
+        """
+        Invalidates every cached token state of the user.
+        """
+        version_key: str = TOKEN_VERSION_CACHE_KEY.format(username=username)
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.set(version_key, 1, timeout=None)
+
+    @classmethod
+    def sessions_changed(cls, username: str):
+        """
+        Refreshes the session registry and invalidates cached token states.
+        Call after the transaction that changed the user's tokens commits.
+        """
+        SessionRegistry.sync(username=username)
+        cls.bump_version(username=username)
+
+    @classmethod
+    def is_token_active(cls, token_hash: str, username: str) -> bool:
+        """
+        Checks whether the token is an active login, using the cache first.
+
+        Args:
+            token_hash (str): Digest of the JWT.
+            username (str): `username` claim of the JWT, scopes the version stamp.
+
+        Returns:
+            bool: True if the token belongs to an active login.
+        """
+        version: int = cls.get_version(username=username)
+        cached_state: Tuple[int, bool] = cls.states.get(token_hash)
+        if cached_state is not None and cached_state[0] == version:
+            return cached_state[1]
+
+        is_active: bool = SessionRegistry.is_token_active(
+            username=username, token_hash=token_hash
+        )
+        cls.states.set(token_hash, (version, is_active))
+        return is_active
@@ -2,13 +2,16 @@ from rest_framework.request import Request
 from rest_framework_jwt.authentication import (
     get_authorization_header,
 )
-from typing import List, ByteString, Union, Callable
+import time
+from typing import Dict, List, ByteString, Union, Callable
 from rest_framework_jwt.settings import api_settings
 from django.utils.encoding import smart_str
 import logging
 from core.settings import logger
 from django.conf import settings
-from userauth.models import BlackListTokenModel
+from userauth.api.v1.utils.custom_authentication.revocation_cache import (
+    TokenRevocationCache,
+)
 from coreutils.utils.jwt_token_utils import JwtTokenUtils
 
 DISABLE_MULTI_LOGIN: List = getattr(settings, "DISABLE_MULTI_LOGIN", True)
@@ -46,8 +49,17 @@ class ExtractAuthenticationDetails:
 
 
 class CustomAuthenticationValidator:
+    """
+    Validates the Authorization header and the claims of an already decoded JWT.
+
+    The token is decoded (and its signature verified) once by
+    `CustomAuthentication`; the claims are handed over with `set_claims` and
+    reused by every claim-based check.
+    """
+
     request: Request
     authentication_details: ExtractAuthenticationDetails
+    claims: Dict
     DISABLE_MULTI_LOGIN: bool = getattr(settings, "DISABLE_MULTI_LOGIN", None)
     logger = logging.LoggerAdapter(
         logger, {"app_name": "CustomAuthenticationValidator"}
@@ -56,6 +68,13 @@ class CustomAuthenticationValidator:
     def __init__(self, request: Request):
         self.request = request
         self.authentication_details = ExtractAuthenticationDetails(request=request)
+        self.claims: Dict = {}
+
+    def set_claims(self, claims: Dict):
+        """
+        Attaches the verified claims of the request's JWT.
+        """
+        self.claims: Dict = claims
 
     def auth_headers_length_validator(self) -> Union[str, None]:
         if not self.authentication_details.jwt_token:
@@ -86,25 +105,27 @@ class CustomAuthenticationValidator:
         if not DISABLE_MULTI_LOGIN:
             return
 
-        blacklist_token_queryset = BlackListTokenModel.objects.filter(
-            token=self.authentication_details.jwt_token, is_login=True
+        # ? Indexed digest lookup, answered from the in-process cache when fresh
+        is_token_active: bool = TokenRevocationCache.is_token_active(
+            token_hash=JwtTokenUtils.hash_token(self.authentication_details.jwt_token),
+            username=self.claims.get("username", ""),
         )
-        if not blacklist_token_queryset.exists():
+        if not is_token_active:
             error_message: str = "Signature has expired"
             self.logger.error(error_message)
             return error_message
 
     def token_validator(self) -> Union[str, None]:
-        jwt_token_util: JwtTokenUtils = JwtTokenUtils(
-            jwt_token=self.authentication_details.jwt_token
-        )
-        print("jwt_token_util.is_token_expired()", jwt_token_util.is_token_expired())
-        if jwt_token_util.is_token_expired():
+        # ? The signature was verified on decode; `exp` is read from the same claims
+        expiration_timestamp: Union[int, None] = self.claims.get("exp")
+        if expiration_timestamp is None or expiration_timestamp <= time.time():
             return "jwt token expired"
 
     def validator(self) -> str:
+        """
+        Runs the claim-based checks. Expects `set_claims` to have been called.
+        """
         validate_methods: List[Callable] = [
-            self.auth_headers_length_validator,
             self.token_validator,
             self.black_list_token_validator,
         ]
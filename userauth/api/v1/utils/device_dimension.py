@@ -0,0 +1,159 @@
+import hashlib
+import logging
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List
+
+import user_agents
+from django.conf import settings
+
+from core.settings import logger
+from coreutils.utils.ttl_lru_cache import TTLLRUCache
+from userauth.models import DeviceDimensionModel
+
+logger = logging.LoggerAdapter(logger, {"app_name": "DeviceDimensionResolver"})
+
+# ? Distinct user-agent strings whose parsed form is kept per process
+USER_AGENT_PARSER_CACHE_SIZE: int = getattr(
+    settings, "USER_AGENT_PARSER_CACHE_SIZE", 2048
+)
+# ? Seconds a user-agent hash -> device id mapping is reused without a query
+DEVICE_DIMENSION_CACHE_TTL: int = getattr(settings, "DEVICE_DIMENSION_CACHE_TTL", 3600)
+
+
+@lru_cache(maxsize=USER_AGENT_PARSER_CACHE_SIZE)
+def parse_user_agent(user_agent: str) -> Dict[str, str]:
+    """
+    Parses a user-agent string into the device dimension fields.
+    Cached because the same few browsers account for almost every login;
+    callers must not modify the returned dict.
+
+    Args:
+        user_agent (str): Raw `HTTP_USER_AGENT` value.
+
+    Returns:
+        Dict[str, str]: Browser, OS and device fields plus a short `label`.
+    """
+    parsed_user_agent: user_agents.parsers.UserAgent = user_agents.parse(user_agent)
+    if parsed_user_agent.is_bot:
+        device_type: str = "bot"
+    elif parsed_user_agent.is_tablet:
+        device_type: str = "tablet"
+    elif parsed_user_agent.is_mobile:
+        device_type: str = "mobile"
+    elif parsed_user_agent.is_pc:
+        device_type: str = "pc"
+    else:
+        device_type: str = "other"
+
+    return {
+        "browser_family": parsed_user_agent.browser.family[:100],
+        "browser_version": parsed_user_agent.browser.version_string[:50],
+        "os_family": parsed_user_agent.os.family[:100],
+        "os_version": parsed_user_agent.os.version_string[:50],
+        "device_family": parsed_user_agent.device.family[:100],
+        "device_type": device_type,
+        "label": str(parsed_user_agent)[:255],
+    }
+
+
+class DeviceDimensionResolver:
+    """
+    Maps user-agent strings to `DeviceDimensionModel` ids.
+
+    Ids are cached per process by user-agent hash; unknown user agents are
+    looked up with one query per batch and the missing ones are inserted
+    with one `bulk_create`.
+    """
+
+    device_ids: TTLLRUCache = TTLLRUCache(
+        ttl=DEVICE_DIMENSION_CACHE_TTL, max_size=USER_AGENT_PARSER_CACHE_SIZE
+    )
+
+    @staticmethod
+    def hash_user_agent(user_agent: str) -> str:
+        return hashlib.sha256(user_agent.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def get_label(cls, user_agent: str) -> str:
+        """
+        Returns the short label stored as `LoginAnalyticsModel.device_name`.
+        """
+        return parse_user_agent(user_agent or "")["label"]
+
+    @classmethod
+    def build_instance(
+        cls, user_agent: str, user_agent_hash: str
+    ) -> DeviceDimensionModel:
+        device_fields: Dict[str, str] = dict(parse_user_agent(user_agent))
+        device_fields.pop("label")
+        return DeviceDimensionModel(
+            user_agent_hash=user_agent_hash, user_agent=user_agent, **device_fields
+        )
+
+    @classmethod
+    def resolve_many(cls, user_agent_strings: Iterable[str]) -> Dict[str, Any]:
+        """
+        Returns the device id of every user agent, creating missing dimension rows.
+
+        Args:
+            user_agent_strings (Iterable[str]): Raw user-agent strings.
+
+        Returns:
+            Dict[str, Any]: Device id keyed by user-agent string.
+        """
+        user_agent_hashes: Dict[str, str] = {
+            cls.hash_user_agent(user_agent or ""): user_agent or ""
+            for user_agent in user_agent_strings
+        }
+        resolved_ids: Dict[str, Any] = {}
+        for user_agent_hash in user_agent_hashes:
+            device_id: Any = cls.device_ids.get(user_agent_hash)
+            if device_id is not None:
+                resolved_ids[user_agent_hash] = device_id
+
+        missing_hashes: List[str] = [
+            user_agent_hash
+            for user_agent_hash in user_agent_hashes
+            if user_agent_hash not in resolved_ids
+        ]
+        if missing_hashes:
+            resolved_ids.update(cls.fetch_ids(user_agent_hashes=missing_hashes))
+
+        new_hashes: List[str] = [
+            user_agent_hash
+            for user_agent_hash in missing_hashes
+            if user_agent_hash not in resolved_ids
+        ]
+        if new_hashes:
+            DeviceDimensionModel.objects.bulk_create(
+                [
+                    cls.build_instance(
+                        user_agent=user_agent_hashes[user_agent_hash],
+                        user_agent_hash=user_agent_hash,
+                    )
+                    for user_agent_hash in new_hashes
+                ],
+                ignore_conflicts=True,
+            )
+            # ? Read back the ids, another process may have inserted the same rows
+            resolved_ids.update(cls.fetch_ids(user_agent_hashes=new_hashes))
+            logger.info("Added %s device dimension rows", len(new_hashes))
+
+        return {
+            user_agent: resolved_ids.get(user_agent_hash)
+            for user_agent_hash, user_agent in user_agent_hashes.items()
+        }
+
+    @classmethod
+    def fetch_ids(cls, user_agent_hashes: List[str]) -> Dict[str, Any]:
+        """
+        Loads existing device ids for the hashes and caches them.
+        """
+        device_ids: Dict[str, Any] = dict(
+            DeviceDimensionModel.objects.filter(
+                user_agent_hash__in=user_agent_hashes
+            ).values_list("user_agent_hash", "id")
+        )
+        for user_agent_hash, device_id in device_ids.items():
+            cls.device_ids.set(user_agent_hash, device_id)
+        return device_ids
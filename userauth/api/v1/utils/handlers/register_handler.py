@@ -1,11 +1,29 @@
 from django.db import transaction
 from coreutils.utils.generics.serializers.mixins import CoreGenericBaseHandler
-from userauth.models import UserModel
+from coreutils.utils.generics.serializers.validation_context import (
+    ValidationContextLoader,
+)
+from coreutils.utils.password_hashing import (
+    PasswordHashingBusyError,
+    PasswordHashingExecutor,
+)
+from userauth.api.v1.utils.constants import PASSWORD_HASHING_BUSY_ERROR_MESSAGE
 
 
 class UserAuthRegisterHandler(CoreGenericBaseHandler):
+    # ? Hashed before the insert so the row is written once
+    password_hash: str
+
+    def declare_validation_context(self, context: ValidationContextLoader):
+        context.declare_by_field(
+            key="existing_user",
+            queryset=self.queryset,
+            field_name="email",
+            value=self.data["email"],
+        )
+
     def validate(self):
-        if self.queryset.filter(email=self.data["email"]).exists():
+        if self.validation_context.get("existing_user") is not None:
             return self.set_error_message(
                 error_message={
                     "title": "Failed to update.",
@@ -13,15 +31,26 @@ class UserAuthRegisterHandler(CoreGenericBaseHandler):
                 },
                 key="email",
             )
+        try:
+            self.password_hash = PasswordHashingExecutor.make_password(
+                raw_password=self.data["password"]
+            )
+        except PasswordHashingBusyError:
+            return self.set_error_message(
+                error_message={
+                    "title": "Service busy.",
+                    "description": PASSWORD_HASHING_BUSY_ERROR_MESSAGE,
+                },
+            )
         return
 
     def create(self):
         try:
             with transaction.atomic():
-                instance: UserModel = self.queryset.create(
-                    email=self.data["email"], username=self.data["username"]
+                self.queryset.create(
+                    email=self.data["email"],
+                    username=self.data["username"],
+                    password=self.password_hash,
                 )
-                instance.set_password(raw_password=self.data["password"])
-                instance.save()
         except Exception as e:
             raise Exception(f"Error while updating user details : {str(e)}")
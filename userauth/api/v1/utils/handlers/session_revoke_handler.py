@@ -0,0 +1,87 @@
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models.query import QuerySet
+from coreutils.utils.generics.serializers.mixins import CoreGenericBaseHandler
+from userauth.api.v1.utils.custom_authentication.revocation_cache import (
+    TokenRevocationCache,
+)
+from userauth.api.v1.utils.session_registry import SessionRegistry
+from userauth.models import BlackListTokenModel
+from typing import Dict, List
+
+
+class UserSessionRevokeHandler(CoreGenericBaseHandler):
+    """
+    Revokes one of the authenticated user's sessions, or all of them.
+
+    Expects the following keys in `self.data`:
+    - session_id: ID of the session to revoke (optional when `revoke_all` is set)
+    - revoke_all: Revoke every active session of the user
+    """
+
+    session_ids: List[str]
+
+    incorrect_session_message: Dict = {
+        "title": "Incorrect Id",
+        "description": "session id is incorrect or already revoked",
+    }
+
+    def is_session_active(self, session_id: str) -> bool:
+        """
+        Checks the session belongs to the user and is logged in. The session
+        registry answers first; a miss is confirmed on the table, since the
+        session may have been created by another worker.
+        """
+        active_session_ids: List[str] = [
+            session["session_id"]
+            for session in SessionRegistry.get_active_sessions(
+                username=self.request.user.get_username()
+            )
+        ]
+        if session_id in active_session_ids:
+            return True
+        try:
+            return BlackListTokenModel.objects.filter(
+                pk=session_id, user=self.request.user, is_login=True
+            ).exists()
+        except ValidationError:
+            return False
+
+    def validate(self):
+        """
+        Checks the session to revoke belongs to the user. `revoke_all` needs
+        no check: it revokes whatever is logged in when the update runs.
+        """
+        if self.data.get("revoke_all"):
+            self.session_ids = []
+            return
+
+        session_id: str = str(self.data.get("session_id") or "")
+        if not self.is_session_active(session_id=session_id):
+            return self.set_error_message(
+                error_message=self.incorrect_session_message, key="session_id"
+            )
+        self.session_ids = [session_id]
+
+    def create(self):
+        """
+        Marks the sessions as logged out and refreshes the registry after commit.
+        """
+        with transaction.atomic():
+            blacklist_token_queryset: QuerySet[BlackListTokenModel] = (
+                BlackListTokenModel.objects.filter(
+                    user=self.request.user, is_login=True
+                )
+            )
+            if not self.data.get("revoke_all"):
+                blacklist_token_queryset: QuerySet[BlackListTokenModel] = (
+                    blacklist_token_queryset.filter(pk__in=self.session_ids)
+                )
+            revoked: int = blacklist_token_queryset.update(
+                is_login=False, is_delete=True
+            )
+            username: str = self.request.user.get_username()
+            transaction.on_commit(
+                lambda: TokenRevocationCache.sessions_changed(username=username)
+            )
+        self.data["revoked_sessions"] = revoked
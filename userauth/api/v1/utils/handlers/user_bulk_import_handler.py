@@ -0,0 +1,158 @@
+import time
+from django.contrib.auth.base_user import BaseUserManager
+from django.db.models import Model
+from rest_framework import serializers
+from coreutils.utils.generics.serializers.handlers import (
+    CoreGenericBulkCreateHandler,
+)
+from coreutils.utils.password_hashing import (
+    PasswordHashingBusyError,
+    PasswordHashingExecutor,
+)
+from coreutils.utils.random_password import generate_random_password
+from userauth.api.v1.utils.constants import PASSWORD_HASHING_BUSY_ERROR_MESSAGE
+from typing import Dict, List, Type
+
+
+class UserImportRowSerializer(serializers.Serializer):
+    """
+    Field-level checks for one imported user.
+    A missing password is replaced by a generated one.
+    """
+
+    email = serializers.EmailField(max_length=100)
+    username = serializers.CharField(max_length=100, required=False)
+    password = serializers.CharField(max_length=100, required=False)
+    is_client = serializers.BooleanField(default=False)
+    is_instructor = serializers.BooleanField(default=False)
+
+
+class UserBulkImportHandler(CoreGenericBulkCreateHandler):
+    """
+    Creates many users in one request.
+
+    Emails are checked against existing users with a single query, the
+    passwords are hashed at the end of validation, before the transaction
+    opens, and the users are inserted with `bulk_create` in batches.
+    In a request every hash takes a slot of `PasswordHashingExecutor`, like
+    logins and registrations; the `import_users` command raises
+    `hash_max_workers` to hash in a process pool instead.
+    Imported users are active, verified and approved, like the clients
+    created through bookings.
+
+    Expects in `self.data`, next to `rows`:
+    - allow_partial: Create the valid users even if some rows fail
+    - return_generated_passwords: Return generated passwords in plain text
+
+    Adds to `self.data` after the write:
+    - generated_passwords: Generated password per email, only when requested
+    - generated_password_emails: Otherwise, the emails that got a generated password
+    - import_report: Row counts, hashing/insert time and users per second
+    """
+
+    row_serializer_class: Type[serializers.Serializer] = UserImportRowSerializer
+
+    hash_max_workers: int = 1
+
+    generated_passwords: Dict[str, str]
+    hash_seconds: float
+
+    duplicate_email_message: str = "Email is repeated in the import."
+    existing_email_message: str = "An account with this email already exists."
+
+    def validate(self):
+        self.allow_partial = bool(self.data.get("allow_partial"))
+        super().validate()
+        if self.data.get("error_message"):
+            return
+        try:
+            self.hash_passwords()
+        except PasswordHashingBusyError:
+            return self.set_error_message(
+                error_message={
+                    "title": "Service busy.",
+                    "description": PASSWORD_HASHING_BUSY_ERROR_MESSAGE,
+                },
+            )
+
+    def validate_batch(self, rows: Dict[int, Dict]):
+        """
+        Reports emails repeated within the payload and emails that already
+        have an account, using one query for the whole payload.
+        """
+        seen_emails: Dict[str, int] = {}
+        for index, row in rows.items():
+            row["email"] = BaseUserManager.normalize_email(row["email"])
+            if row["email"] in seen_emails:
+                self.add_row_error(
+                    index=index, error={"email": self.duplicate_email_message}
+                )
+            else:
+                seen_emails[row["email"]] = index
+
+        existing_emails: List[str] = self.queryset.filter(
+            email__in=list(seen_emails)
+        ).values_list("email", flat=True)
+        for email in existing_emails:
+            self.add_row_error(
+                index=seen_emails[email], error={"email": self.existing_email_message}
+            )
+
+    def hash_passwords(self):
+        """
+        Fills in missing passwords and replaces every raw password with its hash.
+        """
+        self.generated_passwords: Dict[str, str] = {}
+        rows: List[Dict] = [row for _, row in sorted(self.valid_rows.items())]
+        for row in rows:
+            if not row.get("password"):
+                row["password"] = generate_random_password()
+                self.generated_passwords[row["email"]] = row["password"]
+
+        started_at: float = time.perf_counter()
+        if self.hash_max_workers > 1:
+            password_hashes: List[str] = PasswordHashingExecutor.make_passwords(
+                raw_passwords=[row["password"] for row in rows],
+                max_workers=self.hash_max_workers,
+            )
+        else:
+            password_hashes: List[str] = [
+                PasswordHashingExecutor.make_password(raw_password=row["password"])
+                for row in rows
+            ]
+        self.hash_seconds: float = time.perf_counter() - started_at
+        for row, password_hash in zip(rows, password_hashes):
+            row["password"] = password_hash
+
+    def build_instance(self, row: Dict) -> Model:
+        return self.queryset.model(
+            is_active=True, is_verified=True, is_approved=True, **row
+        )
+
+    def create(self):
+        """
+        Inserts the users; the passwords were hashed during validation, outside
+        the transaction, so the insert holds it only briefly.
+        """
+        started_at: float = time.perf_counter()
+        super().create()
+        if self.data.get("error_message"):
+            return
+        insert_seconds: float = time.perf_counter() - started_at
+
+        total_seconds: float = self.hash_seconds + insert_seconds
+        self.data.pop("allow_partial", None)
+        if self.data.pop("return_generated_passwords", False):
+            self.data["generated_passwords"] = self.generated_passwords
+        else:
+            self.data["generated_password_emails"] = list(self.generated_passwords)
+        self.data["import_report"] = {
+            "rows_received": len(self.valid_rows) + len(self.row_errors),
+            "rows_written": self.data["written"],
+            "rows_failed": len(self.row_errors),
+            "hash_seconds": round(self.hash_seconds, 3),
+            "insert_seconds": round(insert_seconds, 3),
+            "users_per_second": (
+                round(self.data["written"] / total_seconds, 1) if total_seconds else 0.0
+            ),
+        }
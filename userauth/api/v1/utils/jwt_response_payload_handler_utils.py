@@ -1,6 +1,7 @@
 import logging
 from datetime import datetime
 
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractBaseUser
 from django.db import transaction
 from django.db.models.query import QuerySet
@@ -9,7 +10,12 @@ from rest_framework.request import Request
 
 from core.settings import logger
 from typing import Dict
-from userauth.models import BlackListTokenModel, LoginAnalyticsModel
+from coreutils.utils.jwt_token_utils import JwtTokenUtils
+from userauth.api.v1.utils.custom_authentication.revocation_cache import (
+    TokenRevocationCache,
+)
+from userauth.api.v1.utils.login_analytics_pipeline import LoginAnalyticsPipeline
+from userauth.models import BlackListTokenModel
 
 
 # ? ? Configuring logger with the app name "JWTSettings"
@@ -68,33 +74,30 @@ class UserLoginCreateUtils:
             ip: str = self.meta.get("REMOTE_ADDR", "0.0.0.0")
         return ip
 
-    def add_user_login_analytics_instance(self, token: str) -> LoginAnalyticsModel:
+    def add_user_login_analytics_instance(self, token: str) -> Dict:
         """
-        Creates a login analytics record for the user.
+        Queues a login analytics event for the user. The row is written by
+        LoginAnalyticsPipeline after the login transaction commits.
 
         Args:
             token (str): The JWT token used for login.
 
         Returns:
-            LoginAnalyticsModel: The created login analytics instance.
+            Dict: The queued login analytics event.
         """
-        user_login_analytics_queryset: QuerySet[LoginAnalyticsModel] = (
-            LoginAnalyticsModel.objects.filter(user=self.user_instance)
-        )
-
-        logger.info(f"User Agent: {self.user_agent}")
-        logger.info(f"User IP Address: {self.get_ip_address()}")
-
-        login_analytics_instance = user_login_analytics_queryset.create(
-            user=self.user_instance,
+        login_analytics_event: Dict = LoginAnalyticsPipeline.build_event(
+            user_instance=self.user_instance,
             ip_address=self.get_ip_address(),
-            login_count=user_login_analytics_queryset.count() + 1,
-            device_name=self.user_agent,
+            user_agent=self.user_agent,
             token=token,
         )
+        LoginAnalyticsPipeline.enqueue_on_commit(event=login_analytics_event)
 
-        logger.info(f"Login Analytics Instance Created: {login_analytics_instance}")
-        return login_analytics_instance
+        logger.info(
+            f"Login analytics queued, IP: {login_analytics_event['ip_address']}, "
+            f"User Agent: {self.user_agent}"
+        )
+        return login_analytics_event
 
     def create_and_block_existing_token(self, token: str) -> BlackListTokenModel:
         """
@@ -106,27 +109,34 @@ class UserLoginCreateUtils:
         Returns:
             BlackListTokenModel: The latest created blacklist token instance.
         """
-        with transaction.atomic():
+        # ? Joins the caller's transaction without an extra savepoint
+        with transaction.atomic(savepoint=False):
             blacklist_token_queryset: QuerySet[BlackListTokenModel] = (
                 BlackListTokenModel.objects.filter(
                     user=self.user_instance, is_login=True, is_delete=False
                 )
             )
 
-            active_blacklist_token_instances = blacklist_token_queryset.filter(
-                is_login=True
-            )
-
             # ? If re-login is requested, deactivate existing tokens
             if self.request.data.get("re_login", False):
-                tokens_updated = active_blacklist_token_instances.update(
+                tokens_updated: int = blacklist_token_queryset.update(
                     is_login=False, is_delete=True
                 )
                 logger.info(f"Tokens Deactivated: {tokens_updated}")
 
             # ? Create new blacklist token entry
             latest_blacklist_token = blacklist_token_queryset.create(
-                user=self.user_instance, is_login=True, token=token
+                user=self.user_instance,
+                is_login=True,
+                token=token,
+                token_hash=JwtTokenUtils.hash_token(token),
+            )
+
+            # ? Refresh the session registry once the change is committed
+            transaction.on_commit(
+                lambda: TokenRevocationCache.sessions_changed(
+                    username=self.user_instance.get_username()
+                )
             )
 
             logger.info(f"New Blacklist Token Created: {latest_blacklist_token}")
@@ -141,7 +151,10 @@ class UserLoginCreateUtils:
         Updates the last login timestamp for the user.
         """
         self.user_instance.last_login = django_now()
-        self.user_instance.save()
+        # ? Targeted update; login_count is maintained by LoginAnalyticsPipeline
+        get_user_model().objects.filter(pk=self.user_instance.pk).update(
+            last_login=self.user_instance.last_login
+        )
 
     def get_jwt_response_payload(self) -> dict:
         """
@@ -186,14 +199,16 @@ def jwt_response_payload_handler(
     """
     login_utils = UserLoginCreateUtils(request=request, user_instance=user, token=token)
 
-    # ? Blacklist old tokens and create a new one
-    login_utils.create_and_block_existing_token(token=token)
+    # ? All login writes share one short transaction
+    with transaction.atomic():
+        # ? Blacklist old tokens and create a new one
+        login_utils.create_and_block_existing_token(token=token)
 
-    # ? Fetching the response Payload
-    response_data: Dict = login_utils.get_jwt_response_payload()
+        # ? Fetching the response Payload (before last_login changes is_first_login)
+        response_data: Dict = login_utils.get_jwt_response_payload()
 
-    # ? Update last login timestamp
-    login_utils.update_user_instance()
+        # ? Update last login timestamp
+        login_utils.update_user_instance()
 
     logger.info(f"Token Issued At: {issued_at}")
     logger.info(f"{str(user)} Logged in sucessfully")
@@ -0,0 +1,260 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Dict, List
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AbstractBaseUser
+from django.db import close_old_connections, transaction
+
+from core.settings import logger
+from coreutils.utils.jwt_token_utils import JwtTokenUtils
+from userauth.api.v1.utils.device_dimension import DeviceDimensionResolver
+from userauth.models import LoginAnalyticsModel
+
+logger = logging.LoggerAdapter(logger, {"app_name": "LoginAnalyticsPipeline"})
+
+# ? Write analytics from a background thread; when False events are written on commit
+LOGIN_ANALYTICS_ASYNC: bool = getattr(settings, "LOGIN_ANALYTICS_ASYNC", True)
+# ? Maximum number of events written per flush
+LOGIN_ANALYTICS_BATCH_SIZE: int = getattr(settings, "LOGIN_ANALYTICS_BATCH_SIZE", 500)
+# ? Seconds the worker waits for more events before flushing a partial batch
+LOGIN_ANALYTICS_FLUSH_INTERVAL: float = getattr(
+    settings, "LOGIN_ANALYTICS_FLUSH_INTERVAL", 1.0
+)
+# ? Attempts made to write a batch before its events are re-queued
+LOGIN_ANALYTICS_MAX_ATTEMPTS: int = getattr(settings, "LOGIN_ANALYTICS_MAX_ATTEMPTS", 3)
+# ? Times an event goes back to the queue after a failed batch before it is dropped
+LOGIN_ANALYTICS_MAX_REQUEUES: int = getattr(settings, "LOGIN_ANALYTICS_MAX_REQUEUES", 3)
+# ? Events held in memory before enqueue starts writing synchronously
+LOGIN_ANALYTICS_QUEUE_SIZE: int = getattr(settings, "LOGIN_ANALYTICS_QUEUE_SIZE", 10000)
+
+
+class LoginAnalyticsPipeline:
+    """
+    Write-behind pipeline for login analytics.
+
+    A login only enqueues a small event dict (after its transaction commits).
+    A daemon worker thread drains the queue and writes events in batches:
+    the users' `login_count` counters are incremented under a row lock and
+    the analytics rows are inserted with one `bulk_create`, so the cost of a
+    login no longer depends on the size of the user's login history.
+
+    Events still queued when the process exits are flushed by an `atexit` hook.
+    """
+
+    events: "queue.Queue[Dict]" = queue.Queue(maxsize=LOGIN_ANALYTICS_QUEUE_SIZE)
+    worker: threading.Thread = None
+    worker_lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def build_event(
+        cls,
+        user_instance: AbstractBaseUser,
+        ip_address: str,
+        user_agent: str,
+        token: str,
+    ) -> Dict:
+        """
+        Builds the event recorded for a single login.
+        """
+        return {
+            "user_id": user_instance.pk,
+            "ip_address": ip_address,
+            "user_agent": user_agent or "",
+            # ? Only the digest is kept; the token itself lives in the blacklist table
+            "token": JwtTokenUtils.hash_token(token) if token else None,
+        }
+
+    @classmethod
+    def enqueue_on_commit(cls, event: Dict):
+        """
+        Enqueues the event once the surrounding transaction commits,
+        so rolled back logins are never recorded.
+        """
+        transaction.on_commit(lambda: cls.enqueue(event=event))
+
+    @classmethod
+    def enqueue(cls, event: Dict):
+        """
+        Hands an event to the worker, or writes it directly when the pipeline
+        runs synchronously or the queue is full.
+        """
+        if not LOGIN_ANALYTICS_ASYNC:
+            cls.write_events(events=[event])
+            return
+
+        cls.start_worker()
+        try:
+            cls.events.put_nowait(event)
+        except queue.Full:
+            logger.warning("Login analytics queue is full, writing synchronously")
+            cls.write_events(events=[event])
+
+    @classmethod
+    def start_worker(cls):
+        """
+        Starts the worker thread on first use.
+        """
+        if cls.worker is not None and cls.worker.is_alive():
+            return
+        with cls.worker_lock:
+            if cls.worker is None or not cls.worker.is_alive():
+                cls.worker = threading.Thread(
+                    target=cls.run_worker, name="login-analytics", daemon=True
+                )
+                cls.worker.start()
+
+    @classmethod
+    def drain(cls, timeout: float = None) -> List[Dict]:
+        """
+        Takes up to one batch of events from the queue.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the first event. None returns immediately.
+
+        Returns:
+            List[Dict]: Events taken from the queue.
+        """
+        batch: List[Dict] = []
+        try:
+            if timeout is None:
+                batch.append(cls.events.get_nowait())
+            else:
+                batch.append(cls.events.get(timeout=timeout))
+            while len(batch) < LOGIN_ANALYTICS_BATCH_SIZE:
+                batch.append(cls.events.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    @classmethod
+    def run_worker(cls):
+        """
+        Worker loop: waits for events and writes them batch by batch.
+        """
+        while True:
+            batch: List[Dict] = cls.drain(timeout=LOGIN_ANALYTICS_FLUSH_INTERVAL)
+            if not batch:
+                continue
+            try:
+                cls.write_batch_with_retry(events=batch)
+            finally:
+                close_old_connections()
+
+    @classmethod
+    def write_batch_with_retry(cls, events: List[Dict]):
+        """
+        Writes a batch, retrying with a growing delay on transient database errors.
+        If every attempt fails the events are re-queued (see `requeue`).
+        """
+        for attempt in range(1, LOGIN_ANALYTICS_MAX_ATTEMPTS + 1):
+            try:
+                return cls.write_events(events=events)
+            except Exception as e:
+                logger.error(
+                    "Failed to write %s login analytics events (attempt %s/%s): %s",
+                    len(events),
+                    attempt,
+                    LOGIN_ANALYTICS_MAX_ATTEMPTS,
+                    str(e),
+                )
+                if attempt < LOGIN_ANALYTICS_MAX_ATTEMPTS:
+                    time.sleep(0.5 * attempt)
+        cls.requeue(events=events)
+
+    @classmethod
+    def requeue(cls, events: List[Dict]):
+        """
+        Puts the events of a failed batch back on the queue for a later flush.
+
+        Events that already failed LOGIN_ANALYTICS_MAX_REQUEUES batches, or that
+        do not fit in the queue, are dropped and logged with their content so
+        they can be replayed by hand.
+        """
+        dropped_events: List[Dict] = []
+        for event in events:
+            event["requeue_count"] = event.get("requeue_count", 0) + 1
+            if event["requeue_count"] > LOGIN_ANALYTICS_MAX_REQUEUES:
+                dropped_events.append(event)
+                continue
+            try:
+                cls.events.put_nowait(event)
+            except queue.Full:
+                dropped_events.append(event)
+
+        if dropped_events:
+            logger.error(
+                "Dropped %s login analytics events: %s",
+                len(dropped_events),
+                dropped_events,
+            )
+        if len(dropped_events) < len(events):
+            logger.warning(
+                "Re-queued %s login analytics events",
+                len(events) - len(dropped_events),
+            )
+
+    @classmethod
+    def flush(cls):
+        """
+        Writes every event currently queued. Used on shutdown and by commands.
+        """
+        batch: List[Dict] = cls.drain()
+        while batch:
+            cls.write_events(events=batch)
+            batch: List[Dict] = cls.drain()
+
+    @classmethod
+    def write_events(cls, events: List[Dict]):
+        """
+        Increments the login counters and inserts the analytics rows for a batch.
+
+        Args:
+            events (List[Dict]): Events in login order.
+        """
+        user_ids: List = list({event["user_id"] for event in events})
+        # ? Resolved before the row locks are taken; new devices are inserted once per batch
+        device_ids: Dict = DeviceDimensionResolver.resolve_many(
+            user_agent_strings={event["user_agent"] for event in events}
+        )
+
+        with transaction.atomic():
+            # ? Lock the counters so concurrent flushes never hand out the same number
+            users: Dict = (
+                get_user_model()
+                .objects.select_for_update()
+                .in_bulk(user_ids, field_name="pk")
+            )
+
+            analytics_instances: List[LoginAnalyticsModel] = []
+            for event in events:
+                user_instance: AbstractBaseUser = users.get(event["user_id"])
+                if user_instance is None:
+                    continue
+                user_instance.login_count += 1
+                analytics_instances.append(
+                    LoginAnalyticsModel(
+                        user_id=event["user_id"],
+                        ip_address=event["ip_address"],
+                        device_id=device_ids.get(event["user_agent"]),
+                        device_name=DeviceDimensionResolver.get_label(
+                            user_agent=event["user_agent"]
+                        ),
+                        token=event["token"],
+                        login_count=user_instance.login_count,
+                    )
+                )
+
+            get_user_model().objects.bulk_update(users.values(), ["login_count"])
+            LoginAnalyticsModel.objects.bulk_create(analytics_instances)
+
+        logger.info(
+            "Recorded %s logins for %s users", len(analytics_instances), len(users)
+        )
+
+
+atexit.register(LoginAnalyticsPipeline.flush)
@@ -0,0 +1,142 @@
+import logging
+from typing import Dict, List
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils.timezone import now as django_now
+
+from core.settings import logger
+from userauth.models import BlackListTokenModel
+
+logger = logging.LoggerAdapter(logger, {"app_name": "SessionRegistry"})
+
+# ? Seconds a user's session list stays in the cache before it is reloaded from the DB;
+# ? kept short because the default cache is per process and other workers' copies go stale
+SESSION_REGISTRY_TTL: int = getattr(settings, "SESSION_REGISTRY_TTL", 30)
+
+SESSION_REGISTRY_CACHE_KEY: str = "user-sessions:{username}"
+
+
+class SessionRegistry:
+    """
+    Cache-backed registry of each user's active login sessions.
+
+    Sessions are stored per user (keyed by the JWT `username` claim) as a
+    mapping of token digest to session details. A cold entry is loaded from
+    `BlackListTokenModel` and then served from Django's cache for
+    SESSION_REGISTRY_TTL seconds; login, re-login and revocation call `sync()`
+    after their transaction commits.
+
+    `sync()` only refreshes the cache of the process it runs in unless a shared
+    cache backend is configured, so the registry is never trusted for a
+    negative answer: a token or session missing from it is confirmed with an
+    indexed query on the table. Sessions whose token has expired are ignored
+    on read, like the rows `purge_expired_tokens` deletes.
+    """
+
+    @classmethod
+    def get_cache_key(cls, username: str) -> str:
+        return SESSION_REGISTRY_CACHE_KEY.format(username=username)
+
+    @classmethod
+    def load_from_db(cls, username: str) -> Dict[str, Dict]:
+        """
+        Reads the user's active sessions from the blacklist token table.
+
+        Returns:
+            Dict[str, Dict]: Session details keyed by token digest.
+        """
+        blacklist_tokens: List[Dict] = BlackListTokenModel.objects.filter(
+            **{f"user__{get_user_model().USERNAME_FIELD}": username}, is_login=True
+        ).values("id", "token_hash", "core_generic_created_at", "expires_at")
+        return {
+            blacklist_token["token_hash"]: {
+                "session_id": str(blacklist_token["id"]),
+                "created_at": blacklist_token["core_generic_created_at"],
+                "expires_at": blacklist_token["expires_at"],
+            }
+            for blacklist_token in blacklist_tokens
+            if blacklist_token["token_hash"]
+        }
+
+    @classmethod
+    def sync(cls, username: str) -> Dict[str, Dict]:
+        """
+        Reloads the user's sessions from the DB into the cache.
+        """
+        sessions: Dict[str, Dict] = cls.load_from_db(username=username)
+        cache.set(cls.get_cache_key(username=username), sessions, SESSION_REGISTRY_TTL)
+        return sessions
+
+    @classmethod
+    def get_cached_sessions(cls, username: str) -> Dict[str, Dict]:
+        """
+        Returns every registered session of the user, expired ones included,
+        loading them on a cache miss.
+        """
+        sessions: Dict[str, Dict] = cache.get(cls.get_cache_key(username=username))
+        if sessions is None:
+            sessions: Dict[str, Dict] = cls.sync(username=username)
+        return sessions
+
+    @classmethod
+    def get_sessions(cls, username: str) -> Dict[str, Dict]:
+        """
+        Returns the user's unexpired sessions keyed by token digest.
+        """
+        current_time = django_now()
+        return {
+            token_hash: session
+            for token_hash, session in cls.get_cached_sessions(
+                username=username
+            ).items()
+            if session["expires_at"] is None or session["expires_at"] > current_time
+        }
+
+    @classmethod
+    def get_active_sessions(cls, username: str) -> List[Dict]:
+        """
+        Returns the user's unexpired sessions, newest first.
+        """
+        return sorted(
+            cls.get_sessions(username=username).values(),
+            key=lambda session: session["created_at"] or django_now(),
+            reverse=True,
+        )
+
+    @classmethod
+    def has_active_session(cls, username: str) -> bool:
+        """
+        Checks whether the user has an unexpired row marked as logged in.
+        """
+        if cls.get_sessions(username=username):
+            return True
+        # ? Another worker may have logged the user in since this copy was loaded
+        has_session: bool = (
+            BlackListTokenModel.objects.filter(
+                **{f"user__{get_user_model().USERNAME_FIELD}": username},
+                is_login=True,
+            )
+            .filter(Q(expires_at__isnull=True) | Q(expires_at__gt=django_now()))
+            .exists()
+        )
+        if has_session:
+            cls.sync(username=username)
+        return has_session
+
+    @classmethod
+    def is_token_active(cls, username: str, token_hash: str) -> bool:
+        """
+        Checks whether the token belongs to an active session.
+        """
+        if token_hash in cls.get_sessions(username=username):
+            return True
+        # ? Not in this copy: confirm with the indexed digest lookup
+        is_active: bool = BlackListTokenModel.objects.filter(
+            token_hash=token_hash, is_login=True
+        ).exists()
+        if is_active:
+            cls.sync(username=username)
+        return is_active
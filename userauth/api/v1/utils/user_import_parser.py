@@ -0,0 +1,83 @@
+import csv
+import io
+import json
+from typing import Dict, List
+
+# ? Columns read from an import file, anything else is ignored
+USER_IMPORT_COLUMNS: List[str] = [
+    "email",
+    "username",
+    "password",
+    "is_client",
+    "is_instructor",
+]
+
+
+class UserImportFileParser:
+    """
+    Reads user rows from a CSV or JSON import file.
+
+    CSV files need a header row; JSON files hold a list of objects or an
+    object with the list under `rows`. Empty cells are dropped so optional
+    fields fall back to their serializer defaults.
+    """
+
+    supported_formats: List[str] = ["csv", "json"]
+
+    @classmethod
+    def get_format(cls, file_name: str) -> str:
+        """
+        Returns the file format from its extension.
+        """
+        file_format: str = file_name.rsplit(".", 1)[-1].lower()
+        if file_format not in cls.supported_formats:
+            raise ValueError(
+                f"Unsupported file format '{file_format}', expected one of "
+                f"{', '.join(cls.supported_formats)}"
+            )
+        return file_format
+
+    @classmethod
+    def clean_row(cls, row: Dict) -> Dict:
+        return {
+            column: row[column]
+            for column in USER_IMPORT_COLUMNS
+            if row.get(column) not in (None, "")
+        }
+
+    @classmethod
+    def parse_csv(cls, content: str) -> List[Dict]:
+        return [cls.clean_row(row) for row in csv.DictReader(io.StringIO(content))]
+
+    @classmethod
+    def parse_json(cls, content: str) -> List[Dict]:
+        rows: List[Dict] | Dict = json.loads(content)
+        if isinstance(rows, dict):
+            rows: List[Dict] = rows.get("rows", [])
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError("JSON import must be a list of objects")
+        return [cls.clean_row(row) for row in rows]
+
+    @classmethod
+    def parse(cls, content: bytes | str, file_name: str) -> List[Dict]:
+        """
+        Parses the file content into row dicts.
+
+        Args:
+            content (bytes | str): Raw file content.
+            file_name (str): Name of the file, used to pick the format.
+
+        Returns:
+            List[Dict]: Rows ready for `UserBulkImportHandler`.
+
+        Raises:
+            ValueError: If the format is unsupported or the content is malformed.
+        """
+        if isinstance(content, bytes):
+            content: str = content.decode("utf-8-sig")
+        if cls.get_format(file_name=file_name) == "csv":
+            return cls.parse_csv(content=content)
+        try:
+            return cls.parse_json(content=content)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"Invalid JSON import file: {error}")
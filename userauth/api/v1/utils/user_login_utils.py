@@ -3,15 +3,19 @@ from typing import Callable, Dict, Union
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractBaseUser
-from django.db.models.query import QuerySet
 from rest_framework_jwt.settings import api_settings
 
 from userauth.api.v1.utils.constants import (
     ACCOUNT_INACTIVE_ERROR_MESSAGE,
     BLACKLIST_TOKEN_ALREADY_EXISTS_ERROR_MESSAGE,
     INCORRECT_CREDENTIALS_ERROR_MESSAGE,
+    PASSWORD_HASHING_BUSY_ERROR_MESSAGE,
 )
-from userauth.models import BlackListTokenModel
+from coreutils.utils.password_hashing import (
+    PasswordHashingBusyError,
+    PasswordHashingExecutor,
+)
+from userauth.api.v1.utils.session_registry import SessionRegistry
 
 # ? REST Framework JWT settings handlers
 jwt_payload_handler: Dict = api_settings.JWT_PAYLOAD_HANDLER
@@ -74,10 +78,10 @@ class ValidateUserLogin:
         """
         # ? Only check for a blacklist token if multi-login is disabled
         if self.DISABLE_MULTI_LOGIN:
-            black_list_queryset: QuerySet[BlackListTokenModel] = (
-                BlackListTokenModel.objects.filter(user__email=self.email)
+            # ? Answered from the session registry, the DB is read only on a cold cache
+            return SessionRegistry.has_active_session(
+                username=self.user_instance.get_username()
             )
-            return black_list_queryset.filter(is_login=True).exists()
         return False
 
     def validate_login(self) -> Union[str, None]:
@@ -87,20 +91,26 @@ class ValidateUserLogin:
         Returns:
             str: An error message if validation fails, otherwise None.
         """
-        user_queryset: QuerySet[AbstractBaseUser] = get_user_model().objects.all()
-
-        # ? Check if a user with the provided email exists
-        if not user_queryset.filter(email=self.email).exists():
+        # ? Fetch the user in a single query
+        try:
+            user_instance: AbstractBaseUser = get_user_model().objects.get(
+                email=self.email
+            )
+        except get_user_model().DoesNotExist:
             return INCORRECT_CREDENTIALS_ERROR_MESSAGE
 
-        user_instance: AbstractBaseUser = user_queryset.get(email=self.email)
-
         # ? Ensure the user account is active
         if not user_instance.is_active:
             return ACCOUNT_INACTIVE_ERROR_MESSAGE
 
-        # ? Validate the provided password
-        if not user_instance.check_password(raw_password=self.password):
+        # ? Validate the provided password on a bounded hashing slot
+        try:
+            is_password_valid: bool = PasswordHashingExecutor.check_password(
+                user_instance=user_instance, raw_password=self.password
+            )
+        except PasswordHashingBusyError:
+            return PASSWORD_HASHING_BUSY_ERROR_MESSAGE
+        if not is_password_valid:
             return INCORRECT_CREDENTIALS_ERROR_MESSAGE
 
         self.user_instance: AbstractBaseUser = user_instance
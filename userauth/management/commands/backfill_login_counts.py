@@ -0,0 +1,47 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.query import QuerySet
+
+from coreutils.utils.db_utils.chunked_delete import iter_keyset_ids
+from userauth.models import LoginAnalyticsModel
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Seeds the users' LOGIN_COUNT from the number of login analytics rows "
+        "recorded for them before the counter existed."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Users updated per UPDATE statement.",
+        )
+
+    def handle(self, *args, **options):
+        user_model = get_user_model()
+        # ? Counted in the UPDATE itself; a login flushed concurrently inserts its
+        # ? row and increments the counter in one transaction, so both stay consistent
+        login_count: Coalesce = Coalesce(
+            Subquery(
+                LoginAnalyticsModel.objects.filter(user_id=OuterRef("pk"))
+                .order_by()
+                .values("user_id")
+                .annotate(total=Count("pk"))
+                .values("total"),
+                output_field=IntegerField(),
+            ),
+            0,
+        )
+        queryset: QuerySet = user_model.objects.all()
+        updated: int = 0
+        for ids in iter_keyset_ids(queryset=queryset, batch_size=options["batch_size"]):
+            updated += user_model.objects.filter(pk__in=ids).update(
+                login_count=login_count
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"Backfilled {updated} login counts"))
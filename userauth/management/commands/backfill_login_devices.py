@@ -0,0 +1,47 @@
+from typing import Any, Dict, List
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models.query import QuerySet
+
+from coreutils.utils.db_utils.chunked_delete import iter_keyset_ids
+from userauth.api.v1.utils.device_dimension import DeviceDimensionResolver
+from userauth.models import LoginAnalyticsModel
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Links login analytics rows recorded before the device dimension existed "
+        "to their device, and replaces the raw user-agent with its short label."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows updated per bulk_update statement.",
+        )
+
+    def handle(self, *args, **options):
+        queryset: QuerySet[LoginAnalyticsModel] = LoginAnalyticsModel.objects.filter(
+            device__isnull=True
+        )
+        updated: int = 0
+        for ids in iter_keyset_ids(queryset=queryset, batch_size=options["batch_size"]):
+            instances: List[LoginAnalyticsModel] = list(
+                LoginAnalyticsModel.objects.filter(pk__in=ids).only("id", "device_name")
+            )
+            # ? Rows from before the dimension hold the raw user-agent in DEVICE_NAME
+            device_ids: Dict[str, Any] = DeviceDimensionResolver.resolve_many(
+                user_agent_strings={instance.device_name for instance in instances}
+            )
+            for instance in instances:
+                instance.device_id = device_ids.get(instance.device_name or "")
+                instance.device_name = DeviceDimensionResolver.get_label(
+                    user_agent=instance.device_name
+                )
+            updated += LoginAnalyticsModel.objects.bulk_update(
+                instances, ["device", "device_name"]
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"Linked {updated} login analytics rows"))
@@ -0,0 +1,42 @@
+from typing import List
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models.query import QuerySet
+
+from coreutils.utils.jwt_token_utils import JwtTokenUtils
+from userauth.models import BlackListTokenModel
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Fills JWT_TOKEN_HASH for blacklist token rows created before the column existed."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows updated per bulk_update statement.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size: int = options["batch_size"]
+        queryset: QuerySet[BlackListTokenModel] = BlackListTokenModel.objects.filter(
+            token_hash__isnull=True
+        ).only("id", "token")
+
+        batch: List[BlackListTokenModel] = []
+        updated: int = 0
+        for instance in queryset.iterator(chunk_size=batch_size):
+            instance.token_hash = JwtTokenUtils.hash_token(instance.token)
+            batch.append(instance)
+            if len(batch) >= batch_size:
+                updated += BlackListTokenModel.objects.bulk_update(
+                    batch, ["token_hash"]
+                )
+                batch: List[BlackListTokenModel] = []
+        if batch:
+            updated += BlackListTokenModel.objects.bulk_update(batch, ["token_hash"])
+
+        self.stdout.write(self.style.SUCCESS(f"Backfilled {updated} token hashes"))
@@ -0,0 +1,87 @@
+import statistics
+import time
+from typing import List
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AbstractBaseUser
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework_jwt.authentication import JSONWebTokenAuthentication
+
+from coreutils.utils.jwt_token_utils import JwtTokenUtils
+from userauth.api.v1.utils.custom_authentication.custom_authentication import (
+    CustomAuthentication,
+)
+from userauth.models import BlackListTokenModel
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Measures the per-request overhead of CustomAuthentication. "
+        "Runs inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument("--iterations", type=int, default=2000)
+        parser.add_argument(
+            "--email",
+            help="User to authenticate as. Defaults to the first active user.",
+        )
+
+    def get_user(self, email: str) -> AbstractBaseUser:
+        user_queryset = get_user_model().objects.filter(is_active=True)
+        if email:
+            user_queryset = user_queryset.filter(email=email)
+        user_instance: AbstractBaseUser = user_queryset.first()
+        if user_instance is None:
+            raise CommandError("No active user found to authenticate as.")
+        return user_instance
+
+    def authenticate_once(self, factory: APIRequestFactory, token: str):
+        request: Request = Request(
+            factory.get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        )
+        CustomAuthentication().authenticate(request)
+
+    def handle(self, *args, **options):
+        iterations: int = options["iterations"]
+        factory: APIRequestFactory = APIRequestFactory()
+
+        with transaction.atomic():
+            user_instance: AbstractBaseUser = self.get_user(email=options["email"])
+            token: str = JSONWebTokenAuthentication.jwt_encode_payload(
+                JSONWebTokenAuthentication.jwt_create_payload(user_instance)
+            )
+            BlackListTokenModel.objects.create(
+                user=user_instance,
+                is_login=True,
+                token=token,
+                token_hash=JwtTokenUtils.hash_token(token),
+            )
+
+            # ? First call warms the revocation cache
+            with CaptureQueriesContext(connection) as cold_queries:
+                self.authenticate_once(factory=factory, token=token)
+            with CaptureQueriesContext(connection) as warm_queries:
+                self.authenticate_once(factory=factory, token=token)
+
+            durations: List[float] = []
+            for _ in range(iterations):
+                started_at: float = time.perf_counter()
+                self.authenticate_once(factory=factory, token=token)
+                durations.append((time.perf_counter() - started_at) * 1_000_000)
+
+            transaction.set_rollback(True)
+
+        durations.sort()
+        self.stdout.write(f"iterations:        {iterations}")
+        self.stdout.write(f"queries (cold):    {len(cold_queries.captured_queries)}")
+        self.stdout.write(f"queries (warm):    {len(warm_queries.captured_queries)}")
+        self.stdout.write(f"mean:              {statistics.fmean(durations):.1f} us")
+        self.stdout.write(f"p50:               {durations[len(durations) // 2]:.1f} us")
+        self.stdout.write(
+            f"p95:               {durations[int(len(durations) * 0.95)]:.1f} us"
+        )
@@ -0,0 +1,87 @@
+import time
+from typing import Callable
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AbstractBaseUser
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection, transaction
+from django.http import HttpResponse
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+from rest_framework_jwt.views import ObtainJSONWebTokenView
+
+from userauth.api.v1.authentication.serializers import UserLoginWebTokenSerializer
+
+BENCHMARK_LOGIN_PASSWORD: str = "benchmark-login-password"
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Measures logins/sec through the login endpoint, with and without the "
+        "password hash check. Runs inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument(
+            "--email", help="User to log in as. Defaults to the first active user."
+        )
+
+    def get_user(self, email: str) -> AbstractBaseUser:
+        user_queryset = get_user_model().objects.filter(is_active=True)
+        if email:
+            user_queryset = user_queryset.filter(email=email)
+        user_instance: AbstractBaseUser = user_queryset.first()
+        if user_instance is None:
+            raise CommandError("No active user found to log in as.")
+        return user_instance
+
+    def login_once(self, view: Callable, email: str) -> HttpResponse:
+        request = APIRequestFactory().post(
+            "/",
+            {"email": email, "password": BENCHMARK_LOGIN_PASSWORD, "re_login": True},
+            format="json",
+            HTTP_USER_AGENT="benchmark_login",
+        )
+        response: HttpResponse = view(request)
+        if response.status_code >= 400:
+            raise CommandError(f"Login failed: {response.data}")
+        return response
+
+    def handle(self, *args, **options):
+        iterations: int = options["iterations"]
+        view: Callable = ObtainJSONWebTokenView.as_view(
+            serializer_class=UserLoginWebTokenSerializer
+        )
+
+        with transaction.atomic():
+            user_instance: AbstractBaseUser = self.get_user(email=options["email"])
+            user_instance.set_password(BENCHMARK_LOGIN_PASSWORD)
+            user_instance.save(update_fields=["password"])
+            email: str = user_instance.email
+
+            with CaptureQueriesContext(connection) as login_queries:
+                self.login_once(view=view, email=email)
+
+            started_at: float = time.perf_counter()
+            for _ in range(iterations):
+                self.login_once(view=view, email=email)
+            login_duration: float = time.perf_counter() - started_at
+
+            started_at: float = time.perf_counter()
+            for _ in range(iterations):
+                user_instance.check_password(BENCHMARK_LOGIN_PASSWORD)
+            hash_duration: float = time.perf_counter() - started_at
+
+            transaction.set_rollback(True)
+
+        overhead: float = max(login_duration - hash_duration, 1e-9)
+        self.stdout.write(f"iterations:               {iterations}")
+        self.stdout.write(
+            f"queries per login:        {len(login_queries.captured_queries)}"
+        )
+        self.stdout.write(
+            f"logins/sec:               {iterations / login_duration:.1f}"
+        )
+        self.stdout.write(f"password checks/sec:      {iterations / hash_duration:.1f}")
+        self.stdout.write(f"logins/sec excl. hashing: {iterations / overhead:.1f}")
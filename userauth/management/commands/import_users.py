@@ -0,0 +1,87 @@
+import csv
+from typing import Dict, List
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from coreutils.utils.password_hashing import PASSWORD_HASH_POOL_WORKERS
+from userauth.api.v1.utils.handlers.user_bulk_import_handler import (
+    UserBulkImportHandler,
+)
+from userauth.api.v1.utils.user_import_parser import UserImportFileParser
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Creates users from a CSV or JSON file (email, username, password, "
+        "is_client, is_instructor) and reports the import throughput."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument("file", help="Path to a .csv or .json import file.")
+        parser.add_argument(
+            "--allow-partial",
+            action="store_true",
+            help="Create the valid users even if some rows fail.",
+        )
+        parser.add_argument(
+            "--credentials-out",
+            help="CSV file for the passwords generated for rows without one. "
+            "They are printed when omitted.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=PASSWORD_HASH_POOL_WORKERS,
+            help="Processes used to hash the passwords.",
+        )
+
+    def read_rows(self, file_path: str) -> List[Dict]:
+        try:
+            with open(file_path, "rb") as import_file:
+                return UserImportFileParser.parse(
+                    content=import_file.read(), file_name=file_path
+                )
+        except (OSError, ValueError) as error:
+            raise CommandError(str(error))
+
+    def write_credentials(self, file_path: str, generated_passwords: Dict[str, str]):
+        with open(file_path, "w", newline="") as credentials_file:
+            writer = csv.writer(credentials_file)
+            writer.writerow(["email", "password"])
+            writer.writerows(generated_passwords.items())
+
+    def handle(self, *args, **options):
+        rows: List[Dict] = self.read_rows(file_path=options["file"])
+        if not rows:
+            raise CommandError("The import file has no rows.")
+
+        handler: UserBulkImportHandler = UserBulkImportHandler(
+            request=None, queryset=get_user_model().objects.all()
+        )
+        handler.hash_max_workers = options["workers"]
+        handler.set_data(data={"rows": rows, "allow_partial": options["allow_partial"]})
+        handler.validate()
+
+        for index, error in sorted(handler.row_errors.items()):
+            self.stderr.write(
+                f"row {index}: "
+                + ", ".join(f"{field}: {message}" for field, message in error.items())
+            )
+        if handler.data.get("error_message"):
+            raise CommandError(handler.data["error_message"]["description"])
+
+        handler.create()
+        if handler.generated_passwords:
+            if options["credentials_out"]:
+                self.write_credentials(
+                    file_path=options["credentials_out"],
+                    generated_passwords=handler.generated_passwords,
+                )
+            else:
+                self.stdout.write("generated passwords:")
+                for email, password in handler.generated_passwords.items():
+                    self.stdout.write(f"  {email},{password}")
+
+        for key, report_value in handler.data["import_report"].items():
+            self.stdout.write(f"{key + ':':<18} {report_value}")
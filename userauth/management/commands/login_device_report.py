@@ -0,0 +1,60 @@
+from datetime import timedelta
+from typing import Dict, List
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import Count
+from django.db.models.query import QuerySet
+from django.utils.timezone import now as django_now
+
+from userauth.models import LoginAnalyticsModel
+
+# ? Device dimension fields a report can be grouped by
+DEVICE_REPORT_FIELDS: List[str] = [
+    "browser_family",
+    "os_family",
+    "device_family",
+    "device_type",
+]
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Counts logins and distinct users per browser, OS or device, "
+        "grouped through the device dimension."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--by", choices=DEVICE_REPORT_FIELDS, default="browser_family"
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="Only count logins from the last N days.",
+        )
+        parser.add_argument("--limit", type=int, default=20)
+
+    def handle(self, *args, **options):
+        group_field: str = f"device__{options['by']}"
+        queryset: QuerySet[LoginAnalyticsModel] = LoginAnalyticsModel.objects.all()
+        if options["days"]:
+            queryset = queryset.filter(
+                core_generic_created_at__gte=django_now()
+                - timedelta(days=options["days"])
+            )
+
+        rows: List[Dict] = list(
+            queryset.values(group_field)
+            .annotate(
+                logins=Count("id"),
+                users=Count("user", distinct=True),
+            )
+            .order_by("-logins")[: options["limit"]]
+        )
+
+        self.stdout.write(f"{options['by']:<30} {'logins':>10} {'users':>10}")
+        for row in rows:
+            self.stdout.write(
+                f"{str(row[group_field] or 'unknown'):<30} "
+                f"{row['logins']:>10} {row['users']:>10}"
+            )
@@ -0,0 +1,154 @@
+import time
+from typing import Dict, List, Set
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import F, Q
+from django.db.models.functions import Length
+from django.db.models.query import QuerySet
+from django.utils.timezone import now as django_now
+
+from coreutils.utils.db_utils.chunked_delete import (
+    ChunkedDeleteEngine,
+    iter_keyset_ids,
+)
+from coreutils.utils.jwt_token_utils import JwtTokenUtils
+from userauth.api.v1.utils.custom_authentication.revocation_cache import (
+    TokenRevocationCache,
+)
+from userauth.models import BlackListTokenModel, LoginAnalyticsModel
+
+# ? Length of a SHA-256 hex digest; longer token values still hold the full JWT
+TOKEN_DIGEST_LENGTH: int = 64
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Deletes blacklist token rows whose JWT has expired and replaces token "
+        "text that is no longer needed with its digest."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.1,
+            help="Seconds to pause between batches.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, purging every --interval seconds.",
+        )
+        parser.add_argument("--interval", type=float, default=3600)
+
+    def pause(self, pause_seconds: float):
+        if pause_seconds:
+            time.sleep(pause_seconds)
+
+    def fill_missing_expiry(self, batch_size: int, pause_seconds: float) -> int:
+        """
+        Sets EXPIRES_AT on rows created before the column existed.
+        """
+        queryset: QuerySet[BlackListTokenModel] = BlackListTokenModel.objects.filter(
+            expires_at__isnull=True
+        )
+        updated: int = 0
+        for ids in iter_keyset_ids(queryset=queryset, batch_size=batch_size):
+            instances: List[BlackListTokenModel] = list(
+                BlackListTokenModel.objects.filter(pk__in=ids).only("id", "token")
+            )
+            for instance in instances:
+                instance.expires_at = JwtTokenUtils(
+                    jwt_token=instance.token
+                ).get_expires_at()
+            updated += BlackListTokenModel.objects.bulk_update(
+                instances, ["expires_at"]
+            )
+            self.pause(pause_seconds)
+        return updated
+
+    def delete_expired(self, batch_size: int, pause_seconds: float) -> Dict:
+        """
+        Deletes rows of expired tokens, then refreshes the session registry
+        of their users. A token past its `exp` can no longer authenticate, so
+        its row is an inactive session even if IS_LOGIN is still set.
+        """
+        queryset: QuerySet[BlackListTokenModel] = BlackListTokenModel.objects.filter(
+            expires_at__lt=django_now()
+        )
+        usernames: Set[str] = set(
+            queryset.values_list(
+                f"user__{get_user_model().USERNAME_FIELD}", flat=True
+            ).distinct()
+        )
+        delete_engine: ChunkedDeleteEngine = ChunkedDeleteEngine(
+            queryset=queryset, batch_size=batch_size
+        )
+        delete_report: Dict = delete_engine.delete_matching(pause_seconds=pause_seconds)
+        for username in usernames:
+            TokenRevocationCache.sessions_changed(username=username)
+        return delete_report
+
+    def compact_inactive_tokens(self, batch_size: int, pause_seconds: float) -> int:
+        """
+        Replaces the JWT of logged-out rows with its digest.
+        """
+        queryset: QuerySet[BlackListTokenModel] = BlackListTokenModel.objects.filter(
+            is_login=False, token_hash__isnull=False
+        ).exclude(token=F("token_hash"))
+        compacted: int = 0
+        for ids in iter_keyset_ids(queryset=queryset, batch_size=batch_size):
+            compacted += BlackListTokenModel.objects.filter(pk__in=ids).update(
+                token=F("token_hash")
+            )
+            self.pause(pause_seconds)
+        return compacted
+
+    def compact_analytics_tokens(self, batch_size: int, pause_seconds: float) -> int:
+        """
+        Replaces full JWTs kept in login analytics with their digest.
+        """
+        queryset: QuerySet[LoginAnalyticsModel] = LoginAnalyticsModel.objects.alias(
+            token_length=Length("token")
+        ).filter(Q(token_length__gt=TOKEN_DIGEST_LENGTH))
+        compacted: int = 0
+        for ids in iter_keyset_ids(queryset=queryset, batch_size=batch_size):
+            instances: List[LoginAnalyticsModel] = list(
+                LoginAnalyticsModel.objects.filter(pk__in=ids).only("id", "token")
+            )
+            for instance in instances:
+                instance.token = JwtTokenUtils.hash_token(instance.token)
+            compacted += LoginAnalyticsModel.objects.bulk_update(instances, ["token"])
+            self.pause(pause_seconds)
+        return compacted
+
+    def purge(self, batch_size: int, pause_seconds: float):
+        filled: int = self.fill_missing_expiry(
+            batch_size=batch_size, pause_seconds=pause_seconds
+        )
+        delete_report: Dict = self.delete_expired(
+            batch_size=batch_size, pause_seconds=pause_seconds
+        )
+        compacted_tokens: int = self.compact_inactive_tokens(
+            batch_size=batch_size, pause_seconds=pause_seconds
+        )
+        compacted_analytics: int = self.compact_analytics_tokens(
+            batch_size=batch_size, pause_seconds=pause_seconds
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Expiry filled: {filled}, expired tokens deleted: "
+                f"{delete_report['total_deleted']} in {len(delete_report['batches'])} "
+                f"batches, tokens compacted: {compacted_tokens}, "
+                f"analytics compacted: {compacted_analytics}"
+            )
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            self.purge(batch_size=options["batch_size"], pause_seconds=options["sleep"])
+            if not options["loop"]:
+                return
+            time.sleep(options["interval"])
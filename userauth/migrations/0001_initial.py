@@ -0,0 +1,377 @@
+# Generated by Django 5.2.3 on 2026-10-19 00:31
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DeviceDimensionModel",
+            fields=[
+                (
+                    "core_generic_created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        db_column="CORE_GENERIC_CREATED_AT",
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        db_column="CORE_GENERIC_LAST_UPDATED_AT",
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_created_by",
+                    models.CharField(
+                        blank=True,
+                        db_column="CORE_GENERIC_CREATED_BY",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_updated_by",
+                    models.CharField(
+                        blank=True,
+                        db_column="CORE_GENERIC_UPDATED_BY",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "id",
+                    models.UUIDField(
+                        db_column="DEVICE_ID",
+                        default=uuid.uuid1,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "user_agent_hash",
+                    models.CharField(
+                        db_column="USER_AGENT_HASH", max_length=64, unique=True
+                    ),
+                ),
+                ("user_agent", models.TextField(db_column="USER_AGENT")),
+                (
+                    "browser_family",
+                    models.CharField(db_column="BROWSER_FAMILY", max_length=100),
+                ),
+                (
+                    "browser_version",
+                    models.CharField(
+                        blank=True,
+                        db_column="BROWSER_VERSION",
+                        default="",
+                        max_length=50,
+                    ),
+                ),
+                ("os_family", models.CharField(db_column="OS_FAMILY", max_length=100)),
+                (
+                    "os_version",
+                    models.CharField(
+                        blank=True, db_column="OS_VERSION", default="", max_length=50
+                    ),
+                ),
+                (
+                    "device_family",
+                    models.CharField(db_column="DEVICE_FAMILY", max_length=100),
+                ),
+                (
+                    "device_type",
+                    models.CharField(db_column="DEVICE_TYPE", max_length=20),
+                ),
+            ],
+            options={
+                "db_table": "DEVICE_DIMENSION_TABLE",
+            },
+        ),
+        migrations.CreateModel(
+            name="UserModel",
+            fields=[
+                ("password", models.CharField(max_length=128, verbose_name="password")),
+                (
+                    "id",
+                    models.UUIDField(
+                        db_column="ID",
+                        default=uuid.uuid1,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "username",
+                    models.CharField(
+                        blank=True, db_column="USERNAME", max_length=100, null=True
+                    ),
+                ),
+                (
+                    "email",
+                    models.EmailField(db_column="EMAIL", max_length=100, unique=True),
+                ),
+                ("is_staff", models.BooleanField(db_column="IS_STAFF", default=False)),
+                (
+                    "is_active",
+                    models.BooleanField(db_column="IS_ACTIVE", default=False),
+                ),
+                (
+                    "is_superuser",
+                    models.BooleanField(db_column="IS_SUPERUSER", default=False),
+                ),
+                (
+                    "is_verified",
+                    models.BooleanField(db_column="IS_VERIFIED", default=False),
+                ),
+                (
+                    "is_approved",
+                    models.BooleanField(db_column="IS_APPROVED", default=False),
+                ),
+                (
+                    "is_client",
+                    models.BooleanField(db_column="IS_CLIENT", default=False),
+                ),
+                (
+                    "is_instructor",
+                    models.BooleanField(db_column="IS_INSTRUCTOR", default=False),
+                ),
+                (
+                    "custom_password",
+                    models.TextField(
+                        blank=True, db_column="CUSTOM_PASSWORD", null=True
+                    ),
+                ),
+                (
+                    "last_login",
+                    models.DateTimeField(blank=True, db_column="LAST_LOGIN", null=True),
+                ),
+                (
+                    "login_count",
+                    models.IntegerField(db_column="LOGIN_COUNT", default=0),
+                ),
+                (
+                    "created_date",
+                    models.DateTimeField(auto_now_add=True, db_column="CREATED_DATE"),
+                ),
+                (
+                    "updated_date",
+                    models.DateTimeField(auto_now=True, db_column="UPDATED_DATE"),
+                ),
+                (
+                    "groups",
+                    models.ManyToManyField(
+                        blank=True,
+                        help_text="The groups this user belongs to. A user will get all permissions granted to each of their groups.",
+                        related_name="user_set",
+                        related_query_name="user",
+                        to="auth.group",
+                        verbose_name="groups",
+                    ),
+                ),
+                (
+                    "user_permissions",
+                    models.ManyToManyField(
+                        blank=True,
+                        help_text="Specific permissions for this user.",
+                        related_name="user_set",
+                        related_query_name="user",
+                        to="auth.permission",
+                        verbose_name="user permissions",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "USER_TABLE",
+            },
+        ),
+        migrations.CreateModel(
+            name="BlackListTokenModel",
+            fields=[
+                (
+                    "core_generic_created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        db_column="CORE_GENERIC_CREATED_AT",
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        db_column="CORE_GENERIC_LAST_UPDATED_AT",
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_created_by",
+                    models.CharField(
+                        blank=True,
+                        db_column="CORE_GENERIC_CREATED_BY",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_updated_by",
+                    models.CharField(
+                        blank=True,
+                        db_column="CORE_GENERIC_UPDATED_BY",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "id",
+                    models.UUIDField(
+                        db_column="BLACKLIST_TOKEN_ID",
+                        default=uuid.uuid1,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                ("token", models.TextField(db_column="JWT_TOKEN")),
+                (
+                    "token_hash",
+                    models.CharField(
+                        blank=True,
+                        db_column="JWT_TOKEN_HASH",
+                        db_index=True,
+                        max_length=64,
+                        null=True,
+                    ),
+                ),
+                (
+                    "expires_at",
+                    models.DateTimeField(
+                        blank=True, db_column="EXPIRES_AT", db_index=True, null=True
+                    ),
+                ),
+                ("is_login", models.BooleanField(db_column="IS_LOGIN", default=False)),
+                (
+                    "is_delete",
+                    models.BooleanField(db_column="IS_DELETE", default=False),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        db_column="USER_ID",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="BlackListTokenModel_user",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "USER_BLACK_LIST_TOKEN_TABLE",
+            },
+        ),
+        migrations.CreateModel(
+            name="LoginAnalyticsModel",
+            fields=[
+                (
+                    "core_generic_created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        db_column="CORE_GENERIC_CREATED_AT",
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        db_column="CORE_GENERIC_LAST_UPDATED_AT",
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_created_by",
+                    models.CharField(
+                        blank=True,
+                        db_column="CORE_GENERIC_CREATED_BY",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "core_generic_updated_by",
+                    models.CharField(
+                        blank=True,
+                        db_column="CORE_GENERIC_UPDATED_BY",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "id",
+                    models.UUIDField(
+                        db_column="USER_LOGIN_ANALYTICS_ID",
+                        default=uuid.uuid1,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "ip_address",
+                    models.CharField(
+                        blank=True, db_column="IP_ADDRESS", max_length=255, null=True
+                    ),
+                ),
+                (
+                    "login_count",
+                    models.IntegerField(db_column="LOGIN_COUNT", default=0),
+                ),
+                (
+                    "device_name",
+                    models.CharField(db_column="DEVICE_NAME", max_length=255),
+                ),
+                ("token", models.TextField(blank=True, db_column="TOKEN", null=True)),
+                (
+                    "device",
+                    models.ForeignKey(
+                        blank=True,
+                        db_column="DEVICE_ID",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="LoginAnalyticsModel_device",
+                        to="userauth.devicedimensionmodel",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        db_column="USER_ID",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="LoginAnalyticsModel_user",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "USER_LOGIN_ANALYTICS_TABLE",
+            },
+        ),
+    ]
@@ -8,6 +8,7 @@ from django.contrib.auth.models import (
 from django.db import models, transaction
 
 from coreutils.utils.generics.generic_models import CoreGenericModel
+from coreutils.utils.jwt_token_utils import JwtTokenUtils
 
 
 # Create your models here.
@@ -115,6 +116,11 @@ class UserModel(AbstractBaseUser, PermissionsMixin):
         blank=True,
         db_column="LAST_LOGIN",
     )
+    # ? Maintained by LoginAnalyticsPipeline, one increment per recorded login
+    login_count = models.IntegerField(
+        default=0,
+        db_column="LOGIN_COUNT",
+    )
 
     created_date = models.DateTimeField(
         auto_now_add=True,
@@ -148,6 +154,21 @@ class BlackListTokenModel(CoreGenericModel):
         editable=False,
     )
     token = models.TextField(db_column="JWT_TOKEN")
+    # ? SHA-256 of the token, the indexed column used for revocation lookups
+    token_hash = models.CharField(
+        max_length=64,
+        null=True,
+        blank=True,
+        db_index=True,
+        db_column="JWT_TOKEN_HASH",
+    )
+    # ? `exp` claim of the token, used to purge rows of expired tokens
+    expires_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        db_index=True,
+        db_column="EXPIRES_AT",
+    )
     user = models.ForeignKey(
         UserModel,
         on_delete=models.CASCADE,
@@ -166,6 +187,48 @@ class BlackListTokenModel(CoreGenericModel):
     class Meta:
         db_table = "USER_BLACK_LIST_TOKEN_TABLE"
 
+    def save(self, *args, **kwargs):
+        if self.token and not self.token_hash:
+            self.token_hash = JwtTokenUtils.hash_token(self.token)
+        if self.token and not self.expires_at:
+            self.expires_at = JwtTokenUtils(jwt_token=self.token).get_expires_at()
+        return super().save(*args, **kwargs)
+
+
+class DeviceDimensionModel(CoreGenericModel):
+    """
+    One row per distinct user-agent string, holding its parsed browser, OS
+    and device. Login analytics reference it instead of repeating the raw string.
+    """
+
+    id = models.UUIDField(
+        db_column="DEVICE_ID",
+        default=uuid.uuid1,
+        unique=True,
+        primary_key=True,
+        editable=False,
+    )
+    # ? SHA-256 of the raw user-agent string
+    user_agent_hash = models.CharField(
+        max_length=64,
+        unique=True,
+        db_column="USER_AGENT_HASH",
+    )
+    user_agent = models.TextField(db_column="USER_AGENT")
+    browser_family = models.CharField(max_length=100, db_column="BROWSER_FAMILY")
+    browser_version = models.CharField(
+        max_length=50, blank=True, default="", db_column="BROWSER_VERSION"
+    )
+    os_family = models.CharField(max_length=100, db_column="OS_FAMILY")
+    os_version = models.CharField(
+        max_length=50, blank=True, default="", db_column="OS_VERSION"
+    )
+    device_family = models.CharField(max_length=100, db_column="DEVICE_FAMILY")
+    device_type = models.CharField(max_length=20, db_column="DEVICE_TYPE")
+
+    class Meta:
+        db_table = "DEVICE_DIMENSION_TABLE"
+
 
 class LoginAnalyticsModel(CoreGenericModel):
     id = models.UUIDField(
@@ -191,7 +254,16 @@ class LoginAnalyticsModel(CoreGenericModel):
         default=0,
         db_column="LOGIN_COUNT",
     )
+    # ? Short label such as "PC / Windows 10 / Chrome 120.0.0", details live on `device`
     device_name = models.CharField(max_length=255, db_column="DEVICE_NAME")
+    device = models.ForeignKey(
+        DeviceDimensionModel,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="LoginAnalyticsModel_device",
+        db_column="DEVICE_ID",
+    )
     token = models.TextField(
         null=True,
         blank=True,